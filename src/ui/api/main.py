@@ -51,6 +51,41 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down ResumeAI API")
 
+    # Close the browser shared by all Playwright scrapers
+    try:
+        from .scrapers import close_browser_pool
+        await close_browser_pool()
+    except Exception as e:
+        logger.warning(f"Browser pool shutdown failed: {e}")
+
+    # Close the HTTP client shared by the GitHub scrapers
+    try:
+        from .scrapers import close_github_client
+        await close_github_client()
+    except Exception as e:
+        logger.warning(f"GitHub client shutdown failed: {e}")
+
+    # Close the HTTP client shared by RemoteOK, Hacker News and WeWorkRemotely
+    try:
+        from .scrapers import close_http_scraper_client
+        await close_http_scraper_client()
+    except Exception as e:
+        logger.warning(f"HTTP scraper client shutdown failed: {e}")
+
+    # Close the HTTP client shared by the Google dork scraper
+    try:
+        from .scrapers import close_dork_client
+        await close_dork_client()
+    except Exception as e:
+        logger.warning(f"Dork client shutdown failed: {e}")
+
+    # Stop proxy refresh and close the per-proxy HTTP clients
+    try:
+        from .scrapers import close_proxy_pool
+        await close_proxy_pool()
+    except Exception as e:
+        logger.warning(f"Proxy pool shutdown failed: {e}")
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -32,13 +32,24 @@ from .cache import (
     SearchCache,
     get_search_cache,
     get_cached_or_search,
+    iter_cached_or_search,
 )
 
 # Import scrapers to register them
 # HTTP-based scrapers (lightweight, recommended)
-from .github_jobs_scraper import GitHubJobsScraper, SimplifyJobsScraper, JobrightScraper
-from .http_scraper import RemoteOKScraper, HackerNewsJobsScraper, WeWorkRemotelyScraper
-from .google_dorking_scraper import GoogleDorkScraper
+from .github_jobs_scraper import (
+    GitHubJobsScraper,
+    SimplifyJobsScraper,
+    JobrightScraper,
+    close_github_client,
+)
+from .http_scraper import (
+    RemoteOKScraper,
+    HackerNewsJobsScraper,
+    WeWorkRemotelyScraper,
+    close_http_scraper_client,
+)
+from .google_dorking_scraper import GoogleDorkScraper, close_dork_client
 
 # Browser-based scrapers (Playwright - use async_browser module)
 from .indeed_scraper import IndeedScraper
@@ -71,14 +82,18 @@ __all__ = [
     "SearchCache",
     "get_search_cache",
     "get_cached_or_search",
+    "iter_cached_or_search",
     # HTTP-based scrapers (recommended)
     "GitHubJobsScraper",
     "SimplifyJobsScraper",
     "JobrightScraper",
+    "close_github_client",
     "RemoteOKScraper",
     "HackerNewsJobsScraper",
     "WeWorkRemotelyScraper",
+    "close_http_scraper_client",
     "GoogleDorkScraper",
+    "close_dork_client",
     # Browser-based scrapers
     "IndeedScraper",
     "YCombinatorScraper",
@@ -63,17 +63,20 @@ class AsyncBrowserPool:
 
     Features:
     - Single browser instance with multiple contexts
+    - At most max_contexts contexts open at once
     - Fingerprint randomization per context
     - Auto-cleanup on idle
     - Proxy support
     """
 
-    def __init__(self, max_contexts: int = 3):
+    def __init__(self, max_contexts: int = 5):
         self.max_contexts = max_contexts
         self._playwright = None
         self._browser = None
         self._contexts: List[Any] = []
         self._lock = asyncio.Lock()
+        self._context_slots = asyncio.Semaphore(max_contexts)
+        self._active_contexts = 0
         self._cleanup_task: Optional[asyncio.Task] = None
         self._last_used = 0
 
@@ -100,11 +103,47 @@ class AsyncBrowserPool:
             # Start cleanup task
             self._cleanup_task = asyncio.create_task(self._auto_cleanup())
 
+    async def get_browser(self):
+        """
+        Get the shared browser, launching it on first use.
+
+        Scrapers borrow this browser and open their own contexts on it;
+        only close() (or the idle cleanup) shuts the browser down.
+        """
+        async with self._lock:
+            await self._ensure_browser()
+            self.touch()
+            return self._browser
+
+    def touch(self):
+        """Record browser activity so the idle cleanup keeps it alive"""
+        self._last_used = asyncio.get_event_loop().time()
+
+    async def acquire_context_slot(self):
+        """
+        Wait until another context may be opened on the shared browser.
+
+        Every successful call must be paired with release_context_slot().
+        """
+        await self._context_slots.acquire()
+        self._active_contexts += 1
+        self.touch()
+
+    def release_context_slot(self):
+        """Give back a slot taken by acquire_context_slot()"""
+        self._active_contexts -= 1
+        self._context_slots.release()
+        self.touch()
+
     async def _auto_cleanup(self):
         """Auto-close browser after 5 minutes of inactivity"""
         while True:
             await asyncio.sleep(60)  # Check every minute
-            if self._browser and (asyncio.get_event_loop().time() - self._last_used) > 300:
+            if (
+                self._browser
+                and self._active_contexts == 0
+                and (asyncio.get_event_loop().time() - self._last_used) > 300
+            ):
                 logger.info("Auto-closing idle browser")
                 await self.close()
                 break
@@ -130,9 +169,19 @@ class AsyncBrowserPool:
                 page = await context.new_page()
                 await page.goto(url)
         """
-        async with self._lock:
-            await self._ensure_browser()
+        await self.acquire_context_slot()
+        try:
+            async with self._lock:
+                await self._ensure_browser()
+
+            async with self._stealth_context(config, proxy) as context:
+                yield context
+        finally:
+            self.release_context_slot()
 
+    @asynccontextmanager
+    async def _stealth_context(self, config: Optional[BrowserConfig], proxy: Optional[str]):
+        """Open a fingerprinted context on the browser; caller holds a slot"""
         if config is None:
             config = self._get_random_config(proxy)
 
@@ -221,13 +270,15 @@ class AsyncBrowserPool:
 
     async def close(self):
         """Close browser and cleanup"""
-        if self._cleanup_task:
+        if self._cleanup_task and self._cleanup_task is not asyncio.current_task():
             self._cleanup_task.cancel()
             try:
                 await self._cleanup_task
             except asyncio.CancelledError:
                 pass
 
+        self._cleanup_task = None
+
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -1,9 +1,11 @@
 """Base scraper framework for job sites"""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import List, Optional, AsyncGenerator, Dict, Any
+from dataclasses import dataclass, field, fields, MISSING
+from typing import List, Optional, AsyncGenerator, Dict, Any, Callable
 from datetime import datetime, date
+from functools import lru_cache
+from urllib.parse import urlsplit
 import asyncio
 import time
 import random
@@ -13,12 +15,49 @@ import hashlib
 
 from .async_browser import get_browser_pool, AsyncBrowserPool
 
+try:
+    import ahocorasick_rs  # One linear scan for many keywords
+except ImportError:
+    ahocorasick_rs = None
+
 logger = logging.getLogger(__name__)
 
+# ============== Precompiled Patterns ==============
+
+_SALARY_NUMBER_RE = re.compile(r"(\d+(?:\.\d+)?)[K]?")
+_DAYS_AGO_RE = re.compile(r"(\d+)\s*days?\s*ago")
+_WEEKS_AGO_RE = re.compile(r"(\d+)\s*weeks?\s*ago")
+_MONTHS_AGO_RE = re.compile(r"(\d+)\s*months?\s*ago")
+
+# Requirement section headers followed by a bullet list
+_REQUIREMENT_SECTION_RES = (
+    re.compile(r"(?:requirements?|qualifications?|what you.?ll need|must have)[:\s]*\n((?:[-•*]\s*.+\n?)+)", re.IGNORECASE),
+    re.compile(r"(?:skills?|technologies?|tech stack)[:\s]*\n((?:[-•*]\s*.+\n?)+)", re.IGNORECASE),
+)
+_BULLET_RE = re.compile(r"[-•*]\s*(.+?)(?:\n|$)")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_HTML_ENTITY_RE = re.compile(r"&\w+;")
+_EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+
+# Common skills mentioned in descriptions, paired with their lowercase form
+_SKILL_KEYWORDS = tuple((skill, skill.lower()) for skill in (
+    "Python", "JavaScript", "TypeScript", "Java", "C++", "C#", "Go", "Rust",
+    "React", "Vue", "Angular", "Node.js", "Django", "FastAPI", "Flask",
+    "AWS", "GCP", "Azure", "Docker", "Kubernetes", "Terraform",
+    "PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch",
+    "Machine Learning", "Deep Learning", "NLP", "Computer Vision",
+    "CI/CD", "Git", "Agile", "Scrum",
+))
+
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ScrapedJob:
-    """Standardized job data from scraping"""
+    """
+    Standardized job data from scraping.
+
+    Jobs compare by identity; deduplication goes through content_hash.
+    """
     url: str
     title: str
     company_name: str
@@ -76,11 +115,204 @@ class ScrapedJob:
             "company_size": self.company_size,
         }
 
+    def to_cache_dict(self) -> Dict:
+        """
+        Convert to a JSON-safe dictionary that from_dict_fast() restores fully.
+
+        Unlike to_dict() (shaped for the jobs table) this keeps every field
+        except raw_data.
+        """
+        data = self.to_dict()
+        data["posted_text"] = self.posted_text
+        data["job_type"] = self.job_type
+        data["experience_level"] = self.experience_level
+        data["scraped_at"] = self.scraped_at.isoformat()
+        return data
+
+    @classmethod
+    def from_dict_fast(cls, data: Dict[str, Any]) -> "ScrapedJob":
+        """
+        Rebuild a job from a trusted dict (e.g. a cache entry).
+
+        Skips the generated __init__; fields missing from the dict
+        (such as those to_dict() leaves out) get their defaults. ISO date
+        strings written by to_dict()/to_cache_dict() are parsed back.
+        """
+        job = cls.__new__(cls)
+        for name, default in _SCRAPED_JOB_DEFAULTS:
+            setattr(job, name, data[name] if name in data else default())
+        if isinstance(job.posted_date, str):
+            job.posted_date = _parse_iso_date(job.posted_date)
+        if isinstance(job.scraped_at, str):
+            try:
+                job.scraped_at = datetime.fromisoformat(job.scraped_at)
+            except ValueError:
+                job.scraped_at = datetime.now()
+        return job
+
+    @property
+    def content_digest(self) -> bytes:
+        """Raw 8-byte dedup key; cheaper to hash and store than content_hash"""
+        content = f"{self.title}|{self.company_name}|{self.location}".lower()
+        return hashlib.md5(content.encode()).digest()[:8]
+
     @property
     def content_hash(self) -> str:
         """Generate hash for deduplication"""
-        content = f"{self.title}|{self.company_name}|{self.location}".lower()
-        return hashlib.md5(content.encode()).hexdigest()[:16]
+        return self.content_digest.hex()
+
+
+def _parse_iso_date(text: str) -> Optional[date]:
+    """Parse an ISO date (or datetime) string; None when it isn't one"""
+    try:
+        return date.fromisoformat(text[:10])
+    except ValueError:
+        return None
+
+
+# (field name, default factory) pairs used by ScrapedJob.from_dict_fast
+_SCRAPED_JOB_DEFAULTS = tuple(
+    (
+        f.name,
+        f.default_factory if f.default_factory is not MISSING
+        else (lambda value=f.default: None if value is MISSING else value),
+    )
+    for f in fields(ScrapedJob)
+)
+
+
+# ============== Cached Parsers ==============
+# Card text such as "2 days ago" or "$120K - $150K" repeats across
+# hundreds of listings, so the pure parsers are memoized per string.
+
+@lru_cache(maxsize=4096)
+def _parse_salary_cached(salary_text: str) -> tuple[Optional[int], Optional[int], str]:
+    """Parse salary text into (salary_min, salary_max, currency)"""
+    if not salary_text:
+        return None, None, "USD"
+
+    salary_text = salary_text.upper().replace(",", "").replace(" ", "")
+
+    # Detect currency
+    currency = "USD"
+    if "£" in salary_text or "GBP" in salary_text:
+        currency = "GBP"
+    elif "€" in salary_text or "EUR" in salary_text:
+        currency = "EUR"
+    elif "CAD" in salary_text:
+        currency = "CAD"
+
+    # Extract numbers
+    numbers = _SALARY_NUMBER_RE.findall(salary_text)
+
+    if not numbers:
+        return None, None, currency
+
+    # Convert K notation
+    values = []
+    for num in numbers:
+        value = float(num)
+        # Check if K notation was used
+        if f"{num}K" in salary_text or value < 1000:
+            value *= 1000
+        values.append(int(value))
+
+    if len(values) == 1:
+        return values[0], values[0], currency
+    elif len(values) >= 2:
+        return min(values), max(values), currency
+
+    return None, None, currency
+
+
+@lru_cache(maxsize=4096)
+def _parse_location_type_cached(text: str) -> Optional[str]:
+    """Parse location type (remote/hybrid/onsite) from text"""
+    if not text:
+        return None
+
+    text_lower = text.lower()
+
+    if "remote" in text_lower:
+        if "hybrid" in text_lower:
+            return "hybrid"
+        return "remote"
+    elif "hybrid" in text_lower:
+        return "hybrid"
+    elif "on-site" in text_lower or "onsite" in text_lower or "in-office" in text_lower:
+        return "onsite"
+
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_posted_date_cached(text: str, today: date) -> Optional[date]:
+    """Parse relative date text into an actual date relative to today"""
+    if not text:
+        return None
+
+    text_lower = text.lower().strip()
+
+    # Just posted / today
+    if any(x in text_lower for x in ["just", "today", "now", "< 24"]):
+        return today
+
+    # Yesterday
+    if "yesterday" in text_lower:
+        return date.fromordinal(today.toordinal() - 1)
+
+    # X days ago
+    days_match = _DAYS_AGO_RE.search(text_lower)
+    if days_match:
+        days = int(days_match.group(1))
+        return date.fromordinal(today.toordinal() - days)
+
+    # X weeks ago
+    weeks_match = _WEEKS_AGO_RE.search(text_lower)
+    if weeks_match:
+        weeks = int(weeks_match.group(1))
+        return date.fromordinal(today.toordinal() - (weeks * 7))
+
+    # X months ago
+    months_match = _MONTHS_AGO_RE.search(text_lower)
+    if months_match:
+        months = int(months_match.group(1))
+        return date.fromordinal(today.toordinal() - (months * 30))
+
+    # Try to parse actual date
+    date_formats = ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%B %d, %Y", "%b %d, %Y"]
+    for fmt in date_formats:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+
+    return None
+
+
+# ============== Keyword Matching ==============
+# Shared by the HTTP and GitHub scrapers to pre-filter listings before parsing
+
+def keyword_matcher(keywords_lower: List[str]) -> Callable[[str], bool]:
+    """
+    Build a predicate that is True if any keyword occurs in the text.
+
+    With no keywords every text matches, and a single keyword is one
+    substring test. With more than a couple of keywords an Aho-Corasick
+    automaton finds them all in one pass; otherwise plain substring checks
+    are cheaper.
+    """
+    if not keywords_lower:
+        return lambda text: True
+    if len(keywords_lower) == 1:
+        keyword = keywords_lower[0]
+        return lambda text: keyword in text
+    if ahocorasick_rs and len(keywords_lower) > 2:
+        automaton = ahocorasick_rs.AhoCorasick(
+            keywords_lower, matchkind=ahocorasick_rs.MatchKind.LeftmostFirst
+        )
+        return lambda text: bool(automaton.find_matches_as_indexes(text))
+    return lambda text: any(k in text for k in keywords_lower)
 
 
 class BaseScraper(ABC):
@@ -98,10 +330,24 @@ class BaseScraper(ABC):
     TIMEOUT_SECONDS = 30        # Request timeout
     RESPECT_ROBOTS_TXT = True   # Check robots.txt
 
+    # Resources never needed for text extraction (logos are read from src attributes)
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet", "ping"})
+    BLOCKED_DOMAINS = (  # Matched against the request hostname suffix
+        "google-analytics.com",
+        "googletagmanager.com",
+        "doubleclick.net",
+        "facebook.net",
+        "hotjar.com",
+        "segment.io",
+        "newrelic.com",
+    )
+
     def __init__(self):
         self.last_request_time = 0
+        self._rate_lock = asyncio.Lock()
         self._browser = None
         self._browser_pool = None
+        self._holds_context_slot = False
         self._page = None
         self._context = None
 
@@ -161,10 +407,13 @@ class BaseScraper(ABC):
             # Get the global browser pool
             pool = await get_browser_pool()
 
-            # Create a new context from the pool
+            # Borrow the shared browser; this scraper only owns its context
             self._browser_pool = pool
-            await pool._ensure_browser()
-            self._browser = pool._browser
+            self._browser = await pool.get_browser()
+
+            # Bound how many contexts share the browser at once
+            await pool.acquire_context_slot()
+            self._holds_context_slot = True
 
             # Create context with stealth settings
             self._context = await self._browser.new_context(
@@ -182,6 +431,9 @@ class BaseScraper(ABC):
                 window.chrome = { runtime: {} };
             """)
 
+            # Skip heavy and tracking resources for every page in this context
+            await self._context.route("**/*", self._block_resources)
+
             self._page = await self._context.new_page()
             self._page.set_default_timeout(self.TIMEOUT_SECONDS * 1000)
 
@@ -198,10 +450,23 @@ class BaseScraper(ABC):
 
         except Exception as e:
             logger.error(f"Failed to initialize browser: {e}")
+            await self._close_browser()
             raise
 
+    async def _block_resources(self, route, request):
+        """Abort requests for resource types and trackers we never read"""
+        if request.resource_type in self.BLOCKED_RESOURCE_TYPES or (
+            (urlsplit(request.url).hostname or "").endswith(self.BLOCKED_DOMAINS)
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def _close_browser(self):
-        """Close browser context and cleanup"""
+        """Close this scraper's context; the shared browser stays open"""
+        if self._browser_pool:
+            self._browser_pool.touch()
+
         try:
             if self._page:
                 await self._page.close()
@@ -213,6 +478,9 @@ class BaseScraper(ABC):
             self._page = None
             self._context = None
             self._browser = None
+            if self._holds_context_slot:
+                self._holds_context_slot = False
+                self._browser_pool.release_context_slot()
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -226,13 +494,14 @@ class BaseScraper(ABC):
     # ============== Rate Limiting ==============
 
     async def _rate_limit(self):
-        """Enforce rate limiting between requests"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.RATE_LIMIT_SECONDS:
-            wait_time = self.RATE_LIMIT_SECONDS - elapsed
-            logger.debug(f"Rate limiting: waiting {wait_time:.1f}s")
-            await asyncio.sleep(wait_time)
-        self.last_request_time = time.time()
+        """Enforce rate limiting between requests (safe for concurrent pages)"""
+        async with self._rate_lock:
+            elapsed = time.time() - self.last_request_time
+            if elapsed < self.RATE_LIMIT_SECONDS:
+                wait_time = self.RATE_LIMIT_SECONDS - elapsed
+                logger.debug(f"Rate limiting: waiting {wait_time:.1f}s")
+                await asyncio.sleep(wait_time)
+            self.last_request_time = time.time()
 
     async def _random_delay(self, min_sec: float = 1.0, max_sec: float = 3.0):
         """Add random delay to appear more human"""
@@ -252,21 +521,37 @@ class BaseScraper(ABC):
 
     # ============== Navigation Helpers ==============
 
-    async def _navigate(self, url: str, wait_for: str = "networkidle") -> bool:
+    async def _new_page(self):
+        """
+        Open an extra page in this scraper's browser context.
+
+        The context is shared for the lifetime of the scraper; callers own
+        the returned page and must close it.
+        """
+        if self._context is None:
+            await self._init_browser()
+
+        page = await self._context.new_page()
+        page.set_default_timeout(self.TIMEOUT_SECONDS * 1000)
+        return page
+
+    async def _navigate(self, url: str, wait_for: str = "networkidle", page=None) -> bool:
         """
         Navigate to URL with rate limiting and error handling.
 
         Args:
             url: URL to navigate to
             wait_for: Playwright wait condition
+            page: Page to navigate (defaults to the scraper's main page)
 
         Returns:
             True if successful, False otherwise
         """
+        page = page or self._page
         await self._rate_limit()
 
         try:
-            response = await self._page.goto(
+            response = await page.goto(
                 url,
                 wait_until=wait_for,
                 timeout=self.TIMEOUT_SECONDS * 1000
@@ -283,28 +568,43 @@ class BaseScraper(ABC):
             logger.error(f"Navigation failed for {url}: {e}")
             return False
 
-    async def _wait_for_selector(self, selector: str, timeout: int = 10000) -> bool:
+    async def _wait_for_selector(self, selector: str, timeout: int = 10000, page=None) -> bool:
         """Wait for element with timeout"""
+        page = page or self._page
         try:
-            await self._page.wait_for_selector(selector, timeout=timeout)
+            await page.wait_for_selector(selector, timeout=timeout)
             return True
         except Exception:
             return False
 
-    async def _get_text(self, selector: str, default: str = "") -> str:
+    async def _wait_for_first_selector(self, selectors, page=None) -> bool:
+        """
+        Wait on (selector, timeout) pairs one at a time, in priority order.
+
+        Cheaper than waiting on a comma union, which re-evaluates every
+        branch on each DOM mutation; fallbacks only run if earlier ones miss.
+        """
+        for selector, timeout in selectors:
+            if await self._wait_for_selector(selector, timeout=timeout, page=page):
+                return True
+        return False
+
+    async def _get_text(self, selector: str, default: str = "", page=None) -> str:
         """Safely get text content from selector"""
+        page = page or self._page
         try:
-            element = await self._page.query_selector(selector)
+            element = await page.query_selector(selector)
             if element:
                 return (await element.inner_text()).strip()
         except Exception:
             pass
         return default
 
-    async def _get_attribute(self, selector: str, attr: str, default: str = "") -> str:
+    async def _get_attribute(self, selector: str, attr: str, default: str = "", page=None) -> str:
         """Safely get attribute from selector"""
+        page = page or self._page
         try:
-            element = await self._page.query_selector(selector)
+            element = await page.query_selector(selector)
             if element:
                 value = await element.get_attribute(attr)
                 return value.strip() if value else default
@@ -325,17 +625,19 @@ class BaseScraper(ABC):
         except Exception:
             return []
 
-    async def _query_selector(self, selector: str):
+    async def _query_selector(self, selector: str, page=None):
         """Query single element"""
+        page = page or self._page
         try:
-            return await self._page.query_selector(selector)
+            return await page.query_selector(selector)
         except Exception:
             return None
 
-    async def _query_selector_all(self, selector: str) -> List:
+    async def _query_selector_all(self, selector: str, page=None) -> List:
         """Query all matching elements"""
+        page = page or self._page
         try:
-            return await self._page.query_selector_all(selector)
+            return await page.query_selector_all(selector)
         except Exception:
             return []
 
@@ -380,59 +682,11 @@ class BaseScraper(ABC):
         Returns:
             Tuple of (salary_min, salary_max, currency)
         """
-        if not salary_text:
-            return None, None, "USD"
-
-        salary_text = salary_text.upper().replace(",", "").replace(" ", "")
-
-        # Detect currency
-        currency = "USD"
-        if "£" in salary_text or "GBP" in salary_text:
-            currency = "GBP"
-        elif "€" in salary_text or "EUR" in salary_text:
-            currency = "EUR"
-        elif "CAD" in salary_text:
-            currency = "CAD"
-
-        # Extract numbers
-        numbers = re.findall(r"(\d+(?:\.\d+)?)[K]?", salary_text)
-
-        if not numbers:
-            return None, None, currency
-
-        # Convert K notation
-        values = []
-        for num in numbers:
-            value = float(num)
-            # Check if K notation was used
-            if f"{num}K" in salary_text or value < 1000:
-                value *= 1000
-            values.append(int(value))
-
-        if len(values) == 1:
-            return values[0], values[0], currency
-        elif len(values) >= 2:
-            return min(values), max(values), currency
-
-        return None, None, currency
+        return _parse_salary_cached(salary_text)
 
     def _parse_location_type(self, text: str) -> Optional[str]:
         """Parse location type from text"""
-        if not text:
-            return None
-
-        text_lower = text.lower()
-
-        if "remote" in text_lower:
-            if "hybrid" in text_lower:
-                return "hybrid"
-            return "remote"
-        elif "hybrid" in text_lower:
-            return "hybrid"
-        elif "on-site" in text_lower or "onsite" in text_lower or "in-office" in text_lower:
-            return "onsite"
-
-        return None
+        return _parse_location_type_cached(text)
 
     def _parse_posted_date(self, text: str) -> Optional[date]:
         """
@@ -444,78 +698,24 @@ class BaseScraper(ABC):
         Returns:
             Parsed date or None
         """
-        if not text:
-            return None
-
-        text_lower = text.lower().strip()
-        today = date.today()
-
-        # Just posted / today
-        if any(x in text_lower for x in ["just", "today", "now", "< 24"]):
-            return today
-
-        # Yesterday
-        if "yesterday" in text_lower:
-            return date.fromordinal(today.toordinal() - 1)
-
-        # X days ago
-        days_match = re.search(r"(\d+)\s*days?\s*ago", text_lower)
-        if days_match:
-            days = int(days_match.group(1))
-            return date.fromordinal(today.toordinal() - days)
-
-        # X weeks ago
-        weeks_match = re.search(r"(\d+)\s*weeks?\s*ago", text_lower)
-        if weeks_match:
-            weeks = int(weeks_match.group(1))
-            return date.fromordinal(today.toordinal() - (weeks * 7))
-
-        # X months ago
-        months_match = re.search(r"(\d+)\s*months?\s*ago", text_lower)
-        if months_match:
-            months = int(months_match.group(1))
-            return date.fromordinal(today.toordinal() - (months * 30))
-
-        # Try to parse actual date
-        date_formats = ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%B %d, %Y", "%b %d, %Y"]
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(text, fmt).date()
-            except ValueError:
-                continue
-
-        return None
+        # Today is part of the cache key so relative dates never go stale
+        return _parse_posted_date_cached(text, date.today())
 
     def _extract_requirements(self, description: str) -> List[str]:
         """Extract requirements/skills from job description"""
         requirements = []
 
         # Common requirement section headers
-        req_patterns = [
-            r"(?:requirements?|qualifications?|what you.?ll need|must have)[:\s]*\n((?:[-•*]\s*.+\n?)+)",
-            r"(?:skills?|technologies?|tech stack)[:\s]*\n((?:[-•*]\s*.+\n?)+)",
-        ]
-
-        for pattern in req_patterns:
-            matches = re.findall(pattern, description, re.IGNORECASE)
-            for match in matches:
+        for pattern in _REQUIREMENT_SECTION_RES:
+            for match in pattern.findall(description):
                 # Extract bullet points
-                bullets = re.findall(r"[-•*]\s*(.+?)(?:\n|$)", match)
+                bullets = _BULLET_RE.findall(match)
                 requirements.extend([b.strip() for b in bullets if len(b.strip()) > 3])
 
         # Also extract common skills mentioned
-        skill_keywords = [
-            "Python", "JavaScript", "TypeScript", "Java", "C++", "C#", "Go", "Rust",
-            "React", "Vue", "Angular", "Node.js", "Django", "FastAPI", "Flask",
-            "AWS", "GCP", "Azure", "Docker", "Kubernetes", "Terraform",
-            "PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch",
-            "Machine Learning", "Deep Learning", "NLP", "Computer Vision",
-            "CI/CD", "Git", "Agile", "Scrum"
-        ]
-
         desc_lower = description.lower()
-        for skill in skill_keywords:
-            if skill.lower() in desc_lower and skill not in requirements:
+        for skill, skill_lower in _SKILL_KEYWORDS:
+            if skill_lower in desc_lower and skill not in requirements:
                 requirements.append(skill)
 
         return list(set(requirements))[:20]  # Limit to 20 unique items
@@ -526,13 +726,13 @@ class BaseScraper(ABC):
             return ""
 
         # Remove excessive whitespace
-        description = re.sub(r"\s+", " ", description)
+        description = _WHITESPACE_RE.sub(" ", description)
 
         # Remove HTML entities
-        description = re.sub(r"&\w+;", " ", description)
+        description = _HTML_ENTITY_RE.sub(" ", description)
 
         # Normalize line breaks
-        description = re.sub(r"\n{3,}", "\n\n", description)
+        description = _EXCESS_NEWLINES_RE.sub("\n\n", description)
 
         return description.strip()
 
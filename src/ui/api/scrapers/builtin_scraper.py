@@ -2,15 +2,26 @@
 
 from typing import List, Optional, AsyncGenerator, Dict
 from datetime import date
+from urllib.parse import urlencode, quote_plus
 import re
+import sys
 import logging
 import asyncio
 
 from .base_scraper import BaseScraper, ScrapedJob, register_scraper
+from .cache import get_search_cache
 
 logger = logging.getLogger(__name__)
 
 
+def _classify(classes, text: str) -> Optional[str]:
+    """Name of the first (name, pattern) bucket whose pattern occurs in text"""
+    for name, pattern in classes:
+        if pattern.search(text):
+            return name
+    return None
+
+
 @register_scraper("builtin")
 class BuiltInScraper(BaseScraper):
     """
@@ -25,6 +36,34 @@ class BuiltInScraper(BaseScraper):
 
     RATE_LIMIT_SECONDS = 4
     MAX_PAGES = 8
+    EARLY_EXIT_CARDS = 8        # Cards to sample before giving up on a sparse page
+    EARLY_EXIT_MIN_JOBS = 3     # Valid jobs required within the sample
+    MIN_FILL_RATE = 0.25        # Smoothed jobs/cards ratio below which paging stops
+
+    # Company size and experience buckets, checked in order so the first
+    # bucket that matches wins; size ranges can't start inside a longer number
+    _SIZE_CLASSES = tuple(
+        (name, re.compile(pattern, re.IGNORECASE))
+        for name, pattern in (
+            ("startup", r"(?<!\d)(?:1 ?- ?10|11 ?- ?50|1 ?- ?50)|startup"),
+            ("small", r"(?<!\d)51 ?- ?200"),
+            ("medium", r"(?<!\d)(?:201 ?- ?500|501 ?- ?1,?000)"),
+            ("large", r"(?<!\d)1,?001 ?- ?5,?000"),
+            ("enterprise", r"(?<!\d)5,?000"),
+        )
+    )
+    _EXPERIENCE_CLASSES = tuple(
+        (name, re.compile(pattern, re.IGNORECASE))
+        for name, pattern in (
+            ("entry", r"entry|junior|0-2"),
+            ("mid", r"mid|3-5|intermediate"),
+            ("senior", r"senior|5\+|lead"),
+        )
+    )
+
+    def __init__(self):
+        super().__init__()
+        self._fill_rate = 1.0  # EWMA of valid jobs per card across pages
 
     @property
     def source_name(self) -> str:
@@ -72,18 +111,16 @@ class BuiltInScraper(BaseScraper):
     ) -> str:
         """Build BuiltIn search URL"""
         base = self._get_location_subdomain(location)
-        url = f"{base}/jobs"
 
-        params = []
+        params = {}
 
         if keywords:
-            query = " ".join(keywords)
-            params.append(f"search={query.replace(' ', '%20')}")
+            params["search"] = " ".join(keywords)
 
         if filters:
             # Remote filter
             if filters.get("remote") or (location and location.lower() == "remote"):
-                params.append("remote=true")
+                params["remote"] = "true"
 
             # Experience level
             if filters.get("experience_level"):
@@ -95,7 +132,7 @@ class BuiltInScraper(BaseScraper):
                     "executive": "director"
                 }
                 if filters["experience_level"] in exp_map:
-                    params.append(f"experience={exp_map[filters['experience_level']]}")
+                    params["experience"] = exp_map[filters["experience_level"]]
 
             # Company size
             if filters.get("company_size"):
@@ -104,26 +141,24 @@ class BuiltInScraper(BaseScraper):
                     "small": "51-200",
                     "medium": "201-500,501-1000",
                     "large": "1001-5000",
-                    "enterprise": "5001%2B"
+                    "enterprise": "5001+"
                 }
                 if filters["company_size"] in size_map:
-                    params.append(f"company_size={size_map[filters['company_size']]}")
+                    params["company_size"] = size_map[filters["company_size"]]
 
             # Industry
             if filters.get("industry"):
-                params.append(f"industry={filters['industry'].replace(' ', '%20')}")
+                params["industry"] = filters["industry"]
 
             # Job category
             if filters.get("category"):
-                params.append(f"category={filters['category'].replace(' ', '%20')}")
+                params["category"] = filters["category"]
 
         if page > 1:
-            params.append(f"page={page}")
+            params["page"] = page
 
-        if params:
-            url += "?" + "&".join(params)
-
-        return url
+        query_string = urlencode(params, quote_via=quote_plus)
+        return f"{base}/jobs?{query_string}" if query_string else f"{base}/jobs"
 
     async def search(
         self,
@@ -134,10 +169,11 @@ class BuiltInScraper(BaseScraper):
         """Search BuiltIn for jobs"""
         filters = filters or {}
         page = 1
+        max_pages = self.MAX_PAGES
 
         logger.info(f"Starting BuiltIn search: keywords={keywords}, location={location}")
 
-        while page <= self.MAX_PAGES:
+        while page <= max_pages:
             url = self._build_search_url(keywords, location, page, filters)
 
             logger.debug(f"Scraping BuiltIn page {page}: {url}")
@@ -164,7 +200,14 @@ class BuiltInScraper(BaseScraper):
                 break
 
             jobs_found = 0
+            cards_parsed = 0
             for card in job_cards:
+                # Stop parsing the tail of a page that is mostly empty cards
+                if cards_parsed == self.EARLY_EXIT_CARDS and jobs_found < self.EARLY_EXIT_MIN_JOBS:
+                    logger.debug(f"Sparse BuiltIn page {page}, skipping remaining cards")
+                    break
+
+                cards_parsed += 1
                 try:
                     job = await self._parse_job_card(card)
                     if job:
@@ -176,6 +219,11 @@ class BuiltInScraper(BaseScraper):
 
             logger.info(f"Found {jobs_found} jobs on BuiltIn page {page}")
 
+            # Stop paging soon once pages keep coming back thin
+            self._fill_rate = 0.5 * self._fill_rate + 0.5 * (jobs_found / cards_parsed)
+            if self._fill_rate < self.MIN_FILL_RATE:
+                max_pages = min(max_pages, page + 1)
+
             if jobs_found < 5:  # Probably last page
                 break
 
@@ -201,6 +249,12 @@ class BuiltInScraper(BaseScraper):
             if not job_url.startswith("http"):
                 job_url = f"{self.base_url}{job_url}"
 
+            # Reuse the job if an overlapping search already parsed it
+            cache = get_search_cache()
+            cached = await cache.get_job(job_url)
+            if cached:
+                return ScrapedJob.from_dict_fast(cached)
+
             # Get company name
             company_el = await card.query_selector(
                 "[data-id='company-title'], [class*='company'], a[href*='/company/']"
@@ -256,40 +310,32 @@ class BuiltInScraper(BaseScraper):
             size_el = await card.query_selector("[class*='company-size'], [data-id='company-size']")
             company_size = None
             if size_el:
-                size_text = (await size_el.inner_text()).strip().lower()
-                if any(x in size_text for x in ["1-10", "11-50", "1 - 50"]):
-                    company_size = "startup"
-                elif any(x in size_text for x in ["51-200", "51 - 200"]):
-                    company_size = "small"
-                elif any(x in size_text for x in ["201-500", "501-1000"]):
-                    company_size = "medium"
-                elif any(x in size_text for x in ["1001-5000", "1,001-5,000"]):
-                    company_size = "large"
-                elif "5000" in size_text or "5,000" in size_text:
-                    company_size = "enterprise"
+                company_size = _classify(self._SIZE_CLASSES, await size_el.inner_text())
 
             # Industry
             industry_el = await card.query_selector("[class*='industry'], [data-id='industry']")
             industry = (await industry_el.inner_text()).strip() if industry_el else None
 
-            return ScrapedJob(
+            job = ScrapedJob(
                 url=job_url,
                 title=title,
                 company_name=company_name,
                 description=description,
-                source=self.source_name,
+                source=sys.intern(self.source_name),
                 location=location,
-                location_type=location_type,
+                location_type=sys.intern(location_type) if location_type else None,
                 salary_text=salary_text,
                 salary_min=salary_min,
                 salary_max=salary_max,
-                salary_currency=salary_currency,
+                salary_currency=sys.intern(salary_currency),
                 posted_date=posted_date,
                 posted_text=posted_text,
                 company_logo=company_logo,
-                company_size=company_size,
-                company_industry=industry,
+                company_size=sys.intern(company_size) if company_size else None,
+                company_industry=sys.intern(industry) if industry else None,
             )
+            await cache.set_job(job_url, job.to_cache_dict())
+            return job
 
         except Exception as e:
             logger.error(f"Error parsing BuiltIn job card: {e}")
@@ -299,32 +345,41 @@ class BuiltInScraper(BaseScraper):
         """Get full job details from listing page"""
         logger.debug(f"Fetching BuiltIn job details: {url}")
 
-        if not await self._navigate(url):
-            return None
-
-        # Wait for job description
-        await self._wait_for_selector("[class*='job-description'], [data-id='job-description'], main", timeout=10000)
+        # Short-lived page in the shared context so search's page is untouched
+        page = await self._new_page()
 
         try:
+            if not await self._navigate(url, page=page):
+                return None
+
+            # Wait for job description
+            await self._wait_for_selector(
+                "[class*='job-description'], [data-id='job-description'], main",
+                timeout=10000,
+                page=page,
+            )
+
             # Title
-            title = await self._get_text("h1, [data-id='job-title'], [class*='job-title']")
+            title = await self._get_text("h1, [data-id='job-title'], [class*='job-title']", page=page)
 
             # Company
             company_name = await self._get_text(
-                "[data-id='company-name'], [class*='company-name'], a[href*='/company/'] > span"
+                "[data-id='company-name'], [class*='company-name'], a[href*='/company/'] > span",
+                page=page,
             )
 
             # Location
-            location = await self._get_text("[data-id='job-location'], [class*='job-location']")
+            location = await self._get_text("[data-id='job-location'], [class*='job-location']", page=page)
             location_type = self._parse_location_type(location)
 
             # Salary
-            salary_text = await self._get_text("[data-id='job-salary'], [class*='salary'], [class*='compensation']")
+            salary_text = await self._get_text("[data-id='job-salary'], [class*='salary'], [class*='compensation']", page=page)
             salary_min, salary_max, salary_currency = self._parse_salary(salary_text)
 
             # Full description
             description = await self._get_text(
-                "[data-id='job-description'], [class*='job-description'], article"
+                "[data-id='job-description'], [class*='job-description'], article",
+                page=page,
             )
             description = self._clean_description(description)
 
@@ -332,43 +387,25 @@ class BuiltInScraper(BaseScraper):
             requirements = self._extract_requirements(description)
 
             # Additional job details
-            job_type_el = await self._query_selector("[class*='job-type'], [data-id='job-type']")
+            job_type_el = await self._query_selector("[class*='job-type'], [data-id='job-type']", page=page)
             job_type = (await job_type_el.inner_text()).strip().lower() if job_type_el else None
 
-            experience_el = await self._query_selector("[class*='experience'], [data-id='experience']")
+            experience_el = await self._query_selector("[class*='experience'], [data-id='experience']", page=page)
             experience_level = None
             if experience_el:
-                exp_text = (await experience_el.inner_text()).strip().lower()
-                if any(x in exp_text for x in ["entry", "junior", "0-2"]):
-                    experience_level = "entry"
-                elif any(x in exp_text for x in ["mid", "3-5", "intermediate"]):
-                    experience_level = "mid"
-                elif any(x in exp_text for x in ["senior", "5+", "lead"]):
-                    experience_level = "senior"
+                experience_level = _classify(self._EXPERIENCE_CLASSES, await experience_el.inner_text())
 
             # Company info
-            company_logo = await self._get_attribute("img[class*='company-logo'], img[class*='logo']", "src")
-            company_website = await self._get_attribute("a[class*='company-website'], a[class*='website']", "href")
-            company_industry = await self._get_text("[class*='company-industry'], [data-id='industry']")
+            company_logo = await self._get_attribute("img[class*='company-logo'], img[class*='logo']", "src", page=page)
+            company_website = await self._get_attribute("a[class*='company-website'], a[class*='website']", "href", page=page)
+            company_industry = await self._get_text("[class*='company-industry'], [data-id='industry']", page=page)
 
             # Company size
-            size_text = await self._get_text("[class*='company-size'], [data-id='company-size']")
-            company_size = None
-            if size_text:
-                size_lower = size_text.lower()
-                if any(x in size_lower for x in ["1-50", "startup"]):
-                    company_size = "startup"
-                elif "51-200" in size_lower:
-                    company_size = "small"
-                elif any(x in size_lower for x in ["201-500", "501-1000"]):
-                    company_size = "medium"
-                elif "1001-5000" in size_lower:
-                    company_size = "large"
-                elif "5000" in size_lower:
-                    company_size = "enterprise"
+            size_text = await self._get_text("[class*='company-size'], [data-id='company-size']", page=page)
+            company_size = _classify(self._SIZE_CLASSES, size_text) if size_text else None
 
             # Posted date
-            posted_text = await self._get_text("[class*='posted'], time[class*='date']")
+            posted_text = await self._get_text("[class*='posted'], time[class*='date']", page=page)
             posted_date = self._parse_posted_date(posted_text) if posted_text else None
 
             return ScrapedJob(
@@ -376,24 +413,27 @@ class BuiltInScraper(BaseScraper):
                 title=title,
                 company_name=company_name,
                 description=description,
-                source=self.source_name,
+                source=sys.intern(self.source_name),
                 location=location,
-                location_type=location_type,
+                location_type=sys.intern(location_type) if location_type else None,
                 salary_text=salary_text,
                 salary_min=salary_min,
                 salary_max=salary_max,
-                salary_currency=salary_currency,
+                salary_currency=sys.intern(salary_currency),
                 requirements=requirements,
                 posted_date=posted_date,
                 posted_text=posted_text,
                 company_logo=company_logo,
                 company_website=company_website,
-                company_industry=company_industry,
-                company_size=company_size,
+                company_industry=sys.intern(company_industry) if company_industry else None,
+                company_size=sys.intern(company_size) if company_size else None,
                 job_type=job_type,
-                experience_level=experience_level,
+                experience_level=sys.intern(experience_level) if experience_level else None,
             )
 
         except Exception as e:
             logger.error(f"Error getting BuiltIn job details: {e}")
             return None
+
+        finally:
+            await page.close()
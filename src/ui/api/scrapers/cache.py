@@ -9,19 +9,71 @@ import asyncio
 import json
 import logging
 import hashlib
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, AsyncGenerator
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import os
 
 from .base_scraper import ScrapedJob
 
+try:
+    import orjson  # Serializes the job lists several times faster than json
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash  # Optional: faster non-cryptographic cache-key hashing
+except ImportError:
+    xxhash = None
+
 logger = logging.getLogger(__name__)
 
 # Default cache TTL: 6 hours
 DEFAULT_TTL = 6 * 60 * 60
 
+# In-process (L1) TTL in front of Redis: 5 minutes
+L1_TTL = 5 * 60
+
+
+def _digest(payload: bytes) -> str:
+    """Fixed-length non-cryptographic digest used in cache keys"""
+    if xxhash is not None:
+        return xxhash.xxh3_128(payload).hexdigest()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _normalized_cache_key(keywords: tuple, location: str, filters_payload: bytes) -> str:
+    """Build a cache key from inputs; memoized for repeated queries"""
+    normalized = sorted({kw.strip().lower() for kw in keywords} - {""})
+    # JSON keeps the parts apart, so ["a:b"] and ["a", "b"] hash differently
+    payload = json.dumps(
+        [normalized, location.strip().lower(), filters_payload.decode()],
+        separators=(",", ":"),
+    ).encode()
+    return f"search:{_digest(payload)}"
+
+
+def build_cache_key(
+    keywords: List[str],
+    location: Optional[str],
+    filters: Optional[Dict],
+) -> str:
+    """
+    Cache key for a search, shared by SearchCache and the orchestrator.
+
+    Keyword order, case and surrounding whitespace don't change the key.
+    """
+    filters_payload = (
+        json.dumps(filters, sort_keys=True, separators=(",", ":"), default=str).encode()
+        if filters else b""
+    )
+    return _normalized_cache_key(tuple(keywords or ()), location or "", filters_payload)
+
 
 @dataclass
 class CachedResult:
@@ -34,11 +86,14 @@ class CachedResult:
     expires_at: str
 
     def to_json(self) -> str:
-        return json.dumps(asdict(self))
+        # vars() instead of asdict(): asdict deep-copies every job dict
+        if orjson is not None:
+            return orjson.dumps(vars(self)).decode()
+        return json.dumps(vars(self))
 
     @classmethod
     def from_json(cls, data: str) -> "CachedResult":
-        return cls(**json.loads(data))
+        return cls(**(orjson.loads(data) if orjson is not None else json.loads(data)))
 
     def is_expired(self) -> bool:
         expires = datetime.fromisoformat(self.expires_at)
@@ -69,11 +124,13 @@ class InMemoryCache(CacheBackend):
     """
     Simple in-memory cache for development.
 
-    Not suitable for production with multiple workers.
+    Not suitable for production with multiple workers. With max_entries
+    set, the least recently used entry is evicted once the cap is reached.
     """
 
-    def __init__(self):
-        self._cache: Dict[str, tuple[str, datetime]] = {}
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, tuple[str, datetime]]" = OrderedDict()
         self._lock = asyncio.Lock()
 
     async def get(self, key: str) -> Optional[str]:
@@ -81,6 +138,7 @@ class InMemoryCache(CacheBackend):
             if key in self._cache:
                 value, expires = self._cache[key]
                 if datetime.now() < expires:
+                    self._cache.move_to_end(key)
                     return value
                 else:
                     del self._cache[key]
@@ -90,6 +148,10 @@ class InMemoryCache(CacheBackend):
         async with self._lock:
             expires = datetime.now() + timedelta(seconds=ttl)
             self._cache[key] = (value, expires)
+            self._cache.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
             return True
 
     async def delete(self, key: str) -> bool:
@@ -173,6 +235,57 @@ class RedisCache(CacheBackend):
             return False
 
 
+class TieredCache(CacheBackend):
+    """
+    Two-tier cache: a small in-process LRU (L1) in front of a shared backend (L2).
+
+    Warm queries are answered from process memory without a Redis round
+    trip. L1 entries live at most L1_TTL so workers pick up invalidations
+    made elsewhere reasonably quickly. Backend errors are already logged
+    and reported as misses by RedisCache, so an L2 outage degrades to L1
+    plus a fresh search.
+    """
+
+    def __init__(self, l2: CacheBackend, max_entries: int = 256, l1_ttl: int = L1_TTL):
+        self._l2 = l2
+        self.max_entries = max_entries
+        self.l1_ttl = l1_ttl
+        self._l1: "OrderedDict[str, tuple[str, float]]" = OrderedDict()
+
+    def _l1_set(self, key: str, value: str, ttl: int):
+        self._l1[key] = (value, time.monotonic() + min(ttl, self.l1_ttl))
+        self._l1.move_to_end(key)
+        while len(self._l1) > self.max_entries:
+            self._l1.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._l1.get(key)
+        if entry is not None:
+            value, expires = entry
+            if time.monotonic() < expires:
+                self._l1.move_to_end(key)
+                return value
+            del self._l1[key]
+
+        value = await self._l2.get(key)
+        if value is not None:
+            self._l1_set(key, value, self.l1_ttl)
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> bool:
+        self._l1_set(key, value, ttl)
+        await self._l2.set(key, value, ttl)
+        return True
+
+    async def delete(self, key: str) -> bool:
+        removed = self._l1.pop(key, None) is not None
+        return await self._l2.delete(key) or removed
+
+    async def clear(self) -> bool:
+        self._l1.clear()
+        return await self._l2.clear()
+
+
 class SearchCache:
     """
     High-level search result cache.
@@ -180,18 +293,35 @@ class SearchCache:
     Automatically selects backend based on environment.
     """
 
-    def __init__(self, ttl: int = DEFAULT_TTL, backend: Optional[CacheBackend] = None):
+    # In-process entries for per-job lookups; a search page alone can
+    # produce a few hundred, so they get their own bounded LRU rather than
+    # evicting whole search results
+    JOB_L1_ENTRIES = 4096
+
+    def __init__(
+        self,
+        ttl: int = DEFAULT_TTL,
+        backend: Optional[CacheBackend] = None,
+        job_backend: Optional[CacheBackend] = None,
+    ):
         self.ttl = ttl
 
         if backend:
             self._backend = backend
+            self._job_backend = job_backend or backend
         elif os.getenv("REDIS_URL"):
             try:
-                self._backend = RedisCache()
+                redis_cache = RedisCache()
+                self._backend = TieredCache(redis_cache)
+                self._job_backend = job_backend or TieredCache(
+                    redis_cache, max_entries=self.JOB_L1_ENTRIES
+                )
             except Exception:
                 self._backend = InMemoryCache()
+                self._job_backend = job_backend or InMemoryCache(self.JOB_L1_ENTRIES)
         else:
             self._backend = InMemoryCache()
+            self._job_backend = job_backend or InMemoryCache(self.JOB_L1_ENTRIES)
 
         logger.info(f"Search cache initialized with {type(self._backend).__name__}")
 
@@ -202,14 +332,7 @@ class SearchCache:
         filters: Optional[Dict],
     ) -> str:
         """Generate cache key from search parameters"""
-        key_parts = [
-            ":".join(sorted(k.lower() for k in keywords)) if keywords else "",
-            (location or "").lower(),
-            hashlib.md5(
-                json.dumps(filters, sort_keys=True).encode() if filters else b""
-            ).hexdigest()[:8],
-        ]
-        return hashlib.md5(":".join(key_parts).encode()).hexdigest()[:16]
+        return build_cache_key(keywords, location, filters)
 
     async def get(
         self,
@@ -255,7 +378,7 @@ class SearchCache:
         expires = now + timedelta(seconds=self.ttl)
 
         result = CachedResult(
-            jobs=[j.to_dict() for j in jobs],
+            jobs=[j.to_cache_dict() for j in jobs],
             total_found=len(jobs),
             sources_succeeded=sources_succeeded,
             sources_failed=sources_failed,
@@ -268,6 +391,32 @@ class SearchCache:
             logger.debug(f"Cached {len(jobs)} jobs with key {key}")
         return success
 
+    def _generate_job_key(self, url: str) -> str:
+        """Generate cache key for a single job listing"""
+        return f"job:{hashlib.blake2b(url.encode(), digest_size=16).hexdigest()}"
+
+    async def get_job(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached job by its listing URL.
+
+        Lets overlapping searches reuse a job that was already parsed
+        instead of extracting it from the page again.
+        """
+        cached = await self._job_backend.get(self._generate_job_key(url))
+        if cached:
+            try:
+                return json.loads(cached)
+            except Exception as e:
+                logger.warning(f"Error parsing cached job: {e}")
+                await self._job_backend.delete(self._generate_job_key(url))
+        return None
+
+    async def set_job(self, url: str, job: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Cache a single parsed job keyed by its listing URL"""
+        return await self._job_backend.set(
+            self._generate_job_key(url), json.dumps(job), ttl or self.ttl
+        )
+
     async def invalidate(
         self,
         keywords: List[str],
@@ -280,6 +429,8 @@ class SearchCache:
 
     async def clear_all(self) -> bool:
         """Clear all cached results"""
+        if self._job_backend is not self._backend:
+            await self._job_backend.clear()
         return await self._backend.clear()
 
 
@@ -316,7 +467,7 @@ async def get_cached_or_search(
         cached = await cache.get(keywords, location, filters)
         if cached:
             # Convert cached data back to ScrapedJob objects
-            jobs = [ScrapedJob(**j) for j in cached.jobs]
+            jobs = [ScrapedJob.from_dict_fast(j) for j in cached.jobs]
             return OrchestratorResult(
                 jobs=jobs,
                 total_found=cached.total_found,
@@ -325,6 +476,7 @@ async def get_cached_or_search(
                 sources_partial=[],
                 duration_ms=0,
                 cached=True,
+                cache_key=build_cache_key(keywords, location, filters),
             )
 
     # Perform fresh search
@@ -342,3 +494,31 @@ async def get_cached_or_search(
         )
 
     return result
+
+
+async def iter_cached_or_search(
+    keywords: List[str],
+    location: Optional[str] = None,
+    filters: Optional[Dict] = None,
+    sources: Optional[List[str]] = None,
+    force_refresh: bool = False,
+) -> AsyncGenerator[ScrapedJob, None]:
+    """
+    Yield cached or freshly searched jobs one at a time.
+
+    On a cache hit jobs are rebuilt lazily as the caller iterates, so a
+    streaming consumer can start sending results before the whole list
+    exists. Use get_cached_or_search() when the source status is needed.
+    """
+    if not force_refresh:
+        cached = await get_search_cache().get(keywords, location, filters)
+        if cached:
+            for job in cached.jobs:
+                yield ScrapedJob.from_dict_fast(job)
+            return
+
+    result = await get_cached_or_search(
+        keywords, location, filters, sources, force_refresh=True
+    )
+    for job in result.jobs:
+        yield job
@@ -2,6 +2,7 @@
 
 from typing import List, Optional, AsyncGenerator, Dict
 from datetime import date
+from urllib.parse import urlencode, quote_plus
 import re
 import logging
 import asyncio
@@ -10,6 +11,124 @@ from .base_scraper import BaseScraper, ScrapedJob, register_scraper
 
 logger = logging.getLogger(__name__)
 
+# Search filter lookup tables
+_EMPLOYMENT_TYPES = {
+    "full-time": "FULLTIME",
+    "part-time": "PARTTIME",
+    "contract": "CONTRACTS",
+    "third-party": "THIRD_PARTY",
+}
+_POSTED_BUCKETS = ((1, "ONE"), (3, "THREE"), (7, "SEVEN"), (30, "THIRTY"))
+
+# Extract every search-card field in one CDP round-trip instead of a
+# query_selector/inner_text pair per field. Selectors are tried in order,
+# so exact data-cy matches short-circuit the slow [class*=...] fallbacks.
+CARD_FIELDS_JS = """
+(card) => {
+    const pick = (...sels) => {
+        for (const sel of sels) {
+            const el = card.querySelector(sel);
+            if (el) return el;
+        }
+        return null;
+    };
+    const all = (...sels) => {
+        for (const sel of sels) {
+            const els = card.querySelectorAll(sel);
+            if (els.length) return Array.from(els);
+        }
+        return [];
+    };
+    const text = (...sels) => {
+        const el = pick(...sels);
+        return el ? el.innerText.trim() : null;
+    };
+    const titleEl = pick("[data-cy='card-title-link']", ".card-title-link", "a[class*='title']");
+    return {
+        title: titleEl ? titleEl.innerText.trim() : null,
+        url: titleEl ? titleEl.getAttribute("href") : null,
+        company: text("[data-cy='search-result-company-name']", ".card-company a", "[class*='company']"),
+        location: text("[data-cy='search-result-location']", ".card-location", "[class*='location']"),
+        remote: pick("[data-cy*='remote']", "[class*='remote']") !== null,
+        salary: text("[data-cy='compensation']", ".card-salary", "[class*='salary']"),
+        posted: text("[data-cy='posted-date']", ".card-posted-date", "[class*='posted']"),
+        summary: text("[data-cy='card-summary']", ".card-description", "[class*='summary']"),
+        jobType: text("[data-cy='employment-type']", "[class*='employment']"),
+        skills: all("[data-cy='skill-tag']", ".skill-tag", "[class*='skill']")
+            .slice(0, 10)
+            .map((el) => el.innerText.trim())
+            .filter(Boolean),
+    };
+}
+"""
+
+# Same idea for the job detail page; missing text fields come back as ""
+DETAIL_FIELDS_JS = """
+() => {
+    const pick = (...sels) => {
+        for (const sel of sels) {
+            const el = document.querySelector(sel);
+            if (el) return el;
+        }
+        return null;
+    };
+    const all = (...sels) => {
+        for (const sel of sels) {
+            const els = document.querySelectorAll(sel);
+            if (els.length) return Array.from(els);
+        }
+        return [];
+    };
+    const text = (...sels) => {
+        const el = pick(...sels);
+        return el ? el.innerText.trim() : "";
+    };
+    const logo = pick("img[data-cy='company-logo']", "img[class*='company-logo']");
+    return {
+        title: text("[data-cy='job-title']", ".job-title", "h1[class*='title']"),
+        company: text("[data-cy='company-name-link']", ".company-name", "a[class*='company']"),
+        location: text("[data-cy='location']", ".location", "[class*='job-location']"),
+        remote: pick("[data-cy*='remote']", "[class*='remote-badge']") !== null,
+        salary: text("[data-cy='compensation']", ".compensation", "[class*='salary']"),
+        description: text("[data-cy='jobDescription']", "#jobDescription", "[class*='job-description']"),
+        skills: all("[data-cy='skill-tag']", ".skill-tag", "[class*='techSkill']")
+            .slice(0, 15)
+            .map((el) => el.innerText.trim())
+            .filter(Boolean),
+        jobType: text("[data-cy='employment-type']", "[class*='employment-type']"),
+        posted: text("[data-cy='posted-date']", ".posted-date", "[class*='posted']"),
+        logo: logo ? (logo.getAttribute("src") || "").trim() : "",
+    };
+}
+"""
+
+
+# Scroll the results in-page to trigger lazy loading. Each step waits for
+# either a new batch of cards (MutationObserver) or a jittered timeout, so
+# the whole loop is one round-trip instead of six.
+LAZY_SCROLL_JS = """
+async ([selector, steps]) => {
+    const count = () => document.querySelectorAll(selector).length;
+    for (let i = 0; i < steps; i++) {
+        const before = count();
+        window.scrollBy(0, 300 + Math.random() * 400);
+        await new Promise((resolve) => {
+            const timer = setTimeout(done, 500 + Math.random() * 500);
+            const observer = new MutationObserver(() => {
+                if (count() > before) done();
+            });
+            function done() {
+                clearTimeout(timer);
+                observer.disconnect();
+                resolve();
+            }
+            observer.observe(document.body, { childList: true, subtree: true });
+        });
+    }
+    return count();
+}
+"""
+
 
 @register_scraper("dice")
 class DiceScraper(BaseScraper):
@@ -24,6 +143,24 @@ class DiceScraper(BaseScraper):
 
     RATE_LIMIT_SECONDS = 4
     MAX_PAGES = 8
+    PAGE_CONCURRENCY = 4    # Result pages scraped at once
+    SCROLL_STEPS = 3        # Lazy-load scrolls per result page
+
+    # Exact-match card selector, then the substring fallback if it finds nothing
+    CARD_SELECTOR = "[data-cy='search-card'], .search-card"
+    CARD_FALLBACK_SELECTOR = "[class*='JobCard']"
+
+    # (selector, timeout ms) waited on in order; 15s worst case as before
+    CARD_WAIT_SELECTORS = (
+        ("[data-cy='search-card']", 8000),
+        (".card-title-link", 4000),
+        ("[class*='JobCard']", 3000),
+    )
+    DESCRIPTION_WAIT_SELECTORS = (
+        ("[data-cy='jobDescription']", 8000),
+        ("#jobDescription", 4000),
+        ("[class*='job-description']", 3000),
+    )
 
     @property
     def source_name(self) -> str:
@@ -41,51 +178,38 @@ class DiceScraper(BaseScraper):
         filters: Optional[Dict] = None
     ) -> str:
         """Build Dice search URL"""
-        query = " ".join(keywords)
-        url = f"{self.base_url}/jobs?q={query.replace(' ', '%20')}"
+        params = {"q": " ".join(keywords)}
 
         if location:
             if location.lower() == "remote":
-                url += "&filters.isRemote=true"
+                params["filters.isRemote"] = "true"
             else:
-                url += f"&location={location.replace(' ', '%20')}"
+                params["location"] = location
 
         if page > 1:
-            url += f"&page={page}"
+            params["page"] = page
 
         if filters:
             # Remote filter
             if filters.get("remote"):
-                url += "&filters.isRemote=true"
+                params["filters.isRemote"] = "true"
 
             # Employment type
-            if filters.get("job_type"):
-                type_map = {
-                    "full-time": "FULLTIME",
-                    "part-time": "PARTTIME",
-                    "contract": "CONTRACTS",
-                    "third-party": "THIRD_PARTY"
-                }
-                if filters["job_type"] in type_map:
-                    url += f"&filters.employmentType={type_map[filters['job_type']]}"
+            if filters.get("job_type") in _EMPLOYMENT_TYPES:
+                params["filters.employmentType"] = _EMPLOYMENT_TYPES[filters["job_type"]]
 
             # Posted date
             if filters.get("posted_within_days"):
                 days = filters["posted_within_days"]
-                if days <= 1:
-                    url += "&filters.postedDate=ONE"
-                elif days <= 3:
-                    url += "&filters.postedDate=THREE"
-                elif days <= 7:
-                    url += "&filters.postedDate=SEVEN"
-                elif days <= 30:
-                    url += "&filters.postedDate=THIRTY"
+                bucket = next((value for limit, value in _POSTED_BUCKETS if days <= limit), None)
+                if bucket:
+                    params["filters.postedDate"] = bucket
 
             # Easy apply filter
             if filters.get("easy_apply"):
-                url += "&filters.easyApply=true"
+                params["filters.easyApply"] = "true"
 
-        return url
+        return f"{self.base_url}/jobs?{urlencode(params, quote_via=quote_plus)}"
 
     async def search(
         self,
@@ -93,135 +217,136 @@ class DiceScraper(BaseScraper):
         location: Optional[str] = None,
         filters: Optional[Dict] = None
     ) -> AsyncGenerator[ScrapedJob, None]:
-        """Search Dice for jobs"""
+        """
+        Search Dice for jobs.
+
+        Result pages are scraped concurrently on separate pages of the
+        scraper's browser context; jobs are yielded as workers find them.
+        """
         filters = filters or {}
-        page = 1
 
         logger.info(f"Starting Dice search: keywords={keywords}, location={location}")
 
-        while page <= self.MAX_PAGES:
-            url = self._build_search_url(keywords, location, page, filters)
-
-            logger.debug(f"Scraping Dice page {page}: {url}")
-
-            if not await self._navigate(url):
-                logger.warning(f"Failed to navigate to Dice search page {page}")
-                break
-
-            # Wait for job cards to load
-            await self._wait_for_selector("[data-cy='search-card'], .card-title-link, [class*='JobCard']", timeout=15000)
-
-            # Scroll to load lazy content
-            for _ in range(3):
-                await self._human_scroll()
-                await self._random_delay(0.5, 1.0)
+        queue: asyncio.Queue[Optional[ScrapedJob]] = asyncio.Queue()
+        last_page_seen = asyncio.Event()
+        semaphore = asyncio.Semaphore(self.PAGE_CONCURRENCY)
 
-            # Extract job cards
-            job_cards = await self._query_selector_all(
-                "[data-cy='search-card'], .search-card, [class*='JobCard']"
-            )
-
-            if not job_cards:
-                logger.info(f"No more jobs found on page {page}")
-                break
-
-            jobs_found = 0
-            for card in job_cards:
-                try:
-                    job = await self._parse_job_card(card)
-                    if job:
-                        jobs_found += 1
-                        yield job
-                except Exception as e:
-                    logger.warning(f"Failed to parse Dice job card: {e}")
-                    continue
+        async def scrape_all_pages():
+            try:
+                await asyncio.gather(*[
+                    self._scrape_page(
+                        self._build_search_url(keywords, location, page, filters),
+                        page, queue, last_page_seen, semaphore,
+                    )
+                    for page in range(1, self.MAX_PAGES + 1)
+                ])
+            finally:
+                await queue.put(None)  # Signal completion
 
-            logger.info(f"Found {jobs_found} jobs on Dice page {page}")
+        producer = asyncio.create_task(scrape_all_pages())
 
-            if jobs_found < 10:  # Probably last page
-                break
-
-            page += 1
-            await self._random_delay(2, 4)
+        try:
+            while True:
+                job = await queue.get()
+                if job is None:
+                    break
+                yield job
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    async def _scrape_page(
+        self,
+        url: str,
+        page_number: int,
+        queue: asyncio.Queue,
+        last_page_seen: asyncio.Event,
+        semaphore: asyncio.Semaphore,
+    ):
+        """Scrape one search result page into the queue"""
+        async with semaphore:
+            # An earlier page came back short, so later pages are empty
+            if last_page_seen.is_set():
+                return
+
+            logger.debug(f"Scraping Dice page {page_number}: {url}")
+
+            page = await self._new_page()
+            try:
+                if not await self._navigate(url, page=page):
+                    logger.warning(f"Failed to navigate to Dice search page {page_number}")
+                    last_page_seen.set()
+                    return
+
+                # Wait for job cards to load
+                await self._wait_for_first_selector(self.CARD_WAIT_SELECTORS, page=page)
+
+                # Scroll to load lazy content
+                await page.evaluate(LAZY_SCROLL_JS, [self.CARD_SELECTOR, self.SCROLL_STEPS])
+
+                # Extract job cards
+                job_cards = (
+                    await self._query_selector_all(self.CARD_SELECTOR, page=page)
+                    or await self._query_selector_all(self.CARD_FALLBACK_SELECTOR, page=page)
+                )
+
+                if not job_cards:
+                    logger.info(f"No more jobs found on page {page_number}")
+                    last_page_seen.set()
+                    return
+
+                jobs_found = 0
+                for card in job_cards:
+                    try:
+                        job = await self._parse_job_card(card)
+                        if job:
+                            jobs_found += 1
+                            await queue.put(job)
+                    except Exception as e:
+                        logger.warning(f"Failed to parse Dice job card: {e}")
+                        continue
+
+                logger.info(f"Found {jobs_found} jobs on Dice page {page_number}")
+
+                if jobs_found < 10:  # Probably last page
+                    last_page_seen.set()
+
+            finally:
+                await page.close()
 
     async def _parse_job_card(self, card) -> Optional[ScrapedJob]:
         """Parse a job card element into ScrapedJob (async)"""
         try:
-            # Get job title and URL
-            title_el = await card.query_selector(
-                "[data-cy='card-title-link'], .card-title-link, a[class*='title']"
-            )
-            if not title_el:
-                return None
-
-            title = (await title_el.inner_text()).strip()
-            job_url = await title_el.get_attribute("href")
+            data = await card.evaluate(CARD_FIELDS_JS)
 
-            if not job_url:
+            title = data.get("title")
+            job_url = data.get("url")
+            if not title or not job_url:
                 return None
 
             if not job_url.startswith("http"):
                 job_url = f"{self.base_url}{job_url}"
 
-            # Get company name
-            company_el = await card.query_selector(
-                "[data-cy='search-result-company-name'], .card-company a, [class*='company']"
-            )
-            company_name = (await company_el.inner_text()).strip() if company_el else "Unknown"
+            company_name = data.get("company") or "Unknown"
 
-            # Get location
-            location_el = await card.query_selector(
-                "[data-cy='search-result-location'], .card-location, [class*='location']"
-            )
-            location = (await location_el.inner_text()).strip() if location_el else None
+            location = data.get("location")
             location_type = self._parse_location_type(location) if location else None
-
-            # Remote badge
-            remote_badge = await card.query_selector("[class*='remote'], [data-cy*='remote']")
-            if remote_badge and not location_type:
+            if data.get("remote") and not location_type:
                 location_type = "remote"
 
-            # Get salary if available
-            salary_el = await card.query_selector(
-                "[data-cy='compensation'], .card-salary, [class*='salary']"
-            )
-            salary_text = (await salary_el.inner_text()).strip() if salary_el else None
+            salary_text = data.get("salary")
             salary_min, salary_max, salary_currency = self._parse_salary(salary_text) if salary_text else (None, None, "USD")
 
-            # Get posted date
-            date_el = await card.query_selector(
-                "[data-cy='posted-date'], .card-posted-date, [class*='posted']"
-            )
-            posted_text = (await date_el.inner_text()).strip() if date_el else None
+            posted_text = data.get("posted")
             posted_date = self._parse_posted_date(posted_text) if posted_text else None
 
-            # Description snippet
-            desc_el = await card.query_selector(
-                "[data-cy='card-summary'], .card-description, [class*='summary']"
-            )
-            description = (await desc_el.inner_text()).strip() if desc_el else ""
-
-            # Employment type
-            type_el = await card.query_selector(
-                "[data-cy='employment-type'], [class*='employment']"
-            )
-            job_type = (await type_el.inner_text()).strip().lower() if type_el else None
-
-            # Skills/tags
-            skills_els = await card.query_selector_all(
-                "[data-cy='skill-tag'], .skill-tag, [class*='skill']"
-            )
-            requirements = []
-            for skill_el in skills_els[:10]:  # Limit to 10 skills
-                skill_text = (await skill_el.inner_text()).strip()
-                if skill_text:
-                    requirements.append(skill_text)
+            job_type = data.get("jobType")
 
             return ScrapedJob(
                 url=job_url,
                 title=title,
                 company_name=company_name,
-                description=description,
+                description=data.get("summary") or "",
                 source=self.source_name,
                 location=location,
                 location_type=location_type,
@@ -231,8 +356,8 @@ class DiceScraper(BaseScraper):
                 salary_currency=salary_currency,
                 posted_date=posted_date,
                 posted_text=posted_text,
-                job_type=job_type,
-                requirements=requirements,
+                job_type=job_type.lower() if job_type else None,
+                requirements=data.get("skills") or [],
             )
 
         except Exception as e:
@@ -247,78 +372,36 @@ class DiceScraper(BaseScraper):
             return None
 
         # Wait for job description to load
-        await self._wait_for_selector(
-            "[data-cy='jobDescription'], #jobDescription, [class*='job-description']",
-            timeout=15000
-        )
+        await self._wait_for_first_selector(self.DESCRIPTION_WAIT_SELECTORS)
 
         try:
-            # Title
-            title = await self._get_text(
-                "[data-cy='job-title'], h1[class*='title'], .job-title"
-            )
-
-            # Company
-            company_name = await self._get_text(
-                "[data-cy='company-name-link'], a[class*='company'], .company-name"
-            )
+            data = await self._page.evaluate(DETAIL_FIELDS_JS)
 
-            # Location
-            location = await self._get_text(
-                "[data-cy='location'], [class*='job-location'], .location"
-            )
+            location = data["location"]
             location_type = self._parse_location_type(location)
-
-            # Remote check
-            remote_el = await self._query_selector("[class*='remote-badge'], [data-cy*='remote']")
-            if remote_el and not location_type:
+            if data["remote"] and not location_type:
                 location_type = "remote"
 
-            # Salary
-            salary_text = await self._get_text(
-                "[data-cy='compensation'], [class*='salary'], .compensation"
-            )
+            salary_text = data["salary"]
             salary_min, salary_max, salary_currency = self._parse_salary(salary_text)
 
-            # Full description
-            description = await self._get_text(
-                "[data-cy='jobDescription'], #jobDescription, [class*='job-description']"
-            )
-            description = self._clean_description(description)
+            description = self._clean_description(data["description"])
 
-            # Requirements/skills
+            # Requirements from the description plus the page's skill tags
             requirements = self._extract_requirements(description)
-
-            # Additional skill tags
-            skill_tags = await self._query_selector_all(
-                "[data-cy='skill-tag'], .skill-tag, [class*='techSkill']"
-            )
-            for tag in skill_tags[:15]:
-                skill = (await tag.inner_text()).strip()
-                if skill and skill not in requirements:
+            for skill in data["skills"]:
+                if skill not in requirements:
                     requirements.append(skill)
 
-            # Employment type
-            job_type_el = await self._query_selector(
-                "[data-cy='employment-type'], [class*='employment-type']"
-            )
-            job_type = (await job_type_el.inner_text()).strip().lower() if job_type_el else None
+            job_type = data["jobType"].lower() or None
 
-            # Posted date
-            posted_text = await self._get_text(
-                "[data-cy='posted-date'], [class*='posted'], .posted-date"
-            )
+            posted_text = data["posted"]
             posted_date = self._parse_posted_date(posted_text) if posted_text else None
 
-            # Company logo
-            company_logo = await self._get_attribute(
-                "img[data-cy='company-logo'], img[class*='company-logo']", "src"
-            )
-
             return ScrapedJob(
                 url=url,
-                title=title,
-                company_name=company_name,
+                title=data["title"],
+                company_name=data["company"],
                 description=description,
                 source=self.source_name,
                 location=location,
@@ -331,7 +414,7 @@ class DiceScraper(BaseScraper):
                 posted_date=posted_date,
                 posted_text=posted_text,
                 job_type=job_type,
-                company_logo=company_logo,
+                company_logo=data["logo"],
             )
 
         except Exception as e:
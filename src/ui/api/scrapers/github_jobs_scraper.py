@@ -11,14 +11,34 @@ Sources:
 - jobright-ai repos
 """
 
+import asyncio
 import httpx
 import json
 import logging
-from typing import List, Optional, AsyncGenerator, Dict, Any
+import time
+from typing import List, Optional, AsyncGenerator, Dict, Any, Tuple
 from datetime import datetime, date
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
 
-from .base_scraper import BaseScraper, ScrapedJob, register_scraper
+from .base_scraper import BaseScraper, ScrapedJob, keyword_matcher, register_scraper
+
+try:
+    import orjson  # Much faster on the multi-MB listings arrays
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Incremental parsing while the body is still downloading
+except ImportError:
+    ijson = None
+
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2 support
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +75,112 @@ GITHUB_JOB_SOURCES = [
 ]
 
 
+class _AIMDLimiter:
+    """
+    Concurrency limiter with additive-increase / multiplicative-decrease.
+
+    Each completed request reports its latency and status: healthy fast
+    responses raise the limit by `increase`, while 429/5xx, timeouts or
+    slow responses multiply it by `decrease`.
+    """
+
+    def __init__(
+        self,
+        initial: float = 2.0,
+        minimum: float = 1.0,
+        maximum: float = 8.0,
+        target_latency: float = 1.0,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+    ):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.increase = increase
+        self.decrease = decrease
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def record(self, latency: float, status_code: Optional[int]):
+        """Adjust the limit from one request's outcome (None = timed out)"""
+        overloaded = (
+            status_code is None
+            or status_code == 429
+            or status_code >= 500
+            or latency > self.target_latency
+        )
+        if overloaded:
+            self.limit = max(self.minimum, self.limit * self.decrease)
+        else:
+            self.limit = min(self.maximum, self.limit + self.increase)
+
+
+# Shared by every GitHub-backed scraper, since they all hit the same CDN
+_github_limiter = _AIMDLimiter()
+
+@dataclass
+class _ListingMemos:
+    """
+    Values derived from a listings array, keyed by listing index.
+
+    Kept beside the listings rather than written onto them, so raw_data
+    stays the feed's own JSON.
+    """
+    search_text: Dict[int, str] = field(default_factory=dict)
+    posted_date: Dict[int, Optional[date]] = field(default_factory=dict)
+
+
+# Parsed listings and conditional-GET validators per URL, shared by all
+# scraper instances: url -> (fetched_at, etag, last_modified, listings, memos)
+_conditional_cache: Dict[
+    str, Tuple[float, Optional[str], Optional[str], List[Dict[str, Any]], _ListingMemos]
+] = {}
+
+# One in-flight download per URL; concurrent callers wait for its result
+_fetch_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+# One client for every GitHub-backed scraper; all sources live on the same
+# host, so their fetches share a connection (multiplexed with HTTP/2)
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get or create the process-wide GitHub HTTP client"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                "Accept": "application/json",
+            },
+        )
+    return _shared_client
+
+
+async def close_github_client():
+    """Close the shared GitHub HTTP client"""
+    global _shared_client
+    if _shared_client:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
 @register_scraper("github")
 class GitHubJobsScraper(BaseScraper):
     """
@@ -66,6 +192,7 @@ class GitHubJobsScraper(BaseScraper):
     """
 
     RATE_LIMIT_SECONDS = 1  # GitHub API is fast
+    LISTINGS_TTL_SECONDS = 300  # Reuse fetched listings without revalidating
 
     @property
     def source_name(self) -> str:
@@ -81,22 +208,14 @@ class GitHubJobsScraper(BaseScraper):
         self._client: Optional[httpx.AsyncClient] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
+        """Get the HTTP client (the shared one unless already set)"""
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=30.0,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Accept": "application/json",
-                }
-            )
+            self._client = _get_shared_client()
         return self._client
 
     async def _close_client(self):
-        """Close HTTP client"""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Release the HTTP client; the shared client stays open"""
+        self._client = None
 
     async def __aenter__(self):
         await self._get_client()
@@ -105,27 +224,181 @@ class GitHubJobsScraper(BaseScraper):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self._close_client()
 
-    async def _fetch_json(self, source: GitHubJobSource) -> List[Dict[str, Any]]:
-        """Fetch job listings JSON from GitHub"""
+    async def _fetch_json(self, source: GitHubJobSource) -> Tuple[List[Dict[str, Any]], _ListingMemos]:
+        """
+        Fetch job listings JSON from GitHub, with the memos derived from them.
+
+        The github, simplify and jobright scrapers read the same files, so
+        listings fetched within LISTINGS_TTL_SECONDS are reused without a
+        request, and concurrent callers share a single download.
+        """
         url = f"{self.base_url}/{source.owner}/{source.repo}/{source.branch}/{source.json_path}"
 
-        try:
-            client = await self._get_client()
-            response = await client.get(url)
+        async with _fetch_locks[url]:
+            cached = _conditional_cache.get(url)
+            if cached and time.monotonic() - cached[0] < self.LISTINGS_TTL_SECONDS:
+                logger.info(f"Reusing {len(cached[3])} recently fetched jobs from {source.name}")
+                return cached[3], cached[4]
+            return await self._download_listings(source, url, cached)
 
-            if response.status_code == 200:
-                data = response.json()
-                logger.info(f"Fetched {len(data)} jobs from {source.name}")
-                return data
-            else:
-                logger.warning(f"Failed to fetch {source.name}: HTTP {response.status_code}")
-                return []
+    async def _download_listings(
+        self,
+        source: GitHubJobSource,
+        url: str,
+        cached: Optional[Tuple[float, Optional[str], Optional[str], List[Dict[str, Any]], _ListingMemos]],
+    ) -> Tuple[List[Dict[str, Any]], _ListingMemos]:
+        """Download listings, revalidating against a stale cache entry if any"""
+        headers = {}
+        if cached:
+            _, etag, last_modified, _, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        client = await self._get_client()
+
+        for attempt in range(self.MAX_RETRIES):
+            retry_after = None
+            try:
+                async with _github_limiter:
+                    start = time.monotonic()
+                    async with client.stream("GET", url, headers=headers) as response:
+                        _github_limiter.record(time.monotonic() - start, response.status_code)
+
+                        if response.status_code == 304 and cached:
+                            logger.info(f"{source.name} unchanged, reusing {len(cached[3])} cached jobs")
+                            _conditional_cache[url] = (time.monotonic(), *cached[1:])
+                            return cached[3], cached[4]
+                        elif response.status_code == 200:
+                            data = await self._read_listings(response)
+                            memos = _ListingMemos()
+                            _conditional_cache[url] = (
+                                time.monotonic(),
+                                response.headers.get("etag"),
+                                response.headers.get("last-modified"),
+                                data,
+                                memos,
+                            )
+                            logger.info(f"Fetched {len(data)} jobs from {source.name}")
+                            return data, memos
+                        elif response.status_code == 429 or response.status_code >= 500:
+                            retry_after = self._retry_after(response, attempt)
+                            logger.warning(
+                                f"{source.name} returned HTTP {response.status_code}, "
+                                f"retrying in {retry_after:.1f}s"
+                            )
+                        else:
+                            logger.warning(f"Failed to fetch {source.name}: HTTP {response.status_code}")
+                            return [], _ListingMemos()
+
+                    # Back off while still holding the slot so others slow down too
+                    await asyncio.sleep(retry_after)
+
+            except httpx.TimeoutException:
+                _github_limiter.record(self.TIMEOUT_SECONDS, None)
+                logger.warning(f"Timeout fetching {source.name} (attempt {attempt + 1})")
+
+            except httpx.HTTPError as e:
+                logger.error(f"Error fetching {source.name}: {e}")
+                return [], _ListingMemos()
+
+            except Exception as e:
+                logger.error(f"Error parsing {source.name}: {e}")
+                return [], _ListingMemos()
+
+        logger.warning(f"Giving up on {source.name} after {self.MAX_RETRIES} attempts")
+        return [], _ListingMemos()
+
+    def _retry_after(self, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait from a Retry-After header, else exponential backoff"""
+        value = response.headers.get("retry-after")
+        if value:
+            try:
+                return min(float(value), 60.0)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(value)
+                    return min(max((retry_at - datetime.now(retry_at.tzinfo)).total_seconds(), 0.0), 60.0)
+                except (TypeError, ValueError):
+                    pass
+        return float(2 ** attempt)
 
-        except Exception as e:
-            logger.error(f"Error fetching {source.name}: {e}")
-            return []
+    async def _read_listings(self, response: httpx.Response) -> List[Dict[str, Any]]:
+        """
+        Decode a streamed listings array.
 
-    def _parse_listing(self, item: Dict[str, Any], source: GitHubJobSource) -> Optional[ScrapedJob]:
+        With ijson, listings are parsed chunk by chunk as they arrive, so
+        the raw multi-MB body is never buffered alongside the decoded list.
+        """
+        if ijson is None:
+            body = await response.aread()
+            return orjson.loads(body) if orjson else json.loads(body)
+
+        listings: List[Dict[str, Any]] = []
+        parsed = ijson.sendable_list()
+        parser = ijson.items_coro(parsed, "item", use_float=True)
+        async for chunk in response.aiter_bytes():
+            parser.send(chunk)
+            listings.extend(parsed)
+            del parsed[:]
+        parser.close()
+        listings.extend(parsed)
+        return listings
+
+    @staticmethod
+    def _listing_search_text(
+        item: Dict[str, Any],
+        source: GitHubJobSource,
+        memos: _ListingMemos,
+        index: int,
+    ) -> str:
+        """
+        Lowercased text for keyword matching, built once per listing.
+
+        Listings are reused across searches (see _conditional_cache), so
+        the text is memoized in the memos cached alongside them.
+        """
+        search_text = memos.search_text.get(index)
+        if search_text is None:
+            company = item.get("company_name", "")
+            search_text = " ".join(filter(None, [
+                item.get("title"),
+                company,
+                f"{source.job_type.replace('_', ' ').title()} position at {company}",
+                ", ".join(item.get("locations") or []),
+                *(item.get("terms") or []),
+                *(item.get("categories") or []),
+                item.get("role"),
+                item.get("season"),
+            ])).lower()
+            memos.search_text[index] = search_text
+        return search_text
+
+    @staticmethod
+    def _listing_posted_date(item: Dict[str, Any], memos: _ListingMemos, index: int) -> Optional[date]:
+        """Posted date from the listing's Unix timestamp, memoized like the search text"""
+        if index in memos.posted_date:
+            return memos.posted_date[index]
+
+        posted_date = None
+        date_posted = item.get("date_posted")
+        if date_posted:
+            try:
+                posted_date = datetime.fromtimestamp(date_posted).date()
+            except (ValueError, TypeError, OverflowError, OSError):
+                pass
+
+        memos.posted_date[index] = posted_date
+        return posted_date
+
+    def _parse_listing(
+        self,
+        item: Dict[str, Any],
+        source: GitHubJobSource,
+        memos: _ListingMemos,
+        index: int,
+    ) -> Optional[ScrapedJob]:
         """Parse a single listing from JSON"""
         try:
             # Skip inactive listings
@@ -157,21 +430,15 @@ class GitHubJobsScraper(BaseScraper):
                 else:
                     location_type = "onsite"
 
-            # Parse date
-            posted_date = None
-            date_posted = item.get("date_posted")
-            if date_posted:
-                try:
-                    # Unix timestamp
-                    posted_date = datetime.fromtimestamp(date_posted).date()
-                except (ValueError, TypeError):
-                    pass
+            posted_date = self._listing_posted_date(item, memos, index)
+
+            description = f"{source.job_type.replace('_', ' ').title()} position at {company}"
 
             return ScrapedJob(
                 url=url,
                 title=title,
                 company_name=company,
-                description=f"{source.job_type.replace('_', ' ').title()} position at {company}",
+                description=description,
                 source=self.source_name,  # Use scraper's source_name (github, simplify, or jobright)
                 location=location,
                 location_type=location_type,
@@ -201,45 +468,35 @@ class GitHubJobsScraper(BaseScraper):
         filters = filters or {}
         job_type_filter = filters.get("job_type")
         keywords_lower = [k.lower() for k in keywords] if keywords else []
+        matches_keywords = keyword_matcher(keywords_lower)
         location_lower = location.lower() if location else None
 
-        for source in self.sources:
-            # Filter by job type if specified
-            if job_type_filter and source.job_type != job_type_filter:
-                continue
-
-            logger.info(f"Fetching from {source.name}")
-            listings = await self._fetch_json(source)
+        # Filter by job type if specified
+        sources = [
+            s for s in self.sources
+            if not job_type_filter or s.job_type == job_type_filter
+        ]
+
+        # Fetch all sources concurrently; _fetch_json already returns no listings on error
+        logger.info(f"Fetching from {', '.join(s.name for s in sources)}")
+        all_listings = await asyncio.gather(*[self._fetch_json(s) for s in sources])
+
+        for source, (listings, memos) in zip(sources, all_listings):
+            for index, item in enumerate(listings):
+                # Apply keyword filter before parsing - title and company
+                # decide most listings, the full text covers tags, roles and
+                # locations
+                if keywords_lower:
+                    quick = f"{item.get('title', '')}\n{item.get('company_name', '')}".lower()
+                    if not matches_keywords(quick) and not matches_keywords(
+                        self._listing_search_text(item, source, memos, index)
+                    ):
+                        continue
 
-            for item in listings:
-                job = self._parse_listing(item, source)
+                job = self._parse_listing(item, source, memos, index)
                 if not job:
                     continue
 
-                # Apply keyword filter - search in title, company, tags, roles, and locations
-                if keywords_lower:
-                    # Build searchable text from multiple fields
-                    searchable_parts = [
-                        job.title.lower(),
-                        job.company_name.lower(),
-                        job.description.lower() if job.description else "",
-                        job.location.lower() if job.location else "",
-                    ]
-                    # Add raw data fields that might contain relevant info
-                    raw = job.raw_data or {}
-                    if raw.get("terms"):
-                        searchable_parts.extend([t.lower() for t in raw.get("terms", [])])
-                    if raw.get("categories"):
-                        searchable_parts.extend([c.lower() for c in raw.get("categories", [])])
-                    if raw.get("role"):
-                        searchable_parts.append(raw.get("role", "").lower())
-                    if raw.get("season"):
-                        searchable_parts.append(raw.get("season", "").lower())
-
-                    searchable_text = " ".join(searchable_parts)
-                    if not any(k in searchable_text for k in keywords_lower):
-                        continue
-
                 # Apply location filter
                 if location_lower:
                     if location_lower == "remote":
@@ -19,229 +19,277 @@ Sources:
 - https://www.stationx.net/google-dorks-cheat-sheet/
 """
 
+import asyncio
 import httpx
 import logging
 import re
-from typing import List, Optional, AsyncGenerator, Dict, Any
+import time
+from collections import OrderedDict
+from typing import List, Optional, AsyncGenerator, Dict, Any, Tuple
 from datetime import datetime, date, timedelta
-from urllib.parse import urlencode, quote_plus
-from dataclasses import dataclass
+from urllib.parse import quote_plus, unquote
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from bs4 import BeautifulSoup
 
 from .base_scraper import BaseScraper, ScrapedJob, register_scraper
 
+try:
+    from selectolax.lexbor import LexborHTMLParser  # Lexbor C engine, much faster than bs4
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401 - C parser backend for BeautifulSoup
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2 support
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import ahocorasick_rs  # One pass over the keywords for every category term
+except ImportError:
+    ahocorasick_rs = None
+
 logger = logging.getLogger(__name__)
 
 
 # ============== DORK TEMPLATES ==============
 # Each template contains real Google dork patterns
 
-DORK_QUERIES = {
+@dataclass(frozen=True, slots=True)
+class DorkQuery:
+    """A predefined dork query"""
+    name: str
+    category: str
+    query: str
+    description: str
+
+    # Derived once per template
+    wrapped: str = field(init=False)  # Parenthesized, ready for the user's terms
+    query_preview: str = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "wrapped", f"({self.query})")
+        object.__setattr__(
+            self,
+            "query_preview",
+            self.query[:80] + "..." if len(self.query) > 80 else self.query,
+        )
+
+
+DORK_QUERIES: Dict[str, DorkQuery] = {
     # === CYBERSECURITY DORKS ===
-    "cyber_greenhouse": {
-        "name": "Cybersecurity - Greenhouse/Lever",
-        "category": "cyber",
-        "query": '(site:greenhouse.io OR site:lever.co) ("security engineer" OR "SOC analyst" OR "penetration tester" OR "cybersecurity") "apply"',
-        "description": "Security roles on top ATS platforms"
-    },
-    "cyber_bigtech": {
-        "name": "Cybersecurity - Big Tech",
-        "category": "cyber",
-        "query": '(site:careers.google.com OR site:amazon.jobs OR site:careers.microsoft.com) intitle:security (engineer OR analyst OR architect)',
-        "description": "Security positions at FAANG companies"
-    },
-    "cyber_vendors": {
-        "name": "Cybersecurity - Security Vendors",
-        "category": "cyber",
-        "query": '(site:crowdstrike.com OR site:paloaltonetworks.com OR site:cisco.com) inurl:careers (security OR threat OR SOC)',
-        "description": "Jobs at security product companies"
-    },
-    "cyber_remote": {
-        "name": "Cybersecurity - Remote",
-        "category": "cyber",
-        "query": 'intitle:"security engineer" OR intitle:"SOC analyst" "remote" "apply now" -expired',
-        "description": "Remote security positions"
-    },
-    "cyber_pdf": {
-        "name": "Cybersecurity - PDF Job Descriptions",
-        "category": "cyber",
-        "query": 'filetype:pdf ("security analyst" OR "penetration tester") "job description" "requirements"',
-        "description": "Detailed job descriptions in PDF format"
-    },
+    "cyber_greenhouse": DorkQuery(
+        name="Cybersecurity - Greenhouse/Lever",
+        category="cyber",
+        query='(site:greenhouse.io OR site:lever.co) ("security engineer" OR "SOC analyst" OR "penetration tester" OR "cybersecurity") "apply"',
+        description="Security roles on top ATS platforms",
+    ),
+    "cyber_bigtech": DorkQuery(
+        name="Cybersecurity - Big Tech",
+        category="cyber",
+        query='(site:careers.google.com OR site:amazon.jobs OR site:careers.microsoft.com) intitle:security (engineer OR analyst OR architect)',
+        description="Security positions at FAANG companies",
+    ),
+    "cyber_vendors": DorkQuery(
+        name="Cybersecurity - Security Vendors",
+        category="cyber",
+        query='(site:crowdstrike.com OR site:paloaltonetworks.com OR site:cisco.com) inurl:careers (security OR threat OR SOC)',
+        description="Jobs at security product companies",
+    ),
+    "cyber_remote": DorkQuery(
+        name="Cybersecurity - Remote",
+        category="cyber",
+        query='intitle:"security engineer" OR intitle:"SOC analyst" "remote" "apply now" -expired',
+        description="Remote security positions",
+    ),
+    "cyber_pdf": DorkQuery(
+        name="Cybersecurity - PDF Job Descriptions",
+        category="cyber",
+        query='filetype:pdf ("security analyst" OR "penetration tester") "job description" "requirements"',
+        description="Detailed job descriptions in PDF format",
+    ),
 
     # === SOFTWARE ENGINEERING DORKS ===
-    "swe_ats": {
-        "name": "Software Engineer - ATS Platforms",
-        "category": "swe",
-        "query": '(site:greenhouse.io OR site:lever.co OR site:ashbyhq.com) ("software engineer" OR "developer") "apply"',
-        "description": "SWE roles across ATS platforms"
-    },
-    "swe_remote": {
-        "name": "Software Engineer - Remote",
-        "category": "swe",
-        "query": '(site:lever.co OR site:greenhouse.io) (developer OR engineer) "remote" ("react" OR "python" OR "node")',
-        "description": "Remote developer positions"
-    },
-    "swe_fullstack": {
-        "name": "Full Stack Developer",
-        "category": "swe",
-        "query": 'intitle:"full stack" (developer OR engineer) (site:greenhouse.io OR site:lever.co) "apply"',
-        "description": "Full stack positions"
-    },
-    "swe_backend": {
-        "name": "Backend Engineer",
-        "category": "swe",
-        "query": '(site:greenhouse.io OR site:lever.co) intitle:"backend engineer" ("python" OR "java" OR "golang")',
-        "description": "Backend engineering roles"
-    },
-    "swe_frontend": {
-        "name": "Frontend Developer",
-        "category": "swe",
-        "query": '(site:greenhouse.io OR site:lever.co) ("frontend" OR "front-end") (developer OR engineer) ("react" OR "vue" OR "angular")',
-        "description": "Frontend development positions"
-    },
+    "swe_ats": DorkQuery(
+        name="Software Engineer - ATS Platforms",
+        category="swe",
+        query='(site:greenhouse.io OR site:lever.co OR site:ashbyhq.com) ("software engineer" OR "developer") "apply"',
+        description="SWE roles across ATS platforms",
+    ),
+    "swe_remote": DorkQuery(
+        name="Software Engineer - Remote",
+        category="swe",
+        query='(site:lever.co OR site:greenhouse.io) (developer OR engineer) "remote" ("react" OR "python" OR "node")',
+        description="Remote developer positions",
+    ),
+    "swe_fullstack": DorkQuery(
+        name="Full Stack Developer",
+        category="swe",
+        query='intitle:"full stack" (developer OR engineer) (site:greenhouse.io OR site:lever.co) "apply"',
+        description="Full stack positions",
+    ),
+    "swe_backend": DorkQuery(
+        name="Backend Engineer",
+        category="swe",
+        query='(site:greenhouse.io OR site:lever.co) intitle:"backend engineer" ("python" OR "java" OR "golang")',
+        description="Backend engineering roles",
+    ),
+    "swe_frontend": DorkQuery(
+        name="Frontend Developer",
+        category="swe",
+        query='(site:greenhouse.io OR site:lever.co) ("frontend" OR "front-end") (developer OR engineer) ("react" OR "vue" OR "angular")',
+        description="Frontend development positions",
+    ),
 
     # === DATA & ML DORKS ===
-    "data_ml": {
-        "name": "ML Engineer - ATS",
-        "category": "data",
-        "query": '(site:greenhouse.io OR site:lever.co) ("machine learning" OR "ML engineer" OR "data scientist") "apply"',
-        "description": "ML and data science roles"
-    },
-    "data_ai_companies": {
-        "name": "AI Companies",
-        "category": "data",
-        "query": '(site:openai.com OR site:anthropic.com OR site:deepmind.com) inurl:careers ("engineer" OR "scientist")',
-        "description": "AI company positions"
-    },
-    "data_remote": {
-        "name": "Data Science - Remote",
-        "category": "data",
-        "query": 'intitle:"data scientist" OR intitle:"ML engineer" "remote" "python" "apply"',
-        "description": "Remote data science positions"
-    },
+    "data_ml": DorkQuery(
+        name="ML Engineer - ATS",
+        category="data",
+        query='(site:greenhouse.io OR site:lever.co) ("machine learning" OR "ML engineer" OR "data scientist") "apply"',
+        description="ML and data science roles",
+    ),
+    "data_ai_companies": DorkQuery(
+        name="AI Companies",
+        category="data",
+        query='(site:openai.com OR site:anthropic.com OR site:deepmind.com) inurl:careers ("engineer" OR "scientist")',
+        description="AI company positions",
+    ),
+    "data_remote": DorkQuery(
+        name="Data Science - Remote",
+        category="data",
+        query='intitle:"data scientist" OR intitle:"ML engineer" "remote" "python" "apply"',
+        description="Remote data science positions",
+    ),
 
     # === DEVOPS & SRE DORKS ===
-    "devops_ats": {
-        "name": "DevOps - ATS Platforms",
-        "category": "devops",
-        "query": '(site:greenhouse.io OR site:lever.co) ("DevOps" OR "SRE" OR "site reliability") "apply"',
-        "description": "DevOps/SRE on ATS platforms"
-    },
-    "devops_cloud": {
-        "name": "Cloud Engineer",
-        "category": "devops",
-        "query": '(site:greenhouse.io OR site:lever.co) ("cloud engineer" OR "platform engineer") ("AWS" OR "GCP" OR "Azure")',
-        "description": "Cloud and platform engineering"
-    },
-    "devops_kubernetes": {
-        "name": "Kubernetes/Docker",
-        "category": "devops",
-        "query": 'intitle:"DevOps" OR intitle:"platform engineer" ("kubernetes" OR "docker" OR "terraform") "apply"',
-        "description": "Container/K8s focused roles"
-    },
+    "devops_ats": DorkQuery(
+        name="DevOps - ATS Platforms",
+        category="devops",
+        query='(site:greenhouse.io OR site:lever.co) ("DevOps" OR "SRE" OR "site reliability") "apply"',
+        description="DevOps/SRE on ATS platforms",
+    ),
+    "devops_cloud": DorkQuery(
+        name="Cloud Engineer",
+        category="devops",
+        query='(site:greenhouse.io OR site:lever.co) ("cloud engineer" OR "platform engineer") ("AWS" OR "GCP" OR "Azure")',
+        description="Cloud and platform engineering",
+    ),
+    "devops_kubernetes": DorkQuery(
+        name="Kubernetes/Docker",
+        category="devops",
+        query='intitle:"DevOps" OR intitle:"platform engineer" ("kubernetes" OR "docker" OR "terraform") "apply"',
+        description="Container/K8s focused roles",
+    ),
 
     # === STARTUP DORKS ===
-    "startup_yc": {
-        "name": "Y Combinator Startups",
-        "category": "startup",
-        "query": 'site:workatastartup.com OR (site:ycombinator.com inurl:companies) (engineer OR developer)',
-        "description": "YC-backed company positions"
-    },
-    "startup_angel": {
-        "name": "AngelList/Wellfound",
-        "category": "startup",
-        "query": '(site:angel.co OR site:wellfound.com) inurl:jobs ("software" OR "engineer" OR "developer")',
-        "description": "Startup jobs on Wellfound"
-    },
-    "startup_early": {
-        "name": "Early Stage Startups",
-        "category": "startup",
-        "query": 'intitle:"founding engineer" OR intitle:"first engineer" (site:greenhouse.io OR site:lever.co) "equity"',
-        "description": "Early employee positions"
-    },
+    "startup_yc": DorkQuery(
+        name="Y Combinator Startups",
+        category="startup",
+        query='site:workatastartup.com OR (site:ycombinator.com inurl:companies) (engineer OR developer)',
+        description="YC-backed company positions",
+    ),
+    "startup_angel": DorkQuery(
+        name="AngelList/Wellfound",
+        category="startup",
+        query='(site:angel.co OR site:wellfound.com) inurl:jobs ("software" OR "engineer" OR "developer")',
+        description="Startup jobs on Wellfound",
+    ),
+    "startup_early": DorkQuery(
+        name="Early Stage Startups",
+        category="startup",
+        query='intitle:"founding engineer" OR intitle:"first engineer" (site:greenhouse.io OR site:lever.co) "equity"',
+        description="Early employee positions",
+    ),
 
     # === REMOTE-FIRST DORKS ===
-    "remote_boards": {
-        "name": "Remote Job Boards",
-        "category": "remote",
-        "query": '(site:weworkremotely.com OR site:remoteok.com OR site:remote.co) (developer OR engineer)',
-        "description": "Remote-first job boards"
-    },
-    "remote_any": {
-        "name": "Any Remote Tech Job",
-        "category": "remote",
-        "query": 'intitle:"remote" (developer OR engineer OR "software") "fully remote" "apply" -hybrid',
-        "description": "Fully remote positions"
-    },
+    "remote_boards": DorkQuery(
+        name="Remote Job Boards",
+        category="remote",
+        query='(site:weworkremotely.com OR site:remoteok.com OR site:remote.co) (developer OR engineer)',
+        description="Remote-first job boards",
+    ),
+    "remote_any": DorkQuery(
+        name="Any Remote Tech Job",
+        category="remote",
+        query='intitle:"remote" (developer OR engineer OR "software") "fully remote" "apply" -hybrid',
+        description="Fully remote positions",
+    ),
 
     # === BIG TECH DORKS ===
-    "bigtech_faang": {
-        "name": "FAANG Companies",
-        "category": "bigtech",
-        "query": '(site:careers.google.com OR site:amazon.jobs OR site:metacareers.com OR site:jobs.apple.com OR site:jobs.netflix.com) (engineer OR developer)',
-        "description": "FAANG job postings"
-    },
-    "bigtech_msft": {
-        "name": "Microsoft",
-        "category": "bigtech",
-        "query": 'site:careers.microsoft.com (engineer OR developer OR "program manager")',
-        "description": "Microsoft positions"
-    },
-    "bigtech_nvidia": {
-        "name": "NVIDIA & AI Hardware",
-        "category": "bigtech",
-        "query": '(site:nvidia.com OR site:amd.com OR site:intel.com) inurl:careers (engineer OR scientist)',
-        "description": "AI hardware companies"
-    },
+    "bigtech_faang": DorkQuery(
+        name="FAANG Companies",
+        category="bigtech",
+        query='(site:careers.google.com OR site:amazon.jobs OR site:metacareers.com OR site:jobs.apple.com OR site:jobs.netflix.com) (engineer OR developer)',
+        description="FAANG job postings",
+    ),
+    "bigtech_msft": DorkQuery(
+        name="Microsoft",
+        category="bigtech",
+        query='site:careers.microsoft.com (engineer OR developer OR "program manager")',
+        description="Microsoft positions",
+    ),
+    "bigtech_nvidia": DorkQuery(
+        name="NVIDIA & AI Hardware",
+        category="bigtech",
+        query='(site:nvidia.com OR site:amd.com OR site:intel.com) inurl:careers (engineer OR scientist)',
+        description="AI hardware companies",
+    ),
 
     # === GENERAL ATS DORKS ===
-    "ats_all": {
-        "name": "All ATS Platforms",
-        "category": "ats",
-        "query": '(site:greenhouse.io OR site:lever.co OR site:workable.com OR site:ashbyhq.com OR site:smartrecruiters.com) "apply"',
-        "description": "Search across all major ATS"
-    },
-    "ats_workday": {
-        "name": "Workday ATS",
-        "category": "ats",
-        "query": 'site:myworkdayjobs.com (engineer OR developer OR analyst) "apply"',
-        "description": "Companies using Workday"
-    },
+    "ats_all": DorkQuery(
+        name="All ATS Platforms",
+        category="ats",
+        query='(site:greenhouse.io OR site:lever.co OR site:workable.com OR site:ashbyhq.com OR site:smartrecruiters.com) "apply"',
+        description="Search across all major ATS",
+    ),
+    "ats_workday": DorkQuery(
+        name="Workday ATS",
+        category="ats",
+        query='site:myworkdayjobs.com (engineer OR developer OR analyst) "apply"',
+        description="Companies using Workday",
+    ),
 
     # === GOVERNMENT & EDU DORKS ===
-    "gov_federal": {
-        "name": "Government Tech Jobs",
-        "category": "gov",
-        "query": 'site:.gov intitle:"job opening" (IT OR technology OR cyber OR developer) filetype:pdf',
-        "description": "Federal tech positions"
-    },
-    "edu_university": {
-        "name": "University Tech Jobs",
-        "category": "edu",
-        "query": 'site:.edu inurl:careers (developer OR engineer OR "IT specialist") "apply"',
-        "description": "University tech positions"
-    },
+    "gov_federal": DorkQuery(
+        name="Government Tech Jobs",
+        category="gov",
+        query='site:.gov intitle:"job opening" (IT OR technology OR cyber OR developer) filetype:pdf',
+        description="Federal tech positions",
+    ),
+    "edu_university": DorkQuery(
+        name="University Tech Jobs",
+        category="edu",
+        query='site:.edu inurl:careers (developer OR engineer OR "IT specialist") "apply"',
+        description="University tech positions",
+    ),
 
     # === SPECIALTY DORKS ===
-    "pdf_jd": {
-        "name": "PDF Job Descriptions",
-        "category": "specialty",
-        "query": 'filetype:pdf "job description" (engineer OR developer) "requirements" "qualifications"',
-        "description": "Detailed JDs in PDF format"
-    },
-    "spreadsheet_jobs": {
-        "name": "Spreadsheet Job Lists",
-        "category": "specialty",
-        "query": 'filetype:xls OR filetype:xlsx inurl:"jobs" OR inurl:"openings" (tech OR engineer)',
-        "description": "Job listings in spreadsheets"
-    },
-    "hiring_now": {
-        "name": "Actively Hiring",
-        "category": "specialty",
-        "query": 'intitle:"we are hiring" OR intitle:"now hiring" (developer OR engineer) "apply"',
-        "description": "Companies actively hiring"
-    },
+    "pdf_jd": DorkQuery(
+        name="PDF Job Descriptions",
+        category="specialty",
+        query='filetype:pdf "job description" (engineer OR developer) "requirements" "qualifications"',
+        description="Detailed JDs in PDF format",
+    ),
+    "spreadsheet_jobs": DorkQuery(
+        name="Spreadsheet Job Lists",
+        category="specialty",
+        query='filetype:xls OR filetype:xlsx inurl:"jobs" OR inurl:"openings" (tech OR engineer)',
+        description="Job listings in spreadsheets",
+    ),
+    "hiring_now": DorkQuery(
+        name="Actively Hiring",
+        category="specialty",
+        query='intitle:"we are hiring" OR intitle:"now hiring" (developer OR engineer) "apply"',
+        description="Companies actively hiring",
+    ),
 }
 
 # Category definitions for frontend
@@ -260,6 +308,167 @@ DORK_CATEGORIES = {
 }
 
 
+# Query ids per category, in DORK_QUERIES order
+_QUERY_IDS_BY_CATEGORY: Dict[str, List[str]] = {}
+for _query_id, _query_data in DORK_QUERIES.items():
+    _QUERY_IDS_BY_CATEGORY.setdefault(_query_data.category, []).append(_query_id)
+
+
+def _build_available_dorks() -> Dict[str, Any]:
+    """Group dork queries by category for the frontend"""
+    result = {
+        "categories": DORK_CATEGORIES,
+        "queries": {}
+    }
+
+    for category, query_ids in _QUERY_IDS_BY_CATEGORY.items():
+        result["queries"][category] = []
+        for query_id in query_ids:
+            query_data = DORK_QUERIES[query_id]
+            result["queries"][category].append({
+                "id": query_id,
+                "name": query_data.name,
+                "description": query_data.description,
+                "query_preview": query_data.query_preview,
+            })
+
+    return result
+
+
+# Both are built from constants, so compute them once; callers treat them as read-only
+_AVAILABLE_DORKS = _build_available_dorks()
+_CATEGORY_OPTIONS = [
+    {"id": cat_id, **cat_data}
+    for cat_id, cat_data in DORK_CATEGORIES.items()
+]
+
+
+# ============== CATEGORY DETECTION ==============
+# Checked in order; the first category with a matching term wins
+
+_CATEGORY_TERMS = (
+    (("cyber", "security", "soc", "pentest", "infosec", "threat", "incident"), "cyber"),
+    (("data scien", "machine learning", "ml ", "ai ", "deep learning", "nlp"), "data"),
+    (("devops", "sre", "site reliability", "platform", "kubernetes", "k8s"), "devops"),
+    (("startup", "early stage", "founding", "seed", "series a", "equity"), "startup"),
+    (("remote", "work from home", "wfh", "distributed"), "remote"),
+    (("google", "amazon", "meta", "apple", "microsoft", "faang"), "bigtech"),
+)
+
+# Priority of each term's category, indexed like the automaton's patterns
+_CATEGORY_TERM_RANKS = tuple(rank for rank, (terms, _) in enumerate(_CATEGORY_TERMS) for _ in terms)
+_CATEGORY_MATCHER = (
+    ahocorasick_rs.AhoCorasick([term for terms, _ in _CATEGORY_TERMS for term in terms])
+    if ahocorasick_rs else None
+)
+
+
+# ============== PARSING PATTERNS ==============
+# Compiled once at import; applied to every search result
+
+# (url pattern, fixed company name or None to use the captured slug)
+_COMPANY_PATTERNS = (
+    (r"boards\.greenhouse\.io/(\w+)", None),
+    (r"(\w+)\.greenhouse\.io", None),
+    (r"jobs\.lever\.co/(\w+)", None),
+    (r"apply\.workable\.com/(\w+)", None),
+    (r"(\w+)\.ashbyhq\.com", None),
+    (r"careers\.google\.com", "Google"),
+    (r"amazon\.jobs", "Amazon"),
+    (r"metacareers\.com", "Meta"),
+    (r"careers\.microsoft\.com", "Microsoft"),
+    (r"jobs\.apple\.com", "Apple"),
+    (r"jobs\.netflix\.com", "Netflix"),
+    (r"nvidia\.com", "NVIDIA"),
+    (r"openai\.com", "OpenAI"),
+    (r"anthropic\.com", "Anthropic"),
+    (r"(\w+)\.myworkdayjobs\.com", None),
+)
+
+# Compiled per pattern: the first match in table order wins, as when a URL
+# mentions several hosts (e.g. a redirect carrying another board's link)
+_COMPANY_RES = tuple(
+    (re.compile(pattern, re.IGNORECASE), name) for pattern, name in _COMPANY_PATTERNS
+)
+
+# Any company pattern at all; one search rejects the common no-match URL
+# before walking the table
+_COMPANY_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern, _ in _COMPANY_PATTERNS),
+    re.IGNORECASE,
+)
+_AT_COMPANY_RE = re.compile(r'\bat\s+([^|–-]+?)(?:\s*[-|–]|$)', re.IGNORECASE)
+_TITLE_TAIL_RE = re.compile(r'\s*[-|–@]\s*.+$')
+# Plain substring checks on one lowered string beat a case-insensitive
+# regex here by over 10x; most results fail this test, so it runs first
+_JOB_KEYWORDS = ("job", "career", "position", "apply", "opening", "hiring", "role", "vacancy")
+_LOCATION_TYPE_RE = re.compile(
+    r'(?P<remote>remote|work from home)|(?P<hybrid>hybrid)|(?P<onsite>on-?site)', re.IGNORECASE
+)
+RESULT_LINK_MARKER = b'class="result__a"'  # Each result's title link
+_UDDG_RE = re.compile(r'[?&]uddg=([^&]+)')  # DuckDuckGo redirect target
+_LOCATION_RE = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z]{2})\b')
+
+
+# DuckDuckGo results per normalized query, least recently used first:
+# query -> (fetched_at, results)
+_query_cache: "OrderedDict[str, Tuple[float, Tuple[Dict[str, str], ...]]]" = OrderedDict()
+
+
+@lru_cache(maxsize=128)
+def _format_keywords(keywords: Tuple[str, ...]) -> str:
+    """Keywords as dork terms, quoting multi-word phrases"""
+    return " ".join(f'"{k}"' if " " in k else k for k in keywords)
+
+
+@lru_cache(maxsize=512)
+def _at_company_suffix_re(company: str) -> re.Pattern:
+    """Pattern for a trailing " at <company>..." in a title"""
+    return re.compile(rf'\s+at\s+{re.escape(company)}.*$', re.IGNORECASE)
+
+
+# ============== SHARED HTTP CLIENT ==============
+# The orchestrator builds a fresh scraper per search; one process-wide
+# client keeps DuckDuckGo connections (and TLS sessions) warm across them
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get or create the process-wide DuckDuckGo client"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        # Concurrent dork queries share keep-alive connections (multiplexed
+        # over one with HTTP/2); connect failures are retried by the transport
+        _shared_client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                retries=2,
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=10,
+                    keepalive_expiry=60,
+                ),
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            follow_redirects=True,
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9",
+            }
+        )
+    return _shared_client
+
+
+async def close_dork_client():
+    """Close the shared DuckDuckGo client"""
+    global _shared_client
+    if _shared_client:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
 @register_scraper("google_dork")
 class GoogleDorkScraper(BaseScraper):
     """
@@ -268,6 +477,9 @@ class GoogleDorkScraper(BaseScraper):
     """
 
     RATE_LIMIT_SECONDS = 2
+    QUERY_CONCURRENCY = 5   # DuckDuckGo requests in flight for search_batch
+    QUERY_CACHE_SIZE = 256  # Distinct queries kept in memory
+    QUERY_CACHE_TTL_SECONDS = 600
 
     @property
     def source_name(self) -> str:
@@ -280,60 +492,33 @@ class GoogleDorkScraper(BaseScraper):
     def __init__(self):
         super().__init__()
         self._client: Optional[httpx.AsyncClient] = None
+        self._query_slots = asyncio.Semaphore(self.QUERY_CONCURRENCY)
 
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=30.0,
-                follow_redirects=True,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                }
-            )
+        """Get the shared DuckDuckGo client"""
+        if self._client is None or self._client.is_closed:
+            self._client = _get_shared_client()
         return self._client
 
     async def _close_client(self):
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Release the HTTP client; the shared client stays open"""
+        self._client = None
 
     def get_available_dorks(self) -> Dict[str, Any]:
         """Get all available dork queries organized by category"""
-        result = {
-            "categories": DORK_CATEGORIES,
-            "queries": {}
-        }
-
-        for query_id, query_data in DORK_QUERIES.items():
-            category = query_data["category"]
-            if category not in result["queries"]:
-                result["queries"][category] = []
-
-            result["queries"][category].append({
-                "id": query_id,
-                "name": query_data["name"],
-                "description": query_data["description"],
-                "query_preview": query_data["query"][:80] + "..." if len(query_data["query"]) > 80 else query_data["query"]
-            })
-
-        return result
+        return _AVAILABLE_DORKS
 
     def _detect_category(self, keywords: List[str]) -> str:
         """Auto-detect best category from keywords"""
         keywords_lower = " ".join(keywords).lower()
 
-        mappings = [
-            (["cyber", "security", "soc", "pentest", "infosec", "threat", "incident"], "cyber"),
-            (["data scien", "machine learning", "ml ", "ai ", "deep learning", "nlp"], "data"),
-            (["devops", "sre", "site reliability", "platform", "kubernetes", "k8s"], "devops"),
-            (["startup", "early stage", "founding", "seed", "series a", "equity"], "startup"),
-            (["remote", "work from home", "wfh", "distributed"], "remote"),
-            (["google", "amazon", "meta", "apple", "microsoft", "faang"], "bigtech"),
-        ]
+        if _CATEGORY_MATCHER:
+            matches = _CATEGORY_MATCHER.find_matches_as_indexes(keywords_lower, overlapping=True)
+            if matches:
+                return _CATEGORY_TERMS[min(_CATEGORY_TERM_RANKS[index] for index, _, _ in matches)][1]
+            return "swe"  # Default
 
-        for terms, category in mappings:
+        for terms, category in _CATEGORY_TERMS:
             if any(term in keywords_lower for term in terms):
                 return category
 
@@ -351,16 +536,16 @@ class GoogleDorkScraper(BaseScraper):
             category = self._detect_category(keywords)
 
         # Get a base query from the category
-        category_queries = [q for q_id, q in DORK_QUERIES.items() if q["category"] == category]
+        category_query_ids = _QUERY_IDS_BY_CATEGORY.get(category)
 
-        if category_queries:
-            base_query = category_queries[0]["query"]
+        if category_query_ids:
+            base_query = DORK_QUERIES[category_query_ids[0]].wrapped
         else:
             # Fallback: ATS search
-            base_query = DORK_QUERIES["ats_all"]["query"]
+            base_query = DORK_QUERIES["ats_all"].wrapped
 
         # Add user keywords
-        user_keywords = " ".join(f'"{k}"' if " " in k else k for k in keywords)
+        user_keywords = _format_keywords(tuple(keywords))
 
         # Add location/remote modifier
         location_part = ""
@@ -371,86 +556,118 @@ class GoogleDorkScraper(BaseScraper):
                 location_part = f' "{location}"'
 
         # Combine
-        query = f"({base_query}) {user_keywords}{location_part}"
+        query = f"{base_query} {user_keywords}{location_part}"
         return query
 
     async def _search_duckduckgo(self, query: str, max_results: int = 30) -> List[Dict]:
-        """Search DuckDuckGo and extract results"""
+        """Search DuckDuckGo and extract results, reusing recent identical queries"""
+        cache_key = f"{max_results}:{' '.join(query.split())}"
+        cached = _query_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.QUERY_CACHE_TTL_SECONDS:
+            _query_cache.move_to_end(cache_key)
+            logger.info(f"Reusing {len(cached[1])} cached DuckDuckGo results")
+            return list(cached[1])
+
         results = []
 
         try:
             client = await self._get_client()
-            params = {"q": query}
-            url = f"{self.base_url}/html/?{urlencode(params)}"
-
-            await self._rate_limit()
-            response = await client.get(url)
+            url = f"{self.base_url}/html/?q={quote_plus(query)}"
 
-            if response.status_code != 200:
-                logger.warning(f"DuckDuckGo returned {response.status_code}")
-                return results
+            async with self._query_slots:
+                await self._rate_limit()
+                async with client.stream("GET", url) as response:
+                    if response.status_code != 200:
+                        logger.warning(f"DuckDuckGo returned {response.status_code}")
+                        return results
 
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.text, "html.parser")
+                    body = await self._read_results_page(response, max_results)
 
-            for result in soup.select(".result")[:max_results]:
-                link_elem = result.select_one(".result__a")
-                snippet_elem = result.select_one(".result__snippet")
+            for href, title, snippet in self._iter_result_fields(body, max_results):
+                uddg_match = _UDDG_RE.search(href)
+                if uddg_match:
+                    href = unquote(uddg_match.group(1))
 
-                if link_elem:
-                    href = link_elem.get("href", "")
-                    if "uddg=" in href:
-                        import urllib.parse
-                        parsed = urllib.parse.parse_qs(urllib.parse.urlparse(href).query)
-                        if "uddg" in parsed:
-                            href = urllib.parse.unquote(parsed["uddg"][0])
-
-                    title = link_elem.get_text(strip=True)
-                    snippet = snippet_elem.get_text(strip=True) if snippet_elem else ""
-
-                    if href and title:
-                        results.append({
-                            "url": href,
-                            "title": title,
-                            "snippet": snippet,
-                        })
+                if href and title:
+                    results.append({
+                        "url": href,
+                        "title": title,
+                        "snippet": snippet,
+                    })
 
             logger.info(f"Found {len(results)} results from DuckDuckGo")
 
+            # An empty page is usually a block or captcha, so let the next call retry
+            if not results:
+                return results
+
+            _query_cache[cache_key] = (time.monotonic(), tuple(results))
+            _query_cache.move_to_end(cache_key)
+            while len(_query_cache) > self.QUERY_CACHE_SIZE:
+                _query_cache.popitem(last=False)
+
         except Exception as e:
             logger.error(f"Error searching DuckDuckGo: {e}")
 
         return results
 
+    async def _read_results_page(self, response: httpx.Response, max_results: int) -> bytes:
+        """
+        Read the results page until it holds more than max_results result links.
+
+        Everything after that is never parsed, so it is drained without being
+        kept; reading the body to the end lets the keep-alive connection go back
+        to the pool. Raw bytes go to the parser, which handles the decoding.
+        """
+        chunks = []
+        links_seen = 0
+        async for chunk in response.aiter_bytes():
+            if links_seen > max_results:
+                continue
+            chunks.append(chunk)
+            # A marker split across chunks is missed, which only delays the cut-off
+            links_seen += chunk.count(RESULT_LINK_MARKER)
+        return b"".join(chunks)
+
+    def _iter_result_fields(self, body: bytes, max_results: int):
+        """Yield (href, title, snippet) for each result, with selectolax when available"""
+        if LexborHTMLParser:
+            tree = LexborHTMLParser(body)
+            for result in tree.css(".result")[:max_results]:
+                link_elem = result.css_first(".result__a")
+                if link_elem:
+                    snippet_elem = result.css_first(".result__snippet")
+                    yield (
+                        link_elem.attributes.get("href") or "",
+                        link_elem.text(strip=True),
+                        snippet_elem.text(strip=True) if snippet_elem else "",
+                    )
+            return
+
+        soup = BeautifulSoup(body, HTML_PARSER)
+
+        for result in soup.select(".result")[:max_results]:
+            link_elem = result.select_one(".result__a")
+            if link_elem:
+                snippet_elem = result.select_one(".result__snippet")
+                yield (
+                    link_elem.get("href", ""),
+                    link_elem.get_text(strip=True),
+                    snippet_elem.get_text(strip=True) if snippet_elem else "",
+                )
+
     def _extract_company(self, url: str, title: str) -> str:
         """Extract company name from URL or title"""
-        patterns = [
-            (r"boards\.greenhouse\.io/(\w+)", None),
-            (r"(\w+)\.greenhouse\.io", None),
-            (r"jobs\.lever\.co/(\w+)", None),
-            (r"apply\.workable\.com/(\w+)", None),
-            (r"(\w+)\.ashbyhq\.com", None),
-            (r"careers\.google\.com", "Google"),
-            (r"amazon\.jobs", "Amazon"),
-            (r"metacareers\.com", "Meta"),
-            (r"careers\.microsoft\.com", "Microsoft"),
-            (r"jobs\.apple\.com", "Apple"),
-            (r"jobs\.netflix\.com", "Netflix"),
-            (r"nvidia\.com", "NVIDIA"),
-            (r"openai\.com", "OpenAI"),
-            (r"anthropic\.com", "Anthropic"),
-            (r"(\w+)\.myworkdayjobs\.com", None),
-        ]
-
-        for pattern, default_name in patterns:
-            match = re.search(pattern, url, re.IGNORECASE)
-            if match:
-                if default_name:
-                    return default_name
-                return match.group(1).replace("-", " ").replace("_", " ").title()
+        if _COMPANY_RE.search(url):
+            for pattern, default_name in _COMPANY_RES:
+                match = pattern.search(url)
+                if match:
+                    if default_name:
+                        return default_name
+                    return match.group(1).replace("-", " ").replace("_", " ").title()
 
         # Try "at Company" pattern in title
-        at_match = re.search(r'\bat\s+([^|–-]+?)(?:\s*[-|–]|$)', title, re.IGNORECASE)
+        at_match = _AT_COMPANY_RE.search(title)
         if at_match:
             return at_match.group(1).strip()
 
@@ -466,35 +683,37 @@ class GoogleDorkScraper(BaseScraper):
             return None
 
         # Skip non-job URLs
-        job_patterns = ["job", "career", "position", "apply", "opening", "hiring", "role", "vacancy"]
-        url_lower = url.lower()
-        title_lower = title.lower()
-        if not any(p in url_lower or p in title_lower for p in job_patterns):
+        haystack = f"{url}\n{title}".lower()
+        for keyword in _JOB_KEYWORDS:
+            if keyword in haystack:
+                break
+        else:
             return None
 
         company = self._extract_company(url, title)
 
         # Clean title
-        clean_title = re.sub(r'\s*[-|–@]\s*.+$', '', title).strip()
-        clean_title = re.sub(rf'\s+at\s+{re.escape(company)}.*$', '', clean_title, flags=re.IGNORECASE).strip()
+        clean_title = _TITLE_TAIL_RE.sub('', title).strip()
+        clean_title = _at_company_suffix_re(company).sub('', clean_title).strip()
         if not clean_title:
             clean_title = title
 
         # Detect location type
         location_type = None
         location = None
-        text_lower = (title + " " + snippet).lower()
+        text = title + " " + snippet
+        found = {match.lastgroup for match in _LOCATION_TYPE_RE.finditer(text)}
 
-        if "remote" in text_lower or "work from home" in text_lower:
+        if "remote" in found:
             location_type = "remote"
             location = "Remote"
-        elif "hybrid" in text_lower:
+        elif "hybrid" in found:
             location_type = "hybrid"
-        elif "on-site" in text_lower or "onsite" in text_lower:
+        elif "onsite" in found:
             location_type = "onsite"
 
         # Try to extract city/state
-        loc_match = re.search(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z]{2})\b', title + " " + snippet)
+        loc_match = _LOCATION_RE.search(text)
         if loc_match:
             location = loc_match.group(1)
 
@@ -527,8 +746,23 @@ class GoogleDorkScraper(BaseScraper):
                 - dork_category: Category of dorks to use
                 - custom_query: Custom dork query string
         """
+        for job in await self.search_list(keywords, location, filters):
+            yield job
+
+    async def search_list(
+        self,
+        keywords: List[str],
+        location: Optional[str] = None,
+        filters: Optional[Dict] = None
+    ) -> List[ScrapedJob]:
+        """
+        Same as search(), but returns every job at once.
+
+        All jobs are ready after a single request, so the orchestrator
+        collects them through this and skips the per-item generator round-trips.
+        """
         if not keywords:
-            return
+            return []
 
         filters = filters or {}
         dork_id = filters.get("dork_id")
@@ -540,11 +774,8 @@ class GoogleDorkScraper(BaseScraper):
             query = custom_query
             query_id = "custom"
         elif dork_id and dork_id in DORK_QUERIES:
-            query = DORK_QUERIES[dork_id]["query"]
+            query = self._build_dork_query(dork_id, keywords)
             query_id = dork_id
-            # Add user keywords
-            user_keywords = " ".join(f'"{k}"' if " " in k else k for k in keywords)
-            query = f"({query}) {user_keywords}"
         else:
             # Build custom query based on keywords and category
             query = self._build_custom_query(keywords, location, dork_category)
@@ -554,21 +785,70 @@ class GoogleDorkScraper(BaseScraper):
 
         results = await self._search_duckduckgo(query)
 
-        seen_urls = set()
-        seen_titles = set()
+        # Regex-heavy parsing runs in a worker thread to keep the event loop free
+        return await asyncio.to_thread(self._parse_batch, results, query_id, set())
+
+    async def search_batch(
+        self,
+        dork_ids: List[str],
+        keywords: List[str],
+    ) -> AsyncGenerator[ScrapedJob, None]:
+        """
+        Run several dork queries concurrently and yield their jobs, deduplicated.
+
+        Requests overlap up to QUERY_CONCURRENCY at a time; the shared rate
+        limit still spaces out when each one starts.
+        """
+        dork_ids = [d for d in dork_ids if d in DORK_QUERIES]
+        if not keywords or not dork_ids:
+            return
+
+        queries = [self._build_dork_query(d, keywords) for d in dork_ids]
+        logger.info(f"Running {len(queries)} dork queries: {', '.join(dork_ids)}")
+
+        all_results = await asyncio.gather(
+            *(self._search_duckduckgo(q) for q in queries),
+            return_exceptions=True,
+        )
+
+        seen = set()
+        for dork_id, results in zip(dork_ids, all_results):
+            if isinstance(results, BaseException):
+                logger.error(f"Dork query [{dork_id}] failed: {results}")
+                continue
+            for job in await asyncio.to_thread(self._parse_batch, results, dork_id, seen):
+                yield job
+
+    def _build_dork_query(self, dork_id: str, keywords: List[str]) -> str:
+        """Combine a predefined dork with the user's keywords"""
+        user_keywords = _format_keywords(tuple(keywords))
+        return f"{DORK_QUERIES[dork_id].wrapped} {user_keywords}"
 
+    def _parse_batch(self, results: List[Dict], query_id: str, seen: set) -> List[ScrapedJob]:
+        """Parse and deduplicate a whole result list (run via asyncio.to_thread)"""
+        return list(self._unique_jobs(results, query_id, seen))
+
+    def _unique_jobs(self, results: List[Dict], query_id: str, seen: set):
+        """
+        Parse results into jobs, skipping URLs and title/company pairs already seen.
+
+        One set holds both kinds of key: URLs as str, title/company pairs as
+        tuples, which can never compare equal to each other. The set lives
+        for one search (or one search_batch) only, since a repeated search
+        must return its jobs again, so it stays bounded by the result count.
+        """
         for result in results:
             url = result.get("url", "")
-            if url in seen_urls:
+            if url in seen:
                 continue
-            seen_urls.add(url)
+            seen.add(url)
 
             job = self._parse_result_to_job(result, query_id)
             if job:
-                key = f"{job.title.lower()}|{job.company_name.lower()}"
-                if key in seen_titles:
+                key = (job.title.lower(), job.company_name.lower())
+                if key in seen:
                     continue
-                seen_titles.add(key)
+                seen.add(key)
                 yield job
 
     async def get_job_details(self, url: str) -> Optional[ScrapedJob]:
@@ -579,13 +859,9 @@ class GoogleDorkScraper(BaseScraper):
 
 def get_dork_strategies() -> Dict[str, Any]:
     """Get available dork strategies for API/frontend"""
-    scraper = GoogleDorkScraper()
-    return scraper.get_available_dorks()
+    return _AVAILABLE_DORKS
 
 
 def get_dork_categories() -> List[Dict[str, str]]:
     """Get dork categories for dropdown"""
-    return [
-        {"id": cat_id, **cat_data}
-        for cat_id, cat_data in DORK_CATEGORIES.items()
-    ]
+    return _CATEGORY_OPTIONS
@@ -6,21 +6,169 @@ don't require heavy JavaScript rendering. These are faster and
 more reliable than browser-based approaches.
 """
 
+import asyncio
+import html
 import httpx
 import re
+import time
 import gzip
 import json
 import logging
-from typing import List, Optional, AsyncGenerator, Dict, Any
+from typing import List, Optional, AsyncGenerator, Dict, Any, Iterator, Tuple
+from collections import OrderedDict
 from datetime import datetime, date
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin, urlencode, quote_plus
 
-from .base_scraper import BaseScraper, ScrapedJob, register_scraper
+from .base_scraper import BaseScraper, ScrapedJob, keyword_matcher, register_scraper
+
+try:
+    from selectolax.lexbor import LexborHTMLParser  # Lexbor C engine, much faster than bs4
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import orjson  # Parses the response bytes directly, several times faster than json
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2 support
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    from lxml import etree, html as lxml_html  # C parser backend for BeautifulSoup and XPath
+    HTML_PARSER = "lxml"
+except ImportError:
+    etree = lxml_html = None
+    HTML_PARSER = "html.parser"
 
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(body: bytes) -> Any:
+    """Decode a JSON response body, with orjson when available"""
+    return orjson.loads(body) if orjson else json.loads(body)
+
+
+_CITY_STATE_RE = re.compile(r"[A-Za-z\s]+,\s*[A-Z]{2}")
+_URL_STYLE_RE = re.compile(r"url\(['\"]?([^'\"]+)['\"]?\)")
+
+# HN comment bodies are small HTML fragments; tags and anchors are pulled out
+# with regexes instead of building a parse tree per posting
+_TAG_RE = re.compile(r"<[^>]+>")
+_ANCHOR_HREF_RE = re.compile(r"""<a\s[^>]*?\bhref\s*=\s*["']([^"']*)["']""", re.IGNORECASE)
+
+
+
+# ============== WWR DETAIL XPATHS ==============
+# Compiled once per process instead of soupsieve re-parsing CSS per call
+
+
+def has_class(name: str) -> str:
+    """XPath predicate equivalent to the CSS class selector .name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+if etree is not None:
+    _WWR_TITLE_XPATH = etree.XPath(f"//h1[{has_class('listing-header-container')}]")
+    _WWR_COMPANY_XPATH = etree.XPath(
+        f"//*[{has_class('company-card')}]//h2"
+        f" | //*[{has_class('listing-header-container')}]/following-sibling::*[1][self::p]"
+    )
+    _WWR_DESCRIPTION_XPATH = etree.XPath(f"//*[{has_class('listing-container')}]")
+    # Visible text only, matching bs4's get_text (no script/style bodies)
+    _TEXT_NODES_XPATH = etree.XPath(".//text()[not(parent::script or parent::style)]")
+
+
+def _xpath_text(tree, xpath, separator: str = "") -> str:
+    """Stripped text of the first node matching xpath, like bs4 get_text(strip=True)"""
+    nodes = xpath(tree)
+    if not nodes:
+        return ""
+    return separator.join(
+        text for text in (node.strip() for node in _TEXT_NODES_XPATH(nodes[0])) if text
+    )
+
+
+# ============== SHARED HTTP CLIENT ==============
+# One connection pool for RemoteOK, HN and WWR; scrapers pass their own
+# headers per request so nothing site-specific is bound to the client
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_scraper_client() -> httpx.AsyncClient:
+    """Get or create the process-wide HTTP scraper client"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            # HN fans out ~100 item requests at once; HTTP/2 multiplexes them
+            # over one connection to Firebase
+            http2=HTTP2_AVAILABLE,
+            timeout=30.0,
+            follow_redirects=True,
+            # Idle connections outlive a burst (HN item fan-out) so the next
+            # one reuses them instead of re-handshaking
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _shared_client
+
+
+async def close_http_scraper_client():
+    """Close the shared HTTP scraper client"""
+    global _shared_client
+    if _shared_client:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+# ============== RATE LIMITING ==============
+
+
+class _TokenBucket:
+    """
+    Token bucket rate limiter.
+
+    Allows bursts of up to `burst` requests, refilling at `rate` tokens per
+    second. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+# One bucket per source, shared by every scraper instance hitting that host
+_rate_buckets: Dict[str, _TokenBucket] = {}
+
+# ============== RESPONSE CACHE ==============
+# Decoded JSON from read-mostly endpoints (RemoteOK feed, HN items and
+# threads), least recently used first: url -> (fetched_at, data)
+
+_json_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+
 class HTTPBasedScraper(BaseScraper):
     """
     Base class for HTTP-based scrapers using httpx + BeautifulSoup.
@@ -30,34 +178,32 @@ class HTTPBasedScraper(BaseScraper):
     """
 
     RATE_LIMIT_SECONDS = 2
+    REQUESTS_PER_SECOND: Optional[float] = None   # Defaults to 1 / RATE_LIMIT_SECONDS
+    RATE_BURST = 1          # Requests allowed back to back before throttling
+    JSON_CACHE_SIZE = 512   # Decoded JSON responses kept across searches
+
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate",  # httpx decodes br only with brotli installed
+        "DNT": "1",
+        "Upgrade-Insecure-Requests": "1",
+    }
 
     def __init__(self):
         super().__init__()
         self._client: Optional[httpx.AsyncClient] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=30.0,
-                follow_redirects=True,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "DNT": "1",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                }
-            )
+        """Get the shared HTTP client (send self.HEADERS with each request)"""
+        if self._client is None or self._client.is_closed:
+            self._client = get_http_scraper_client()
         return self._client
 
     async def _close_client(self):
-        """Close HTTP client"""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Release the HTTP client; the shared client stays open"""
+        self._client = None
 
     async def __aenter__(self):
         await self._get_client()
@@ -66,15 +212,60 @@ class HTTPBasedScraper(BaseScraper):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self._close_client()
 
-    async def _fetch_html(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse HTML from URL"""
+    async def _rate_limit(self):
+        """Take a token from this source's bucket, shared across instances"""
+        bucket = _rate_buckets.get(self.source_name)
+        if bucket is None:
+            rate = self.REQUESTS_PER_SECOND
+            if rate is None:
+                if self.RATE_LIMIT_SECONDS <= 0:
+                    return
+                rate = 1 / self.RATE_LIMIT_SECONDS
+            bucket = _rate_buckets[self.source_name] = _TokenBucket(rate, self.RATE_BURST)
+        await bucket.acquire()
+
+    async def _get_json(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        ttl: float,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Any]:
+        """
+        GET and decode a JSON endpoint, reusing a response younger than ttl seconds.
+
+        Returns None on a non-200 response. Errors propagate to the caller.
+        """
+        cache_key = str(httpx.URL(url, params=params)) if params else url
+        cached = _json_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            _json_cache.move_to_end(cache_key)
+            return cached[1]
+
+        await self._rate_limit()
+        response = await client.get(url, params=params, headers=self.HEADERS)
+        if response.status_code != 200:
+            logger.warning(f"HTTP {response.status_code} for {url}")
+            return None
+
+        data = _json_loads(response.content)
+
+        _json_cache[cache_key] = (time.monotonic(), data)
+        _json_cache.move_to_end(cache_key)
+        while len(_json_cache) > self.JSON_CACHE_SIZE:
+            _json_cache.popitem(last=False)
+
+        return data
+
+    async def _fetch_content(self, url: str) -> Optional[bytes]:
+        """Fetch raw page bytes from URL"""
         try:
             await self._rate_limit()
             client = await self._get_client()
-            response = await client.get(url)
+            response = await client.get(url, headers=self.HEADERS)
 
             if response.status_code == 200:
-                return BeautifulSoup(response.text, "html.parser")
+                return response.content
             else:
                 logger.warning(f"HTTP {response.status_code} for {url}")
                 return None
@@ -83,6 +274,14 @@ class HTTPBasedScraper(BaseScraper):
             logger.error(f"Error fetching {url}: {e}")
             return None
 
+    async def _fetch_html(self, url: str) -> Optional[BeautifulSoup]:
+        """Fetch and parse HTML from URL"""
+        content = await self._fetch_content(url)
+        if content is None:
+            return None
+        # Hand bs4 the raw bytes so the parser sniffs the encoding itself
+        return BeautifulSoup(content, HTML_PARSER)
+
 
 @register_scraper("remoteok")
 class RemoteOKScraper(HTTPBasedScraper):
@@ -92,6 +291,15 @@ class RemoteOKScraper(HTTPBasedScraper):
     RemoteOK provides a JSON API that's easy to use.
     """
 
+    FEED_TTL_SECONDS = 15 * 60  # The feed changes a few times an hour at most
+
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Accept": "application/json",
+        "Accept-Language": "en-US,en;q=0.9",
+        # No Accept-Encoding to get uncompressed response
+    }
+
     @property
     def source_name(self) -> str:
         return "remoteok"
@@ -100,21 +308,6 @@ class RemoteOKScraper(HTTPBasedScraper):
     def base_url(self) -> str:
         return "https://remoteok.com"
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get HTTP client without compression to avoid RemoteOK encoding issues"""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=30.0,
-                follow_redirects=True,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "application/json",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    # No Accept-Encoding to get uncompressed response
-                }
-            )
-        return self._client
-
     async def search(
         self,
         keywords: List[str],
@@ -122,31 +315,50 @@ class RemoteOKScraper(HTTPBasedScraper):
         filters: Optional[Dict] = None
     ) -> AsyncGenerator[ScrapedJob, None]:
         """Search RemoteOK jobs via their JSON API"""
+        for job in await self.search_list(keywords, location, filters):
+            yield job
+
+    async def search_list(
+        self,
+        keywords: List[str],
+        location: Optional[str] = None,
+        filters: Optional[Dict] = None
+    ) -> List[ScrapedJob]:
+        """
+        Same as search(), but returns every job at once.
+
+        The whole feed arrives in one response, so the jobs are built in a
+        plain loop; the orchestrator collects them through this instead of
+        resuming a generator per job.
+        """
         # RemoteOK has a JSON API
         api_url = f"{self.base_url}/api"
+        results: List[ScrapedJob] = []
 
         try:
             client = await self._get_client()
-            response = await client.get(api_url)
+            jobs = await self._get_json(client, api_url, self.FEED_TTL_SECONDS)
 
-            if response.status_code != 200:
-                logger.warning(f"RemoteOK API returned {response.status_code}")
-                return
+            if jobs is None:
+                logger.warning("RemoteOK API request failed")
+                return results
 
-            jobs = response.json()
             if jobs and isinstance(jobs[0], dict) and "legal" in jobs[0]:
                 jobs = jobs[1:]
 
             keywords_lower = [k.lower() for k in keywords] if keywords else []
+            matches_keywords = keyword_matcher(keywords_lower)
 
             for job in jobs:
-                # Filter by keywords
+                # Filter by keywords (newlines keep matches inside one field)
                 if keywords_lower:
-                    title = job.get("position", "").lower()
-                    company = job.get("company", "").lower()
-                    tags = " ".join(job.get("tags", [])).lower()
+                    haystack = "\n".join((
+                        job.get("position") or "",
+                        job.get("company") or "",
+                        " ".join(job.get("tags") or []),
+                    )).lower()
 
-                    if not any(k in title or k in company or k in tags for k in keywords_lower):
+                    if not matches_keywords(haystack):
                         continue
 
                 # Parse date
@@ -167,7 +379,7 @@ class RemoteOKScraper(HTTPBasedScraper):
                 elif salary_min:
                     salary_text = f"${salary_min:,}+"
 
-                yield ScrapedJob(
+                results.append(ScrapedJob(
                     url=job.get("url", f"{self.base_url}/remote-jobs/{job.get('slug', '')}"),
                     title=job.get("position", "Unknown"),
                     company_name=job.get("company", "Unknown"),
@@ -180,13 +392,14 @@ class RemoteOKScraper(HTTPBasedScraper):
                     salary_max=salary_max,
                     posted_date=posted_date,
                     company_logo=job.get("company_logo"),
-                    requirements=job.get("tags", []),
-                    raw_data=job
-                )
+                    requirements=job.get("tags", [])
+                ))
 
         except Exception as e:
             logger.error(f"Error searching RemoteOK: {e}")
 
+        return results
+
     async def get_job_details(self, url: str) -> Optional[ScrapedJob]:
         """Get job details - API already provides full info"""
         return None
@@ -200,6 +413,21 @@ class HackerNewsJobsScraper(HTTPBasedScraper):
     Monthly threads with high-quality tech job postings.
     """
 
+    # Firebase publishes no per-IP limit; stay polite but let fan-out through
+    REQUESTS_PER_SECOND = 50
+    RATE_BURST = 20
+    ITEM_CONCURRENCY = 10   # Firebase item requests in flight at once
+    MAX_COMMENTS = 100      # Top-level postings considered per thread
+
+    # Response reuse: the monthly thread's comment list keeps growing, but
+    # whoishiring's submissions and individual postings rarely change
+    USER_TTL_SECONDS = 6 * 60 * 60
+    THREAD_TTL_SECONDS = 15 * 60
+    ITEM_TTL_SECONDS = 24 * 60 * 60
+
+    # Newest first, so the hitsPerPage cap keeps the latest postings with or without a query
+    ALGOLIA_SEARCH_URL = "https://hn.algolia.com/api/v1/search_by_date"
+
     @property
     def source_name(self) -> str:
         return "hackernews"
@@ -215,22 +443,18 @@ class HackerNewsJobsScraper(HTTPBasedScraper):
 
         try:
             client = await self._get_client()
-            response = await client.get(user_url)
-            if response.status_code != 200:
+            user_data = await self._get_json(client, user_url, self.USER_TTL_SECONDS)
+            if not user_data:
                 return None
 
-            user_data = response.json()
             submitted = user_data.get("submitted", [])
 
             # Check recent submissions for hiring thread
-            for item_id in submitted[:10]:
-                item_url = f"{self.base_url}/item/{item_id}.json"
-                item_response = await client.get(item_url)
-                if item_response.status_code == 200:
-                    item = item_response.json()
-                    title = item.get("title", "")
-                    if "Who is hiring" in title:
-                        return item_id
+            recent_ids = submitted[:10]
+            items = await self._fetch_items(client, recent_ids)
+            for item_id, item in zip(recent_ids, items):
+                if item and "Who is hiring" in item.get("title", ""):
+                    return item_id
 
             return None
 
@@ -245,35 +469,46 @@ class HackerNewsJobsScraper(HTTPBasedScraper):
         filters: Optional[Dict] = None
     ) -> AsyncGenerator[ScrapedJob, None]:
         """Search HN Who is Hiring thread"""
+        for job in await self.search_list(keywords, location, filters):
+            yield job
+
+    async def search_list(
+        self,
+        keywords: List[str],
+        location: Optional[str] = None,
+        filters: Optional[Dict] = None
+    ) -> List[ScrapedJob]:
+        """
+        Same as search(), but returns every job at once.
+
+        All postings are in hand once the thread is fetched, so they are
+        parsed and filtered in a plain loop; the orchestrator collects them
+        through this rather than search().
+        """
+        results: List[ScrapedJob] = []
+
         thread_id = await self._get_hiring_thread_id()
         if not thread_id:
             logger.warning("Could not find HN hiring thread")
-            return
-
-        # Get thread with comments
-        thread_url = f"{self.base_url}/item/{thread_id}.json"
+            return results
 
         try:
             client = await self._get_client()
-            response = await client.get(thread_url)
-            if response.status_code != 200:
-                return
 
-            thread = response.json()
-            comment_ids = thread.get("kids", [])[:100]  # Limit to first 100 comments
+            comments = await self._search_algolia(client, thread_id, keywords)
+            if comments is None:
+                comments = await self._fetch_thread_comments(client, thread_id)
+                if comments is None:
+                    return results
 
             keywords_lower = [k.lower() for k in keywords] if keywords else []
+            matches_keywords = keyword_matcher(keywords_lower)
             location_lower = location.lower() if location else None
 
-            for comment_id in comment_ids:
-                comment_url = f"{self.base_url}/item/{comment_id}.json"
-                await self._rate_limit()
-
-                comment_response = await client.get(comment_url)
-                if comment_response.status_code != 200:
+            for comment in comments:
+                if not comment:
                     continue
 
-                comment = comment_response.json()
                 if comment.get("deleted") or comment.get("dead"):
                     continue
 
@@ -281,17 +516,17 @@ class HackerNewsJobsScraper(HTTPBasedScraper):
                 if not text:
                     continue
 
+                # Filter by keywords before paying for the parse
+                if keywords_lower:
+                    text_lower = text.lower()
+                    if not matches_keywords(text_lower):
+                        continue
+
                 # Parse job posting from comment
                 job = self._parse_hn_comment(comment)
                 if not job:
                     continue
 
-                # Filter by keywords
-                if keywords_lower:
-                    text_lower = text.lower()
-                    if not any(k in text_lower for k in keywords_lower):
-                        continue
-
                 # Filter by location
                 if location_lower:
                     if location_lower == "remote":
@@ -300,20 +535,125 @@ class HackerNewsJobsScraper(HTTPBasedScraper):
                     elif job.location and location_lower not in job.location.lower():
                         continue
 
-                yield job
+                results.append(job)
 
         except Exception as e:
             logger.error(f"Error searching HN jobs: {e}")
 
+        return results
+
+    async def _search_algolia(
+        self,
+        client: httpx.AsyncClient,
+        thread_id: int,
+        keywords: List[str]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch the thread's top-level postings from the HN Algolia API.
+
+        One request per keyword replaces the thread + N comment fetches of the
+        Firebase path. Algolia requires every query word to match, so keywords
+        are queried separately to keep the any-keyword semantics of search().
+        Every request, including the keyword-less one, is restricted to the
+        thread's comments and sorted by date. Hits are reshaped to Firebase's item layout (id/text/time/by).
+        Returns None if Algolia fails so the caller can fall back to Firebase.
+        """
+        queries = keywords or [""]
+
+        async def query(keyword: str) -> Optional[Dict[str, Any]]:
+            params = {
+                "tags": f"comment,story_{thread_id}",
+                "hitsPerPage": self.MAX_COMMENTS,
+            }
+            if keyword:
+                params["query"] = keyword
+            result = await self._get_json(client, self.ALGOLIA_SEARCH_URL, self.THREAD_TTL_SECONDS, params)
+            if result is None:
+                logger.warning("HN Algolia search failed, falling back to Firebase")
+            return result
+
+        try:
+            results = await asyncio.gather(*(query(k) for k in queries))
+        except Exception as e:
+            logger.warning(f"HN Algolia search failed, falling back to Firebase: {e}")
+            return None
+
+        if any(result is None for result in results):
+            return None
+
+        comments = []
+        seen_ids = set()
+        for result in results:
+            for hit in result.get("hits", []):
+                # Replies to postings share the story tag; keep only the postings
+                if hit.get("parent_id") != thread_id:
+                    continue
+
+                comment_id = int(hit["objectID"])
+                if comment_id in seen_ids:
+                    continue
+                seen_ids.add(comment_id)
+
+                comments.append({
+                    "id": comment_id,
+                    "by": hit.get("author"),
+                    "text": hit.get("comment_text") or "",
+                    "time": hit.get("created_at_i"),
+                    "parent": thread_id,
+                })
+
+        return comments
+
+    async def _fetch_thread_comments(
+        self,
+        client: httpx.AsyncClient,
+        thread_id: int
+    ) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """Fetch the thread's top-level comments item by item from Firebase"""
+        thread_url = f"{self.base_url}/item/{thread_id}.json"
+        thread = await self._get_json(client, thread_url, self.THREAD_TTL_SECONDS)
+        if not thread:
+            return None
+
+        comment_ids = thread.get("kids", [])[:self.MAX_COMMENTS]
+
+        return await self._fetch_items(client, comment_ids)
+
+    async def _fetch_items(
+        self,
+        client: httpx.AsyncClient,
+        item_ids: List[int]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch HN items concurrently, preserving the order of item_ids.
+
+        ITEM_CONCURRENCY caps requests in flight and the source's token bucket
+        caps the request rate. Failed fetches come back as None.
+        """
+        semaphore = asyncio.Semaphore(self.ITEM_CONCURRENCY)
+
+        async def fetch(item_id: int) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await self._get_json(
+                        client, f"{self.base_url}/item/{item_id}.json", self.ITEM_TTL_SECONDS
+                    )
+                except Exception as e:
+                    logger.debug(f"Error fetching HN item {item_id}: {e}")
+                    return None
+
+        return await asyncio.gather(*(fetch(item_id) for item_id in item_ids))
+
     def _parse_hn_comment(self, comment: Dict[str, Any]) -> Optional[ScrapedJob]:
         """Parse a HN job posting comment"""
         text = comment.get("text", "")
         if not text:
             return None
 
-        # Clean HTML
-        soup = BeautifulSoup(text, "html.parser")
-        clean_text = soup.get_text("\n", strip=True)
+        # Clean HTML: one line per non-blank text node, like get_text("\n", strip=True)
+        clean_text = "\n".join(
+            chunk for chunk in (html.unescape(node).strip() for node in _TAG_RE.split(text)) if chunk
+        )
         lines = clean_text.split("\n")
 
         if not lines:
@@ -348,7 +688,7 @@ class HackerNewsJobsScraper(HTTPBasedScraper):
                 title = part
 
             # Check for location (city, state pattern)
-            if re.match(r"[A-Za-z\s]+,\s*[A-Z]{2}", part) or "USA" in part or "UK" in part:
+            if _CITY_STATE_RE.match(part) or "USA" in part or "UK" in part:
                 location = part
 
         # Parse date from timestamp
@@ -364,9 +704,8 @@ class HackerNewsJobsScraper(HTTPBasedScraper):
         url = f"https://news.ycombinator.com/item?id={comment.get('id')}"
 
         # Extract any linked URLs
-        links = soup.find_all("a")
-        for link in links:
-            href = link.get("href", "")
+        for match in _ANCHOR_HREF_RE.finditer(text):
+            href = html.unescape(match.group(1))
             if "jobs" in href or "careers" in href or "greenhouse" in href or "lever" in href:
                 url = href
                 break
@@ -379,8 +718,7 @@ class HackerNewsJobsScraper(HTTPBasedScraper):
             source=self.source_name,
             location=location,
             location_type=location_type,
-            posted_date=posted_date,
-            raw_data=comment
+            posted_date=posted_date
         )
 
     async def get_job_details(self, url: str) -> Optional[ScrapedJob]:
@@ -394,6 +732,26 @@ class WeWorkRemotelyScraper(HTTPBasedScraper):
     Scraper for WeWorkRemotely.com - Remote job board.
     """
 
+    LISTING_SELECTOR = "li.feature, li.new-feature, ul.jobs li"
+    # Listings all live in <ul> lists; the bs4 fallback builds only those subtrees
+    LISTING_STRAINER = SoupStrainer("ul")
+
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate",  # httpx decodes br only with brotli installed
+        "Cache-Control": "max-age=0",
+        "Sec-Ch-Ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+        "Sec-Ch-Ua-Mobile": "?0",
+        "Sec-Ch-Ua-Platform": '"Windows"',
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-User": "?1",
+        "Upgrade-Insecure-Requests": "1",
+    }
+
     @property
     def source_name(self) -> str:
         return "weworkremotely"
@@ -402,30 +760,6 @@ class WeWorkRemotelyScraper(HTTPBasedScraper):
     def base_url(self) -> str:
         return "https://weworkremotely.com"
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get HTTP client with WeWorkRemotely-specific headers"""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=30.0,
-                follow_redirects=True,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Cache-Control": "max-age=0",
-                    "Sec-Ch-Ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-                    "Sec-Ch-Ua-Mobile": "?0",
-                    "Sec-Ch-Ua-Platform": '"Windows"',
-                    "Sec-Fetch-Dest": "document",
-                    "Sec-Fetch-Mode": "navigate",
-                    "Sec-Fetch-Site": "none",
-                    "Sec-Fetch-User": "?1",
-                    "Upgrade-Insecure-Requests": "1",
-                }
-            )
-        return self._client
-
     async def search(
         self,
         keywords: List[str],
@@ -441,83 +775,136 @@ class WeWorkRemotelyScraper(HTTPBasedScraper):
             "remote-jobs/product",
         ]
 
-        keywords_lower = [k.lower() for k in keywords] if keywords else []
+        matches_keywords = keyword_matcher([k.lower() for k in keywords or []])
 
         for category in categories:
             url = f"{self.base_url}/{category}"
-            soup = await self._fetch_html(url)
+            content = await self._fetch_content(url)
 
-            if not soup:
+            if not content:
                 continue
 
-            # Find job listings
-            job_items = soup.select("li.feature, li.new-feature, ul.jobs li")
+            for href, title, company, logo in self._iter_listings(content):
+                job_url = urljoin(self.base_url, href)
 
-            for item in job_items:
-                try:
-                    link = item.select_one("a[href*='/remote-jobs/']")
-                    if not link:
-                        continue
-
-                    job_url = urljoin(self.base_url, link.get("href", ""))
+                if not title or not company:
+                    continue
 
-                    # Extract info from listing
-                    title_el = item.select_one(".title")
-                    company_el = item.select_one(".company")
+                # Filter by keywords (always true when there are none)
+                if not matches_keywords(f"{title} {company}".lower()):
+                    continue
 
-                    title = title_el.get_text(strip=True) if title_el else ""
-                    company = company_el.get_text(strip=True) if company_el else ""
+                yield ScrapedJob(
+                    url=job_url,
+                    title=title,
+                    company_name=company,
+                    description="",  # Would need to fetch detail page
+                    source=self.source_name,
+                    location="Remote",
+                    location_type="remote",
+                    company_logo=logo,
+                )
 
-                    if not title or not company:
+    def _iter_listings(self, content: bytes) -> Iterator[Tuple[str, str, str, Optional[str]]]:
+        """Yield (href, title, company, logo) per listing, with selectolax when available"""
+        if LexborHTMLParser:
+            tree = LexborHTMLParser(content)
+            for item in tree.css(self.LISTING_SELECTOR):
+                try:
+                    link = item.css_first("a[href*='/remote-jobs/']")
+                    if not link:
                         continue
 
-                    # Filter by keywords
-                    if keywords_lower:
-                        text_lower = f"{title} {company}".lower()
-                        if not any(k in text_lower for k in keywords_lower):
-                            continue
+                    title_el = item.css_first(".title")
+                    company_el = item.css_first(".company")
 
                     # Get logo if available
-                    logo_el = item.select_one("div.flag-logo, img.logo")
+                    logo_el = item.css_first("div.flag-logo, img.logo")
                     logo = None
                     if logo_el:
-                        logo = logo_el.get("style", "")
-                        if "url(" in logo:
-                            logo = re.search(r"url\(['\"]?([^'\"]+)['\"]?\)", logo)
-                            logo = logo.group(1) if logo else None
-                        elif logo_el.name == "img":
-                            logo = logo_el.get("src")
-
-                    yield ScrapedJob(
-                        url=job_url,
-                        title=title,
-                        company_name=company,
-                        description="",  # Would need to fetch detail page
-                        source=self.source_name,
-                        location="Remote",
-                        location_type="remote",
-                        company_logo=logo,
+                        logo = self._extract_logo(
+                            logo_el.attributes.get("style") or "",
+                            logo_el.tag == "img",
+                            logo_el.attributes.get("src"),
+                        )
+
+                    yield (
+                        link.attributes.get("href") or "",
+                        title_el.text(strip=True) if title_el else "",
+                        company_el.text(strip=True) if company_el else "",
+                        logo,
                     )
 
                 except Exception as e:
                     logger.debug(f"Error parsing WWR listing: {e}")
                     continue
+            return
+
+        soup = BeautifulSoup(content, HTML_PARSER, parse_only=self.LISTING_STRAINER)
+
+        for item in soup.select(self.LISTING_SELECTOR):
+            try:
+                link = item.select_one("a[href*='/remote-jobs/']")
+                if not link:
+                    continue
+
+                title_el = item.select_one(".title")
+                company_el = item.select_one(".company")
+
+                # Get logo if available
+                logo_el = item.select_one("div.flag-logo, img.logo")
+                logo = None
+                if logo_el:
+                    logo = self._extract_logo(
+                        logo_el.get("style", ""),
+                        logo_el.name == "img",
+                        logo_el.get("src"),
+                    )
+
+                yield (
+                    link.get("href", ""),
+                    title_el.get_text(strip=True) if title_el else "",
+                    company_el.get_text(strip=True) if company_el else "",
+                    logo,
+                )
+
+            except Exception as e:
+                logger.debug(f"Error parsing WWR listing: {e}")
+                continue
+
+    @staticmethod
+    def _extract_logo(style: str, is_img: bool, src: Optional[str]) -> Optional[str]:
+        """Pull the logo URL out of a background-image style or an <img> src"""
+        if "url(" in style:
+            match = _URL_STYLE_RE.search(style)
+            return match.group(1) if match else None
+        if is_img:
+            return src
+        return style
 
     async def get_job_details(self, url: str) -> Optional[ScrapedJob]:
         """Get full job details from listing page"""
-        soup = await self._fetch_html(url)
-        if not soup:
+        content = await self._fetch_content(url)
+        if not content:
             return None
 
         try:
-            title = soup.select_one("h1.listing-header-container")
-            title = title.get_text(strip=True) if title else ""
+            if lxml_html is not None:
+                tree = lxml_html.fromstring(content)
+                title = _xpath_text(tree, _WWR_TITLE_XPATH)
+                company = _xpath_text(tree, _WWR_COMPANY_XPATH)
+                description = _xpath_text(tree, _WWR_DESCRIPTION_XPATH, "\n")
+            else:
+                soup = BeautifulSoup(content, HTML_PARSER)
+
+                title = soup.select_one("h1.listing-header-container")
+                title = title.get_text(strip=True) if title else ""
 
-            company = soup.select_one(".company-card h2, .listing-header-container + p")
-            company = company.get_text(strip=True) if company else ""
+                company = soup.select_one(".company-card h2, .listing-header-container + p")
+                company = company.get_text(strip=True) if company else ""
 
-            description = soup.select_one(".listing-container")
-            description = description.get_text("\n", strip=True) if description else ""
+                description = soup.select_one(".listing-container")
+                description = description.get_text("\n", strip=True) if description else ""
 
             return ScrapedJob(
                 url=url,
@@ -1,15 +1,55 @@
 """Indeed job scraper"""
 
-from typing import List, Optional, AsyncGenerator, Dict
+from typing import List, Optional, AsyncGenerator, Dict, Any
 from datetime import date
 import re
+import html
+import json
 import logging
 import asyncio
 
 from .base_scraper import BaseScraper, ScrapedJob, register_scraper
+from .http_scraper import HTTPBasedScraper, get_http_scraper_client, has_class
+
+try:
+    from lxml import etree, html as lxml_html  # Parse card snapshots in-process
+except ImportError:
+    etree = lxml_html = None
 
 logger = logging.getLogger(__name__)
 
+# Search pages embed every job card as JSON; reading it skips the browser
+_MOSAIC_JOBCARDS_RE = re.compile(
+    r'window\.mosaic\.providerData\["mosaic-provider-jobcards"\]\s*=\s*'
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_BLOCK_TAGS = ("br", "div", "li", "p")
+
+# Browser fallback: the card selectors as XPath, compiled once and run on a
+# single outerHTML snapshot instead of one Playwright call per field
+if etree is not None:
+    _CARD_TITLE_XPATH = etree.XPath(f".//h2[{has_class('jobTitle')}]//a | .//a[{has_class('jcs-JobTitle')}]")
+    _CARD_COMPANY_XPATH = etree.XPath(f".//*[@data-testid='company-name'] | .//*[{has_class('companyName')}]")
+    _CARD_LOCATION_XPATH = etree.XPath(f".//*[@data-testid='text-location'] | .//*[{has_class('companyLocation')}]")
+    _CARD_SALARY_XPATH = etree.XPath(
+        f".//*[{has_class('salary-snippet-container')}] | .//*[{has_class('estimated-salary')}]"
+        " | .//*[@data-testid='attribute_snippet_testid']"
+    )
+    _CARD_DATE_XPATH = etree.XPath(f".//*[{has_class('date')}] | .//*[@data-testid='myJobsStateDate']")
+    _CARD_SNIPPET_XPATH = etree.XPath(f".//*[{has_class('job-snippet')}] | .//*[@data-testid='job-snippet']")
+
+
+def _first_text(card, xpath) -> Optional[str]:
+    """Approximate innerText of the first match: one line per block, spaces collapsed"""
+    nodes = xpath(card)
+    if not nodes:
+        return None
+    node = nodes[0]
+    for block in node.iter(*_BLOCK_TAGS):
+        block.tail = "\n" + (block.tail or "")
+    lines = (" ".join(line.split()) for line in node.text_content().splitlines())
+    return "\n".join(line for line in lines if line)
+
 
 @register_scraper("indeed")
 class IndeedScraper(BaseScraper):
@@ -22,6 +62,14 @@ class IndeedScraper(BaseScraper):
 
     RATE_LIMIT_SECONDS = 5  # Conservative to avoid blocks
     MAX_PAGES = 5
+    CARD_SELECTOR = ".job_seen_beacon, .resultContent"
+
+    JOB_TYPE_PARAMS = {
+        "full-time": "fulltime",
+        "part-time": "parttime",
+        "contract": "contract",
+        "internship": "internship",
+    }
 
     @property
     def source_name(self) -> str:
@@ -71,14 +119,8 @@ class IndeedScraper(BaseScraper):
 
             if filters.get("job_type"):
                 job_type = filters["job_type"]
-                type_map = {
-                    "full-time": "fulltime",
-                    "part-time": "parttime",
-                    "contract": "contract",
-                    "internship": "internship"
-                }
-                if job_type in type_map:
-                    url += f"&jt={type_map[job_type]}"
+                if job_type in self.JOB_TYPE_PARAMS:
+                    url += f"&jt={self.JOB_TYPE_PARAMS[job_type]}"
 
         return url
 
@@ -95,41 +137,35 @@ class IndeedScraper(BaseScraper):
 
         logger.info(f"Starting Indeed search: keywords={keywords}, location={location}")
 
+        # Plain HTTP first; the browser only starts once Indeed blocks it
+        use_browser = False
+
         while page < self.MAX_PAGES:
             start = page * jobs_per_page
             url = self._build_search_url(keywords, location, start, filters)
 
             logger.debug(f"Scraping Indeed page {page + 1}: {url}")
 
-            if not await self._navigate(url):
-                logger.warning(f"Failed to navigate to Indeed search page {page + 1}")
-                break
-
-            # Wait for job cards to load
-            await self._wait_for_selector(".job_seen_beacon, .jobsearch-ResultsList", timeout=10000)
+            jobs = None if use_browser else await self._fetch_page_jobs(url)
 
-            # Scroll to load lazy content
-            for _ in range(3):
-                await self._human_scroll()
+            if jobs is None:
+                if not use_browser:
+                    logger.info("Indeed HTTP fetch blocked or unparseable, falling back to browser")
+                    use_browser = True
+                    await self._init_browser()
 
-            # Extract job cards using async methods
-            job_cards = await self._query_selector_all(".job_seen_beacon, .resultContent")
+                jobs = await self._scrape_page_with_browser(url, page)
+                if jobs is None:
+                    break
 
-            if not job_cards:
+            if not jobs:
                 logger.info(f"No more jobs found on page {page + 1}")
                 break
 
-            jobs_found = 0
-            for card in job_cards:
-                try:
-                    job = await self._parse_job_card(card)
-                    if job:
-                        jobs_found += 1
-                        yield job
-                except Exception as e:
-                    logger.warning(f"Failed to parse Indeed job card: {e}")
-                    continue
+            for job in jobs:
+                yield job
 
+            jobs_found = len(jobs)
             logger.info(f"Found {jobs_found} jobs on Indeed page {page + 1}")
 
             if jobs_found < jobs_per_page // 2:
@@ -139,51 +175,234 @@ class IndeedScraper(BaseScraper):
             page += 1
             await self._random_delay(2, 4)
 
+    async def __aenter__(self):
+        """Start without a browser; search() launches one only if HTTP is blocked"""
+        return self
+
+    # ============== HTTP Path ==============
+
+    async def _fetch_page_jobs(self, url: str) -> Optional[List[ScrapedJob]]:
+        """
+        Fetch a search page over HTTP and parse its embedded job-card JSON.
+
+        Returns None when the page is blocked or the JSON blob is missing,
+        so the caller can retry the page in the browser.
+        """
+        await self._rate_limit()
+
+        try:
+            client = get_http_scraper_client()
+            response = await client.get(url, headers=HTTPBasedScraper.HEADERS)
+            if response.status_code != 200:
+                logger.debug(f"Indeed HTTP {response.status_code} for {url}")
+                return None
+
+            results = self._extract_mosaic_results(response.text)
+            if results is None:
+                return None
+
+        except Exception as e:
+            logger.debug(f"Indeed HTTP fetch failed for {url}: {e}")
+            return None
+
+        jobs = []
+        for result in results:
+            try:
+                job = self._parse_mosaic_result(result)
+                if job:
+                    jobs.append(job)
+            except Exception as e:
+                logger.warning(f"Failed to parse Indeed job result: {e}")
+        return jobs
+
+    def _extract_mosaic_results(self, page_html: str) -> Optional[List[Dict[str, Any]]]:
+        """Pull the job card list out of the mosaic-provider-jobcards blob"""
+        match = _MOSAIC_JOBCARDS_RE.search(page_html)
+        if not match:
+            return None
+
+        try:
+            # raw_decode stops at the end of the object, wherever the script goes next
+            data, _ = json.JSONDecoder().raw_decode(page_html, match.end())
+            return data["metaData"]["mosaicProviderJobCardsModel"]["results"]
+        except (ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Could not decode Indeed job card JSON: {e}")
+            return None
+
+    def _parse_mosaic_result(self, result: Dict[str, Any]) -> Optional[ScrapedJob]:
+        """Parse one embedded job-card JSON object into ScrapedJob"""
+        job_key = result.get("jobkey")
+        title = (result.get("displayTitle") or result.get("title") or "").strip()
+        if not job_key or not title:
+            return None
+
+        location = result.get("formattedLocation") or None
+        location_type = self._parse_location_type(location) if location else None
+        if not location_type and result.get("remoteLocation"):
+            location_type = "remote"
+
+        salary_text = (result.get("salarySnippet") or {}).get("text") or None
+        salary_min, salary_max, salary_currency = self._parse_salary(salary_text)
+
+        posted_text = result.get("formattedRelativeTime") or None
+        posted_date = self._parse_posted_date(posted_text) if posted_text else None
+
+        snippet = html.unescape(_TAG_RE.sub(" ", result.get("snippet") or ""))
+
+        return ScrapedJob(
+            url=f"{self.base_url}/viewjob?jk={job_key}",
+            title=title,
+            company_name=(result.get("company") or "Unknown").strip(),
+            description=self._clean_description(snippet),  # Will be expanded in get_job_details
+            source=self.source_name,
+            location=location,
+            location_type=location_type,
+            salary_text=salary_text,
+            salary_min=salary_min,
+            salary_max=salary_max,
+            salary_currency=salary_currency,
+            posted_date=posted_date,
+            posted_text=posted_text,
+        )
+
+    # ============== Browser Path ==============
+
+    async def _scrape_page_with_browser(self, url: str, page: int) -> Optional[List[ScrapedJob]]:
+        """Scrape one search page in the browser; None if navigation failed"""
+        if not await self._navigate(url):
+            logger.warning(f"Failed to navigate to Indeed search page {page + 1}")
+            return None
+
+        # Wait for job cards to load
+        await self._wait_for_selector(".job_seen_beacon, .jobsearch-ResultsList", timeout=10000)
+
+        # Scroll to load lazy content
+        for _ in range(3):
+            await self._human_scroll()
+
+        if lxml_html is not None:
+            return await self._parse_card_snapshot(self.CARD_SELECTOR)
+
+        # Extract job cards using async methods
+        job_cards = await self._query_selector_all(self.CARD_SELECTOR)
+
+        jobs = []
+        for card in job_cards:
+            try:
+                job = await self._parse_job_card(card)
+                if job:
+                    jobs.append(job)
+            except Exception as e:
+                logger.warning(f"Failed to parse Indeed job card: {e}")
+                continue
+        return jobs
+
+    async def _parse_card_snapshot(self, selector: str) -> List[ScrapedJob]:
+        """Grab every card's outerHTML in one browser call and parse them with lxml"""
+        try:
+            card_htmls = await self._page.eval_on_selector_all(
+                selector, "cards => cards.map(card => card.outerHTML)"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to snapshot Indeed job cards: {e}")
+            return []
+
+        jobs = []
+        for card_html in card_htmls:
+            try:
+                job = self._parse_card_html(card_html)
+                if job:
+                    jobs.append(job)
+            except Exception as e:
+                logger.warning(f"Failed to parse Indeed job card: {e}")
+        return jobs
+
+    def _parse_card_html(self, card_html: str) -> Optional[ScrapedJob]:
+        """Parse one job card's outerHTML into ScrapedJob"""
+        card = lxml_html.fromstring(card_html)
+
+        title_nodes = _CARD_TITLE_XPATH(card)
+        if not title_nodes:
+            return None
+
+        job_url = title_nodes[0].get("href")
+        if job_url and not job_url.startswith("http"):
+            job_url = f"{self.base_url}{job_url}"
+
+        location = _first_text(card, _CARD_LOCATION_XPATH)
+        salary_text = _first_text(card, _CARD_SALARY_XPATH)
+        posted_text = _first_text(card, _CARD_DATE_XPATH)
+
+        salary_min, salary_max, salary_currency = None, None, "USD"
+        if salary_text is not None:
+            salary_min, salary_max, salary_currency = self._parse_salary(salary_text)
+
+        company_name = _first_text(card, _CARD_COMPANY_XPATH)
+
+        return ScrapedJob(
+            url=job_url,
+            title=_first_text(card, _CARD_TITLE_XPATH),
+            company_name=company_name if company_name is not None else "Unknown",
+            description=_first_text(card, _CARD_SNIPPET_XPATH) or "",  # Will be expanded in get_job_details
+            source=self.source_name,
+            location=location,
+            location_type=self._parse_location_type(location) if location else None,
+            salary_text=salary_text,
+            salary_min=salary_min,
+            salary_max=salary_max,
+            salary_currency=salary_currency,
+            posted_date=self._parse_posted_date(posted_text) if posted_text else None,
+            posted_text=posted_text,
+        )
+
     async def _parse_job_card(self, card) -> Optional[ScrapedJob]:
         """Parse a job card element into ScrapedJob (async)"""
         try:
-            # Get job title and URL
-            title_el = await card.query_selector("h2.jobTitle a, a.jcs-JobTitle")
+            # Independent lookups: one round trip to the browser instead of six
+            title_el, company_el, location_el, salary_el, date_el, snippet_el = await asyncio.gather(
+                card.query_selector("h2.jobTitle a, a.jcs-JobTitle"),
+                card.query_selector("[data-testid='company-name'], .companyName"),
+                card.query_selector("[data-testid='text-location'], .companyLocation"),
+                card.query_selector(".salary-snippet-container, .estimated-salary, [data-testid='attribute_snippet_testid']"),
+                card.query_selector(".date, [data-testid='myJobsStateDate']"),
+                card.query_selector(".job-snippet, [data-testid='job-snippet']"),
+            )
             if not title_el:
                 return None
 
-            title = (await title_el.inner_text()).strip()
-            job_url = await title_el.get_attribute("href")
+            async def text_of(el) -> Optional[str]:
+                return (await el.inner_text()).strip() if el else None
+
+            title, job_url, company_name, location, salary_text, posted_text, snippet = await asyncio.gather(
+                text_of(title_el),
+                title_el.get_attribute("href"),
+                text_of(company_el),
+                text_of(location_el),
+                text_of(salary_el),
+                text_of(date_el),
+                text_of(snippet_el),
+            )
 
             if job_url and not job_url.startswith("http"):
                 job_url = f"{self.base_url}{job_url}"
 
-            # Get company name
-            company_el = await card.query_selector("[data-testid='company-name'], .companyName")
-            company_name = (await company_el.inner_text()).strip() if company_el else "Unknown"
-
-            # Get location
-            location_el = await card.query_selector("[data-testid='text-location'], .companyLocation")
-            location = (await location_el.inner_text()).strip() if location_el else None
+            company_name = company_name if company_name is not None else "Unknown"
+            snippet = snippet or ""
 
             # Parse location type
             location_type = self._parse_location_type(location) if location else None
 
-            # Get salary if available
-            salary_el = await card.query_selector(".salary-snippet-container, .estimated-salary, [data-testid='attribute_snippet_testid']")
-            salary_text = None
+            # Parse salary if available
             salary_min = None
             salary_max = None
             salary_currency = "USD"
 
-            if salary_el:
-                salary_text = (await salary_el.inner_text()).strip()
+            if salary_text is not None:
                 salary_min, salary_max, salary_currency = self._parse_salary(salary_text)
 
-            # Get posted date
-            date_el = await card.query_selector(".date, [data-testid='myJobsStateDate']")
-            posted_text = (await date_el.inner_text()).strip() if date_el else None
+            # Parse posted date
             posted_date = self._parse_posted_date(posted_text) if posted_text else None
 
-            # Get job snippet/description preview
-            snippet_el = await card.query_selector(".job-snippet, [data-testid='job-snippet']")
-            snippet = (await snippet_el.inner_text()).strip() if snippet_el else ""
-
             return ScrapedJob(
                 url=job_url,
                 title=title,
@@ -208,6 +427,7 @@ class IndeedScraper(BaseScraper):
         """Get full job details from listing page"""
         logger.debug(f"Fetching Indeed job details: {url}")
 
+        await self._init_browser()
         if not await self._navigate(url):
             return None
 
@@ -6,19 +6,31 @@ fallback sources, and partial result aggregation.
 """
 
 import asyncio
+import heapq
 import logging
-import hashlib
-from typing import List, Optional, Dict, Any, AsyncGenerator, Set
+import random
+from typing import List, Optional, Dict, Any, AsyncGenerator, Set, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import date
 from enum import Enum
 
 from .base_scraper import ScrapedJob, get_all_scrapers, BaseScraper
 from .proxy_pool import get_proxy_pool
+from .cache import build_cache_key
 
 logger = logging.getLogger(__name__)
 
 
+# Ordinal of undated jobs, so they sort last when ordering newest first
+_NO_DATE = date.min.toordinal()
+
+
+def _posted_key(job: ScrapedJob) -> int:
+    """Posted date as an ordinal; ints compare faster than date objects"""
+    posted = job.posted_date
+    return posted.toordinal() if posted else _NO_DATE
+
+
 class ScraperStatus(Enum):
     """Status of a scraper execution"""
     PENDING = "pending"
@@ -27,6 +39,7 @@ class ScraperStatus(Enum):
     PARTIAL = "partial"
     FAILED = "failed"
     TIMEOUT = "timeout"
+    CANCELLED = "cancelled"  # Stopped early once min_results was reached
 
 
 @dataclass
@@ -77,6 +90,19 @@ class ScraperOrchestrator:
     - Configurable timeouts
     """
 
+    # Upper bound on the sleep between retries of one source
+    MAX_BACKOFF_SECONDS = 30
+
+    # Sources at or above this priority (Tier 1) are always awaited;
+    # slower ones are cancelled once min_results (when given) is reached
+    FAST_SOURCE_PRIORITY = 70
+
+    # Jobs search_streaming buffers ahead of a slow consumer
+    STREAM_QUEUE_SIZE = 500
+
+    # Jobs kept from one source per search
+    MAX_JOBS_PER_SOURCE = 50
+
     def __init__(
         self,
         max_retries: int = 3,
@@ -109,6 +135,12 @@ class ScraperOrchestrator:
             "linkedin": 20,
             "glassdoor": 10,
         }
+        # The table is fixed after construction, so order it once
+        self._ordered_sources = [
+            source for source, _ in sorted(
+                self.source_priority.items(), key=lambda item: item[1], reverse=True
+            )
+        ]
 
     def _get_cache_key(
         self,
@@ -116,13 +148,8 @@ class ScraperOrchestrator:
         location: Optional[str],
         filters: Optional[Dict],
     ) -> str:
-        """Generate cache key for search parameters"""
-        key_parts = [
-            ":".join(sorted(keywords)) if keywords else "",
-            location or "",
-            hashlib.md5(str(sorted(filters.items()) if filters else "").encode()).hexdigest()[:8],
-        ]
-        return f"search:{':'.join(key_parts)}"
+        """Generate cache key for search parameters (same key as SearchCache)"""
+        return build_cache_key(keywords, location, filters)
 
     async def _run_scraper_with_retry(
         self,
@@ -135,7 +162,8 @@ class ScraperOrchestrator:
         """Run a single scraper with retry logic"""
         source = scraper.source_name
         result = ScraperResult(source=source, status=ScraperStatus.PENDING)
-        start_time = datetime.now()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
 
         for attempt in range(self.max_retries):
             try:
@@ -144,16 +172,22 @@ class ScraperOrchestrator:
 
                 jobs = []
                 async with scraper:
-                    async for job in scraper.search(keywords, location, filters):
-                        jobs.append(job)
-
-                        # Yield partial results early
-                        if len(jobs) >= 50:
-                            break
+                    search_list = getattr(scraper, "search_list", None)
+                    if search_list is not None:
+                        # Scrapers that build every job from one response
+                        # hand them over at once instead of via a generator
+                        jobs = (await search_list(keywords, location, filters))[:self.MAX_JOBS_PER_SOURCE]
+                    else:
+                        async for job in scraper.search(keywords, location, filters):
+                            jobs.append(job)
+
+                            # Yield partial results early
+                            if len(jobs) >= self.MAX_JOBS_PER_SOURCE:
+                                break
 
                 result.jobs = jobs
                 result.status = ScraperStatus.SUCCESS if jobs else ScraperStatus.PARTIAL
-                result.duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+                result.duration_ms = int((loop.time() - start_time) * 1000)
 
                 logger.info(f"[{source}] Found {len(jobs)} jobs in {result.duration_ms}ms")
                 return result
@@ -169,7 +203,7 @@ class ScraperOrchestrator:
                     result.status = ScraperStatus.FAILED
                     result.error = str(e)
                     logger.warning(f"[{source}] Browser scraper unavailable on this platform")
-                    result.duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+                    result.duration_ms = int((loop.time() - start_time) * 1000)
                     return result
                 else:
                     result.error = str(e)
@@ -181,11 +215,14 @@ class ScraperOrchestrator:
 
                 # Exponential backoff
                 if attempt < self.max_retries - 1:
-                    wait_time = (2 ** attempt) + (asyncio.get_event_loop().time() % 1)
+                    wait_time = min(
+                        (2 ** attempt) + random.uniform(0, 1),
+                        self.MAX_BACKOFF_SECONDS,
+                    )
                     await asyncio.sleep(wait_time)
 
         result.status = ScraperStatus.FAILED
-        result.duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        result.duration_ms = int((loop.time() - start_time) * 1000)
         return result
 
     async def search(
@@ -194,7 +231,8 @@ class ScraperOrchestrator:
         location: Optional[str] = None,
         filters: Optional[Dict] = None,
         sources: Optional[List[str]] = None,
-        min_results: int = 10,
+        min_results: Optional[int] = None,
+        top_n: Optional[int] = None,
     ) -> OrchestratorResult:
         """
         Search across multiple job sources.
@@ -204,12 +242,16 @@ class ScraperOrchestrator:
             location: Location filter (or "remote")
             filters: Additional filters
             sources: Specific sources to use (None = all)
-            min_results: Minimum results before stopping early
+            min_results: Opt-in early stop (None = wait for every source);
+                once reached and the fast sources have finished, slower ones
+                are cancelled and reported in sources_partial
+            top_n: Only return the newest top_n jobs (None = all)
 
         Returns:
             OrchestratorResult with aggregated jobs
         """
-        start_time = datetime.now()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         cache_key = self._get_cache_key(keywords, location, filters)
 
         # Get available scrapers
@@ -220,12 +262,9 @@ class ScraperOrchestrator:
         else:
             scrapers_to_use = all_scrapers
 
-        # Sort by priority
-        sorted_sources = sorted(
-            scrapers_to_use.keys(),
-            key=lambda x: self.source_priority.get(x, 0),
-            reverse=True
-        )
+        # Priority order, with sources missing from the table last
+        sorted_sources = [s for s in self._ordered_sources if s in scrapers_to_use]
+        sorted_sources += [s for s in scrapers_to_use if s not in self.source_priority]
 
         logger.info(f"Starting search with {len(sorted_sources)} sources: {sorted_sources}")
 
@@ -251,8 +290,12 @@ class ScraperOrchestrator:
         # Run scrapers in parallel with semaphore
         semaphore = asyncio.Semaphore(self.max_parallel)
         results: List[ScraperResult] = []
-        all_jobs: List[ScrapedJob] = []
-        seen_hashes: Set[str] = set()
+
+        # content_digest -> (source rank, position, job). The higher-priority
+        # source keeps a duplicate no matter which scraper finishes first.
+        # This exact map lives only for this call, so it stays small and
+        # never drops a new job the way a Bloom filter could.
+        best: Dict[bytes, Tuple[int, int, ScrapedJob]] = {}
 
         async def run_with_limit(scraper: BaseScraper, proxy: Optional[str]):
             async with semaphore:
@@ -269,49 +312,80 @@ class ScraperOrchestrator:
                     )
 
         # Assign proxies to scrapers (round-robin if fewer proxies than scrapers)
-        tasks = []
+        tasks: Dict[asyncio.Task, str] = {}
+        fast_pending: Set[asyncio.Task] = set()
+        source_rank: Dict[str, int] = {}
         for i, scraper in enumerate(scraper_instances):
             proxy = proxies[i % len(proxies)] if proxies else None
-            tasks.append(run_with_limit(scraper, proxy))
+            task = asyncio.create_task(run_with_limit(scraper, proxy))
+            tasks[task] = scraper.source_name
+            source_rank.setdefault(scraper.source_name, i)
+            if self.source_priority.get(scraper.source_name, 0) >= self.FAST_SOURCE_PRIORITY:
+                fast_pending.add(task)
 
-        # Gather results
-        scraper_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
+        # Process results as each scraper finishes
         sources_succeeded = []
         sources_failed = []
         sources_partial = []
 
-        for result in scraper_results:
-            if isinstance(result, Exception):
-                logger.error(f"Scraper exception: {result}")
-                continue
-
-            if not isinstance(result, ScraperResult):
-                continue
-
-            results.append(result)
-
-            if result.status == ScraperStatus.SUCCESS:
-                sources_succeeded.append(result.source)
-            elif result.status == ScraperStatus.PARTIAL:
-                sources_partial.append(result.source)
-            else:
-                sources_failed.append(result.source)
-
-            # Deduplicate jobs by content hash
-            for job in result.jobs:
-                if job.content_hash not in seen_hashes:
-                    seen_hashes.add(job.content_hash)
-                    all_jobs.append(job)
-
-        # Sort jobs by posted date (newest first)
-        all_jobs.sort(
-            key=lambda j: j.posted_date or datetime.min.date(),
-            reverse=True
-        )
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                result = await next_done
+            except Exception as e:
+                logger.error(f"Scraper exception: {e}")
+                result = None
+            fast_pending.difference_update([t for t in fast_pending if t.done()])
+
+            if isinstance(result, ScraperResult):
+                results.append(result)
+
+                if result.status == ScraperStatus.SUCCESS:
+                    sources_succeeded.append(result.source)
+                elif result.status == ScraperStatus.PARTIAL:
+                    sources_partial.append(result.source)
+                else:
+                    sources_failed.append(result.source)
+
+                # Deduplicate jobs by content digest (hashed once per job)
+                rank = source_rank.get(result.source, len(source_rank))
+                for position, job in enumerate(result.jobs):
+                    digest = job.content_digest
+                    kept = best.get(digest)
+                    if kept is None or (rank, position) < kept[:2]:
+                        best[digest] = (rank, position, job)
+
+            # Enough jobs once the fast tier has answered: stop waiting on slow sources
+            if min_results is not None and len(best) >= min_results and not fast_pending:
+                break
+
+        pending = [task for task in tasks if not task.done()]
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for task in pending:
+                results.append(ScraperResult(
+                    source=tasks[task],
+                    status=ScraperStatus.CANCELLED,
+                    error=f"Cancelled after {len(best)} results",
+                ))
+                sources_partial.append(tasks[task])
+            logger.info(
+                f"Stopped early with {len(best)} jobs; cancelled "
+                f"{[tasks[task] for task in pending]}"
+            )
+
+        all_jobs = [job for _, _, job in sorted(best.values(), key=lambda kept: kept[:2])]
+
+        # Sort jobs by posted date (newest first); a bounded heap when
+        # the caller only wants the top_n
+        total_found = len(all_jobs)
+        if top_n is not None and top_n < total_found:
+            all_jobs = heapq.nlargest(top_n, all_jobs, key=_posted_key)
+        else:
+            all_jobs.sort(key=_posted_key, reverse=True)
 
-        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        duration_ms = int((loop.time() - start_time) * 1000)
 
         logger.info(
             f"Search completed: {len(all_jobs)} jobs from "
@@ -320,7 +394,7 @@ class ScraperOrchestrator:
 
         return OrchestratorResult(
             jobs=all_jobs,
-            total_found=len(all_jobs),
+            total_found=total_found,
             sources_succeeded=sources_succeeded,
             sources_failed=sources_failed,
             sources_partial=sources_partial,
@@ -348,23 +422,36 @@ class ScraperOrchestrator:
         else:
             scrapers_to_use = all_scrapers
 
-        seen_hashes: Set[str] = set()
-        queue: asyncio.Queue[Optional[ScrapedJob]] = asyncio.Queue()
+        seen_hashes: Set[bytes] = set()
+        # Bounded so fast scrapers wait for the consumer instead of buffering
+        queue: asyncio.Queue[Optional[ScrapedJob]] = asyncio.Queue(maxsize=self.STREAM_QUEUE_SIZE)
+        semaphore = asyncio.Semaphore(self.max_parallel)
+
+        async def offer(job: ScrapedJob):
+            digest = job.content_digest
+            if digest not in seen_hashes:
+                seen_hashes.add(digest)
+                await queue.put(job)
 
         async def run_scraper(source: str, scraper_class):
             try:
-                scraper = scraper_class()
-                async with scraper:
-                    async for job in scraper.search(keywords, location, filters):
-                        if job.content_hash not in seen_hashes:
-                            seen_hashes.add(job.content_hash)
-                            await queue.put(job)
+                async with semaphore:
+                    scraper = scraper_class()
+                    async with scraper:
+                        search_list = getattr(scraper, "search_list", None)
+                        if search_list is not None:
+                            for job in await search_list(keywords, location, filters):
+                                await offer(job)
+                        else:
+                            async for job in scraper.search(keywords, location, filters):
+                                await offer(job)
             except Exception as e:
                 logger.warning(f"[{source}] Error: {e}")
-            finally:
-                await queue.put(None)  # Signal completion
+            # Not in a finally: a cancelled producer has no consumer left to
+            # signal, and put() could block forever on a full queue
+            await queue.put(None)  # Signal completion
 
-        # Start all scrapers
+        # Start all scrapers (at most max_parallel run at once)
         tasks = [
             asyncio.create_task(run_scraper(source, cls))
             for source, cls in scrapers_to_use.items()
@@ -373,16 +460,21 @@ class ScraperOrchestrator:
         completed = 0
         total = len(tasks)
 
-        # Yield jobs as they arrive
-        while completed < total:
-            job = await queue.get()
-            if job is None:
-                completed += 1
-            else:
-                yield job
-
-        # Ensure all tasks complete
-        await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            # Yield jobs as they arrive
+            while completed < total:
+                job = await queue.get()
+                if job is None:
+                    completed += 1
+                else:
+                    yield job
+        finally:
+            # A consumer that stops early would leave producers blocked on put()
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            # Ensure all tasks complete
+            await asyncio.gather(*tasks, return_exceptions=True)
 
 
 # Convenience function
@@ -6,10 +6,13 @@ Maintains a pool of working proxies with health checking.
 """
 
 import asyncio
+import heapq
 import httpx
 import logging
 import random
+import re
 import time
+from itertools import islice
 from typing import Optional, List, Set, Dict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -72,8 +75,13 @@ PROXY_SOURCES = [
     "https://raw.githubusercontent.com/jetkai/proxy-list/main/online-proxies/txt/proxies-http.txt",
 ]
 
-# Test URL for proxy validation
-TEST_URL = "https://httpbin.org/ip"
+# One "ip:port" entry per line in the proxy list files
+_PROXY_LINE_RE = re.compile(rb"(?m)^[ \t]*(\d{1,3}(?:\.\d{1,3}){3}):(\d{1,5})[ \t\r]*$")
+
+# Test URL for proxy validation: plain HTTP (no TLS handshake through the
+# proxy) to a CDN endpoint that answers 204 with an empty body
+TEST_URL = "http://cp.cloudflare.com/"
+TEST_OK_STATUSES = (200, 204)
 
 
 class ProxyPool:
@@ -87,6 +95,11 @@ class ProxyPool:
     - Automatic refresh when pool runs low
     """
 
+    # Cheap TCP-connect pre-filter run before the full HTTP validation
+    TCP_CONNECT_TIMEOUT = 2.0
+    TCP_CONCURRENCY = 100
+    VALIDATION_CONCURRENCY = 10
+
     def __init__(
         self,
         min_pool_size: int = 10,
@@ -100,6 +113,8 @@ class ProxyPool:
         self.refresh_interval = refresh_interval
 
         self._proxies: Dict[str, Proxy] = {}
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._retired_clients: List[httpx.AsyncClient] = []
         self._blacklist: Set[str] = set()
         self._lock = asyncio.Lock()
         self._last_refresh: Optional[datetime] = None
@@ -127,54 +142,100 @@ class ProxyPool:
         """Fetch proxies from free proxy lists"""
         all_proxies: Set[str] = set()
 
+        # The lists are independent, so fetch them all at once
         async with httpx.AsyncClient(timeout=30.0) as client:
-            for source_url in PROXY_SOURCES:
-                try:
-                    response = await client.get(source_url)
-                    if response.status_code == 200:
-                        lines = response.text.strip().split("\n")
-                        for line in lines:
-                            line = line.strip()
-                            if ":" in line and line not in self._blacklist:
-                                all_proxies.add(line)
-                        logger.debug(f"Fetched {len(lines)} proxies from {source_url}")
-                except Exception as e:
-                    logger.warning(f"Failed to fetch from {source_url}: {e}")
+            responses = await asyncio.gather(
+                *[client.get(source_url) for source_url in PROXY_SOURCES],
+                return_exceptions=True
+            )
+
+        for source_url, response in zip(PROXY_SOURCES, responses):
+            if isinstance(response, Exception):
+                logger.warning(f"Failed to fetch from {source_url}: {response}")
+                continue
+            if response.status_code == 200:
+                # Match the whole body at once instead of line by line
+                found = {
+                    f"{host.decode()}:{port.decode()}"
+                    for host, port in _PROXY_LINE_RE.findall(response.content)
+                }
+                all_proxies |= found
+                logger.debug(f"Fetched {len(found)} proxies from {source_url}")
 
         # Parse and add proxies
-        for proxy_str in list(all_proxies)[:200]:  # Limit to 200 for validation
-            try:
-                host, port = proxy_str.split(":")
-                proxy = Proxy(host=host, port=int(port))
-                self._proxies[proxy.url] = proxy
-            except (ValueError, IndexError):
-                continue
+        all_proxies -= self._blacklist
+        for proxy_str in islice(all_proxies, 200):  # Limit to 200 for validation
+            host, port = proxy_str.split(":")
+            proxy = Proxy(host=host, port=int(port))
+            self._proxies[proxy.url] = proxy
 
         logger.info(f"Fetched {len(self._proxies)} proxies for validation")
         self._last_refresh = datetime.now()
 
+    def _get_client(self, proxy_url: str) -> httpx.AsyncClient:
+        """
+        Get the HTTP client routed through a proxy, creating it on first use.
+
+        Clients are kept per proxy so re-validation during background
+        refresh reuses the open connection instead of reconnecting.
+        """
+        client = self._clients.get(proxy_url)
+        if client is None:
+            client = httpx.AsyncClient(proxy=proxy_url, timeout=self.validation_timeout)
+            self._clients[proxy_url] = client
+        return client
+
+    async def _discard_client(self, proxy_url: str):
+        """Drop and close the cached client for a proxy"""
+        client = self._clients.pop(proxy_url, None)
+        if client is not None:
+            await client.aclose()
+
+    async def _close_retired_clients(self):
+        """Close clients dropped from synchronous code (report_failure)"""
+        retired, self._retired_clients = self._retired_clients, []
+        for client in retired:
+            await client.aclose()
+
     async def _validate_proxy(self, proxy: Proxy) -> bool:
         """Validate a single proxy"""
         try:
             start_time = time.time()
 
-            async with httpx.AsyncClient(
-                proxy=proxy.url,
-                timeout=self.validation_timeout,
-            ) as client:
-                response = await client.get(TEST_URL)
+            client = self._get_client(proxy.url)
+            response = await client.get(TEST_URL)
 
-                if response.status_code == 200:
-                    proxy.response_time = time.time() - start_time
-                    proxy.last_checked = datetime.now()
-                    proxy.success_count += 1
-                    return True
+            if response.status_code in TEST_OK_STATUSES:
+                proxy.response_time = time.time() - start_time
+                proxy.last_checked = datetime.now()
+                proxy.success_count += 1
+                return True
 
         except Exception:
             proxy.fail_count += 1
 
+        # Don't keep a connection to a proxy that just failed validation
+        await self._discard_client(proxy.url)
         return False
 
+    async def _tcp_alive(self, proxy: Proxy) -> bool:
+        """Check that the proxy accepts a TCP connection at all"""
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(proxy.host, proxy.port),
+                timeout=self.TCP_CONNECT_TIMEOUT,
+            )
+        except Exception:
+            proxy.fail_count += 1
+            return False
+
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+        return True
+
     async def _validate_proxies(self, sample_size: int = 50):
         """Validate a sample of proxies concurrently"""
         proxies_to_check = list(self._proxies.values())[:sample_size]
@@ -184,15 +245,30 @@ class ProxyPool:
 
         logger.info(f"Validating {len(proxies_to_check)} proxies...")
 
+        # Most dead free proxies refuse the connection outright, so a bare
+        # TCP connect weeds them out before paying for an HTTP round trip
+        connect_semaphore = asyncio.Semaphore(self.TCP_CONCURRENCY)
+
+        async def connect_with_limit(proxy: Proxy):
+            async with connect_semaphore:
+                return await self._tcp_alive(proxy)
+
+        alive = await asyncio.gather(
+            *[connect_with_limit(p) for p in proxies_to_check],
+            return_exceptions=True
+        )
+        reachable = [p for p, ok in zip(proxies_to_check, alive) if ok is True]
+        logger.debug(f"{len(reachable)}/{len(proxies_to_check)} proxies accepted a TCP connection")
+
         # Validate concurrently with limited parallelism
-        semaphore = asyncio.Semaphore(10)
+        semaphore = asyncio.Semaphore(self.VALIDATION_CONCURRENCY)
 
         async def validate_with_limit(proxy: Proxy):
             async with semaphore:
                 return await self._validate_proxy(proxy)
 
         results = await asyncio.gather(
-            *[validate_with_limit(p) for p in proxies_to_check],
+            *[validate_with_limit(p) for p in reachable],
             return_exceptions=True
         )
 
@@ -204,6 +280,8 @@ class ProxyPool:
             if not proxy.is_healthy:
                 self._blacklist.add(f"{proxy.host}:{proxy.port}")
                 del self._proxies[proxy.url]
+                await self._discard_client(proxy.url)
+        await self._close_retired_clients()
 
     async def _background_refresh(self):
         """Background task to refresh proxy pool"""
@@ -231,16 +309,15 @@ class ProxyPool:
         if not self._initialized:
             await self.initialize()
 
-        healthy_proxies = [p for p in self._proxies.values() if p.is_healthy]
+        # Pick randomly from the top 5 by score without sorting the pool
+        top_proxies = heapq.nlargest(
+            5, (p for p in self._proxies.values() if p.is_healthy), key=lambda p: p.score
+        )
 
-        if not healthy_proxies:
+        if not top_proxies:
             logger.warning("No healthy proxies available")
             return None
 
-        # Sort by score and pick from top 5 randomly
-        healthy_proxies.sort(key=lambda p: p.score, reverse=True)
-        top_proxies = healthy_proxies[:min(5, len(healthy_proxies))]
-
         selected = random.choice(top_proxies)
         return selected.url
 
@@ -249,10 +326,9 @@ class ProxyPool:
         if not self._initialized:
             await self.initialize()
 
-        healthy_proxies = [p for p in self._proxies.values() if p.is_healthy]
-        healthy_proxies.sort(key=lambda p: p.score, reverse=True)
-
-        selected = healthy_proxies[:min(count, len(healthy_proxies))]
+        selected = heapq.nlargest(
+            count, (p for p in self._proxies.values() if p.is_healthy), key=lambda p: p.score
+        )
         return [p.url for p in selected]
 
     def report_success(self, proxy_url: str):
@@ -270,6 +346,10 @@ class ProxyPool:
                 proxy = self._proxies[proxy_url]
                 self._blacklist.add(f"{proxy.host}:{proxy.port}")
                 del self._proxies[proxy_url]
+                # Sync caller: close it on the next validation pass or close()
+                client = self._clients.pop(proxy_url, None)
+                if client is not None:
+                    self._retired_clients.append(client)
                 logger.debug(f"Removed unhealthy proxy: {proxy_url}")
 
     @property
@@ -291,6 +371,11 @@ class ProxyPool:
             except asyncio.CancelledError:
                 pass
 
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            await client.aclose()
+        await self._close_retired_clients()
+
 
 # Global proxy pool instance
 _proxy_pool: Optional[ProxyPool] = None
@@ -0,0 +1,174 @@
+"""Unit Tests for the scraper result cache"""
+
+from datetime import date
+
+from src.ui.api.scrapers import cache as cache_module
+from src.ui.api.scrapers import orchestrator
+from src.ui.api.scrapers.base_scraper import ScrapedJob
+from src.ui.api.scrapers.cache import (
+    InMemoryCache,
+    SearchCache,
+    TieredCache,
+    build_cache_key,
+    get_cached_or_search,
+)
+from src.ui.api.scrapers.orchestrator import OrchestratorResult, ScraperOrchestrator
+
+
+def make_job(**overrides) -> ScrapedJob:
+    """Build a job with sensible defaults"""
+    fields = {
+        "url": "https://example.com/jobs/1",
+        "title": "Backend Engineer",
+        "company_name": "Acme",
+        "description": "Build APIs",
+        "source": "builtin",
+    }
+    fields.update(overrides)
+    return ScrapedJob(**fields)
+
+
+class TestScrapedJobCacheRoundTrip:
+    """Test ScrapedJob.to_cache_dict / from_dict_fast"""
+
+    def test_round_trip_keeps_every_field(self):
+        """Test that a cached job comes back unchanged"""
+        job = make_job(
+            posted_date=date(2024, 3, 1),
+            posted_text="2 days ago",
+            job_type="full-time",
+            experience_level="senior",
+            location="Austin, TX",
+        )
+
+        restored = ScrapedJob.from_dict_fast(job.to_cache_dict())
+
+        assert restored.posted_date == date(2024, 3, 1)
+        assert restored.posted_text == "2 days ago"
+        assert restored.job_type == "full-time"
+        assert restored.experience_level == "senior"
+        assert restored.scraped_at == job.scraped_at
+        assert restored.content_hash == job.content_hash
+
+    def test_posted_date_string_is_parsed(self):
+        """Test that to_dict()'s ISO posted_date is restored as a date"""
+        job = make_job(posted_date=date(2024, 3, 1))
+
+        restored = ScrapedJob.from_dict_fast(job.to_dict())
+
+        assert restored.posted_date == date(2024, 3, 1)
+
+    def test_invalid_posted_date_becomes_none(self):
+        """Test that an unparseable posted_date doesn't leak through as a str"""
+        restored = ScrapedJob.from_dict_fast({**make_job().to_dict(), "posted_date": "yesterday"})
+
+        assert restored.posted_date is None
+
+    def test_cached_and_fresh_jobs_sort_together(self):
+        """Test that restored jobs can be ordered alongside fresh ones"""
+        fresh = make_job(url="https://example.com/jobs/2", posted_date=date(2024, 3, 5))
+        undated = make_job(url="https://example.com/jobs/3")
+        cached = ScrapedJob.from_dict_fast(make_job(posted_date=date(2024, 3, 1)).to_dict())
+
+        ordered = sorted([cached, undated, fresh], key=orchestrator._posted_key, reverse=True)
+
+        assert ordered == [fresh, cached, undated]
+
+
+class TestSearchCacheJobEntries:
+    """Test the per-job cache kept next to search results"""
+
+    async def test_job_entries_use_their_own_backend(self, monkeypatch):
+        """Test that caching many jobs doesn't evict search results"""
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        cache = SearchCache()
+        await cache.set(["python"], None, None, [make_job()], ["builtin"], [])
+
+        for i in range(500):
+            job = make_job(url=f"https://example.com/jobs/{i}", posted_date=date(2024, 3, 1))
+            await cache.set_job(job.url, job.to_cache_dict())
+
+        cached = await cache.get(["python"])
+        assert cached is not None
+        assert cached.total_found == 1
+
+        restored = ScrapedJob.from_dict_fast(await cache.get_job("https://example.com/jobs/7"))
+        assert restored.posted_date == date(2024, 3, 1)
+
+    async def test_tiered_cache_evicts_least_recently_used(self):
+        """Test that the L1 tier is bounded and falls back to L2"""
+        l2 = InMemoryCache()
+        tiered = TieredCache(l2, max_entries=2)
+
+        await tiered.set("a", "1", 60)
+        await tiered.set("b", "2", 60)
+        await tiered.set("c", "3", 60)
+
+        assert list(tiered._l1) == ["b", "c"]
+        assert await tiered.get("a") == "1"
+
+    async def test_in_memory_job_entries_are_bounded(self, monkeypatch):
+        """Test that the default per-job cache evicts instead of growing forever"""
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        monkeypatch.setattr(SearchCache, "JOB_L1_ENTRIES", 3)
+        cache = SearchCache()
+
+        for i in range(5):
+            await cache.set_job(f"https://example.com/jobs/{i}", make_job().to_cache_dict())
+
+        assert len(cache._job_backend._cache) == 3
+        assert await cache.get_job("https://example.com/jobs/0") is None
+        assert await cache.get_job("https://example.com/jobs/4") is not None
+
+    def test_redis_job_entries_get_a_separate_l1(self, monkeypatch):
+        """Test that job cards and search results don't share L1 capacity"""
+        monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+        cache = SearchCache()
+
+        assert isinstance(cache._backend, TieredCache)
+        assert isinstance(cache._job_backend, TieredCache)
+        assert cache._job_backend is not cache._backend
+        assert cache._job_backend.max_entries == SearchCache.JOB_L1_ENTRIES
+
+
+class TestCacheKey:
+    """Test the cache key shared by SearchCache and the orchestrator"""
+
+    def test_key_ignores_keyword_order_case_and_whitespace(self):
+        """Test that equivalent searches share a key"""
+        assert build_cache_key(["Python", " go"], "Remote ", {"a": 1, "b": [1, 2]}) == (
+            build_cache_key(["go", "python"], "remote", {"b": [1, 2], "a": 1})
+        )
+
+    def test_key_is_fixed_length_and_unambiguous(self):
+        """Test that user input is hashed rather than spliced into the key"""
+        long_key = build_cache_key(["x" * 500], "remote", None)
+
+        assert len(long_key) == len(build_cache_key(["go"], None, None))
+        assert "xxxx" not in long_key
+        assert build_cache_key(["a:b"], None, None) != build_cache_key(["a", "b"], None, None)
+        assert build_cache_key(["a"], "b", None) != build_cache_key(["a", "b"], None, None)
+
+    async def test_hit_and_miss_report_the_same_key(self, monkeypatch):
+        """Test that get_cached_or_search reports one key for both paths"""
+        monkeypatch.setattr(cache_module, "_search_cache", SearchCache(backend=InMemoryCache()))
+
+        async def fake_search_jobs(keywords, location=None, filters=None, sources=None):
+            return OrchestratorResult(
+                jobs=[make_job()],
+                total_found=1,
+                sources_succeeded=["builtin"],
+                sources_failed=[],
+                sources_partial=[],
+                duration_ms=1,
+                cache_key=ScraperOrchestrator()._get_cache_key(keywords, location, filters),
+            )
+
+        monkeypatch.setattr(orchestrator, "search_jobs", fake_search_jobs)
+
+        miss = await get_cached_or_search(["python"], "remote", {"location_type": ["remote"]})
+        hit = await get_cached_or_search(["python"], "remote", {"location_type": ["remote"]})
+
+        assert miss.cached is False
+        assert hit.cached is True
+        assert hit.cache_key == miss.cache_key
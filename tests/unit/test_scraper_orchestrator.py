@@ -0,0 +1,115 @@
+"""Unit Tests for the Scraper Orchestrator"""
+
+import asyncio
+import pytest
+from datetime import date, timedelta
+
+from src.ui.api.scrapers import orchestrator
+from src.ui.api.scrapers.base_scraper import ScrapedJob
+from src.ui.api.scrapers.orchestrator import ScraperOrchestrator
+
+
+class FakeScraper:
+    """Scraper stand-in yielding numbered jobs after an optional delay"""
+
+    def __init__(self, source: str, count: int, delay: float = 0.0):
+        self.source_name = source
+        self.count = count
+        self.delay = delay
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def search(self, keywords, location=None, filters=None):
+        await asyncio.sleep(self.delay)
+        for i in range(self.count):
+            yield ScrapedJob(
+                url=f"https://{self.source_name}.example.com/{i}",
+                title=f"{self.source_name} engineer {i}",
+                company_name="Acme",
+                description="",
+                source=self.source_name,
+                posted_date=date(2024, 1, 1) + timedelta(days=i),
+            )
+
+
+class FakeListScraper(FakeScraper):
+    """Scraper stand-in that only supports the batch search_list path"""
+
+    async def search(self, keywords, location=None, filters=None):
+        raise AssertionError("search() should not be used when search_list exists")
+        yield
+
+    async def search_list(self, keywords, location=None, filters=None):
+        return [job async for job in FakeScraper.search(self, keywords, location, filters)]
+
+
+@pytest.fixture
+def fake_scrapers(monkeypatch):
+    """A fast Tier 1 source and a slow browser source"""
+    scrapers = {
+        "github": lambda: FakeScraper("github", 20),
+        "indeed": lambda: FakeScraper("indeed", 5, delay=5.0),
+    }
+    monkeypatch.setattr(orchestrator, "get_all_scrapers", lambda: scrapers)
+    return scrapers
+
+
+class TestOrchestratorEarlyStop:
+    """Test min_results early stopping and source status reporting"""
+
+    async def test_waits_for_every_source_by_default(self, fake_scrapers):
+        """Test that no source is cancelled unless min_results is given"""
+        fake_scrapers["indeed"] = lambda: FakeScraper("indeed", 5, delay=0.05)
+
+        result = await ScraperOrchestrator().search(["python"])
+
+        assert sorted(result.sources_succeeded) == ["github", "indeed"]
+        assert result.sources_partial == []
+        assert result.total_found == 25
+
+    async def test_cancelled_sources_are_reported(self, fake_scrapers):
+        """Test that slow sources cut off by min_results show up as partial"""
+        result = await ScraperOrchestrator().search(["python"], min_results=10)
+
+        assert result.sources_succeeded == ["github"]
+        assert result.sources_partial == ["indeed"]
+        assert result.sources_failed == []
+        assert result.total_found == 20
+
+    async def test_jobs_sorted_newest_first(self, fake_scrapers):
+        """Test that results come back newest first and honour top_n"""
+        result = await ScraperOrchestrator().search(["python"], min_results=1, top_n=3)
+
+        assert [job.posted_date for job in result.jobs] == [
+            date(2024, 1, 20), date(2024, 1, 19), date(2024, 1, 18),
+        ]
+        assert result.total_found == 20
+
+
+class TestOrchestratorSearchList:
+    """Test that batch scrapers are collected through search_list"""
+
+    async def test_search_uses_search_list(self, monkeypatch):
+        """Test that search_list is used and capped at MAX_JOBS_PER_SOURCE"""
+        monkeypatch.setattr(
+            orchestrator, "get_all_scrapers", lambda: {"google_dork": lambda: FakeListScraper("google_dork", 60)}
+        )
+
+        result = await ScraperOrchestrator().search(["python"])
+
+        assert result.sources_succeeded == ["google_dork"]
+        assert result.total_found == ScraperOrchestrator.MAX_JOBS_PER_SOURCE
+
+    async def test_search_streaming_uses_search_list(self, monkeypatch):
+        """Test that streaming also reads batch scrapers through search_list"""
+        monkeypatch.setattr(
+            orchestrator, "get_all_scrapers", lambda: {"google_dork": lambda: FakeListScraper("google_dork", 5)}
+        )
+
+        jobs = [job async for job in ScraperOrchestrator().search_streaming(["python"])]
+
+        assert len(jobs) == 5
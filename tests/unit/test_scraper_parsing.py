@@ -0,0 +1,158 @@
+"""Unit Tests for scraper text classifiers"""
+
+import json
+import re
+import pytest
+
+from src.ui.api.scrapers.builtin_scraper import BuiltInScraper, _classify
+from src.ui.api.scrapers.github_jobs_scraper import (
+    GITHUB_JOB_SOURCES,
+    GitHubJobsScraper,
+    _ListingMemos,
+)
+from src.ui.api.scrapers.google_dorking_scraper import GoogleDorkScraper, _COMPANY_PATTERNS
+
+
+def reference_extract_company(url: str) -> str:
+    """The original table-order loop the compiled patterns must agree with"""
+    for pattern, default_name in _COMPANY_PATTERNS:
+        match = re.search(pattern, url, re.IGNORECASE)
+        if match:
+            if default_name:
+                return default_name
+            return match.group(1).replace("-", " ").replace("_", " ").title()
+    return "Unknown Company"
+
+
+def reference_company_size(text: str):
+    """The original substring chain for BuiltIn company size"""
+    text = text.lower()
+    if any(x in text for x in ["1-10", "11-50", "1 - 50", "1-50", "startup"]):
+        return "startup"
+    elif any(x in text for x in ["51-200", "51 - 200"]):
+        return "small"
+    elif any(x in text for x in ["201-500", "501-1000"]):
+        return "medium"
+    elif any(x in text for x in ["1001-5000", "1,001-5,000"]):
+        return "large"
+    elif "5000" in text or "5,000" in text:
+        return "enterprise"
+    return None
+
+
+def reference_experience(text: str):
+    """The original substring chain for BuiltIn experience level"""
+    text = text.lower()
+    if any(x in text for x in ["entry", "junior", "0-2"]):
+        return "entry"
+    elif any(x in text for x in ["mid", "3-5", "intermediate"]):
+        return "mid"
+    elif any(x in text for x in ["senior", "5+", "lead"]):
+        return "senior"
+    return None
+
+
+class TestBuiltInClassifiers:
+    """Test BuiltIn company size and experience classification"""
+
+    @pytest.mark.parametrize("text", [
+        "1-10 Employees", "11-50 employees", "1 - 50", "Startup",
+        "51-200 Employees", "51 - 200", "1,001-5,000", "5000+ Employees", "5,000+",
+        "51-200 employees, startup culture", "Unknown", "",
+    ])
+    def test_company_size_matches_original_order(self, text):
+        """Test that size buckets keep the original priority"""
+        assert _classify(BuiltInScraper._SIZE_CLASSES, text) == reference_company_size(text)
+
+    @pytest.mark.parametrize("text, expected", [
+        ("201-500 Employees", "medium"),
+        ("501-1000 Employees", "medium"),
+        ("1001-5000 Employees", "large"),
+    ])
+    def test_company_size_ranges_do_not_match_inside_numbers(self, text, expected):
+        """Test the deliberate fix: '1-50' inside '201-500' is not a startup"""
+        assert _classify(BuiltInScraper._SIZE_CLASSES, text) == expected
+
+    @pytest.mark.parametrize("text", [
+        "Entry level", "Junior", "0-2 years", "Mid level", "3-5 years",
+        "Intermediate", "Senior", "5+ years", "Lead",
+        "Senior engineer mentoring junior staff", "Lead, mid-size team", "",
+    ])
+    def test_experience_matches_original_order(self, text):
+        """Test that experience buckets keep the original priority"""
+        assert _classify(BuiltInScraper._EXPERIENCE_CLASSES, text) == reference_experience(text)
+
+
+class TestExtractCompany:
+    """Test GoogleDorkScraper._extract_company"""
+
+    @pytest.mark.parametrize("url", [
+        "https://boards.greenhouse.io/acme_corp/jobs/123",
+        "https://acme.greenhouse.io/jobs/1",
+        "https://jobs.lever.co/foo-bar/abc",
+        "https://apply.workable.com/widgets/j/1",
+        "https://zeta.ashbyhq.com/role",
+        "https://careers.google.com/jobs/results/1",
+        "https://www.amazon.jobs/en/jobs/1",
+        "https://www.metacareers.com/jobs/1",
+        "https://careers.microsoft.com/us/en/job/1",
+        "https://jobs.apple.com/en-us/details/1",
+        "https://jobs.netflix.com/jobs/1",
+        "https://www.nvidia.com/en-us/about-nvidia/careers/",
+        "https://openai.com/careers/engineer",
+        "https://www.anthropic.com/jobs",
+        "https://foo.myworkdayjobs.com/en-US/careers/job/1",
+        # Several hosts in one URL: the earlier table entry wins
+        "https://foo.myworkdayjobs.com/en-US/openai.com",
+        "https://x.com/?u=jobs.lever.co/zzz&boards.greenhouse.io/yyy",
+        "https://openai.com/redirect?to=nvidia.com",
+        "https://anthropic.com/?ref=acme.greenhouse.io",
+        "https://example.com/careers/1",
+    ])
+    def test_matches_table_order(self, url):
+        """Test that the first pattern in table order decides the company"""
+        scraper = GoogleDorkScraper()
+
+        assert scraper._extract_company(url, "") == reference_extract_company(url)
+
+    def test_falls_back_to_title(self):
+        """Test the "at Company" title fallback for unknown hosts"""
+        scraper = GoogleDorkScraper()
+
+        assert scraper._extract_company("https://example.com/1", "Engineer at Acme - Remote") == "Acme"
+
+
+class TestGitHubListingMemos:
+    """Test that memoized listing values stay off the raw listing"""
+
+    LISTING = {
+        "title": "Backend Engineer",
+        "company_name": "Acme",
+        "url": "https://example.com/jobs/1",
+        "locations": ["Remote"],
+        "terms": ["Summer 2026"],
+        "date_posted": 1700000000,
+    }
+
+    def test_search_text_is_memoized_beside_the_listing(self):
+        """Test that the search text is cached in the memos, not on the item"""
+        item = dict(self.LISTING)
+        memos = _ListingMemos()
+
+        text = GitHubJobsScraper._listing_search_text(item, GITHUB_JOB_SOURCES[0], memos, 0)
+
+        assert "summer 2026" in text
+        assert memos.search_text[0] == text
+        assert item == self.LISTING
+
+    def test_raw_data_stays_json_serializable(self):
+        """Test that the memoized posted date doesn't end up in raw_data"""
+        item = dict(self.LISTING)
+        memos = _ListingMemos()
+        scraper = GitHubJobsScraper()
+
+        job = scraper._parse_listing(item, GITHUB_JOB_SOURCES[0], memos, 0)
+
+        assert job.posted_date == memos.posted_date[0]
+        assert job.raw_data == self.LISTING
+        json.dumps(job.raw_data)